@@ -0,0 +1,66 @@
+"""
+``BatchLoader`` against one ``Future.run`` per key.
+
+The backend charges a fixed round-trip latency per call plus a small cost per
+key.  Reports the number of backend calls and the wall time for loading every key.
+
+Usage::
+
+  python -m benchmarks.bench_batch_loader [keys] [batch_size] [round_trip_ms]
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pyeffects.BatchLoader import BatchLoader
+from pyeffects.Future import Future
+import sys
+import threading
+import time
+
+
+class Backend:
+    def __init__(self, round_trip):
+        self.round_trip = round_trip
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def fetch_many(self, keys):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.round_trip + 0.00001 * len(keys))
+        return [key * 2 for key in keys]
+
+    def fetch(self, key):
+        return self.fetch_many([key])[0]
+
+
+def main(keys, batch_size, round_trip):
+    print("%-12s %10s %10s" % ("mode", "calls", "seconds"))
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        backend = Backend(round_trip)
+        start = time.perf_counter()
+        futures = [
+            Future.run(lambda key=key: backend.fetch(key), executor=pool)
+            for key in range(keys)
+        ]
+        Future.gather(futures).result()
+        print(
+            "%-12s %10d %10.3f"
+            % ("per key", backend.calls, time.perf_counter() - start)
+        )
+
+        backend = Backend(round_trip)
+        loader = BatchLoader(backend.fetch_many, batch_size, 0.002, executor=pool)
+        start = time.perf_counter()
+        result = Future.gather([loader.load(key) for key in range(keys)]).result()
+        assert result.get() == [key * 2 for key in range(keys)]
+        print(
+            "%-12s %10d %10.3f"
+            % ("batched", backend.calls, time.perf_counter() - start)
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+        float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.005,
+    )
@@ -0,0 +1,109 @@
+"""
+``@do`` blocks against the same steps written as nested ``flat_map`` calls.
+
+Each block binds five values.  The nested version allocates a closure per level,
+and for ``Future`` a ``Future`` per level as well; the ``@do`` version resumes one
+generator.
+
+Usage::
+
+  python -m benchmarks.bench_do [iterations]
+"""
+from pyeffects.Do import do
+from pyeffects.Either import Right
+from pyeffects.Future import Future
+from pyeffects.Option import Some
+import sys
+import timeit
+
+
+def nested_option(n):
+    return Some(n).flat_map(
+        lambda a: Some(a + 1).flat_map(
+            lambda b: Some(b + 1).flat_map(
+                lambda c: Some(c + 1).flat_map(
+                    lambda d: Some(d + 1).map(lambda e: a + b + c + d + e)
+                )
+            )
+        )
+    )
+
+
+@do
+def do_option(n):
+    a = yield Some(n)
+    b = yield Some(a + 1)
+    c = yield Some(b + 1)
+    d = yield Some(c + 1)
+    e = yield Some(d + 1)
+    return a + b + c + d + e
+
+
+def nested_either(n):
+    return Right(n).flat_map(
+        lambda a: Right(a + 1).flat_map(
+            lambda b: Right(b + 1).flat_map(
+                lambda c: Right(c + 1).flat_map(
+                    lambda d: Right(d + 1).map(lambda e: a + b + c + d + e)
+                )
+            )
+        )
+    )
+
+
+@do
+def do_either(n):
+    a = yield Right(n)
+    b = yield Right(a + 1)
+    c = yield Right(b + 1)
+    d = yield Right(c + 1)
+    e = yield Right(d + 1)
+    return a + b + c + d + e
+
+
+def nested_future(n):
+    return Future.of(n).flat_map(
+        lambda a: Future.of(a + 1).flat_map(
+            lambda b: Future.of(b + 1).flat_map(
+                lambda c: Future.of(c + 1).flat_map(
+                    lambda d: Future.of(d + 1).map(lambda e: a + b + c + d + e)
+                )
+            )
+        )
+    )
+
+
+@do
+def do_future(n):
+    a = yield Future.of(n)
+    b = yield Future.of(a + 1)
+    c = yield Future.of(b + 1)
+    d = yield Future.of(c + 1)
+    e = yield Future.of(d + 1)
+    return a + b + c + d + e
+
+
+CASES = [
+    ("Option", nested_option, do_option),
+    ("Either", nested_either, do_either),
+    ("Future", nested_future, do_future),
+]
+
+
+def main(iterations):
+    print("%-8s %12s %12s %8s" % ("monad", "nested us", "do us", "speedup"))
+    for name, nested, block in CASES:
+        if name == "Future":
+            assert nested(1).result(1) == block(1).result(1)
+        else:
+            assert nested(1) == block(1)
+        nested_us = timeit.timeit(lambda: nested(1), number=iterations) / iterations
+        do_us = timeit.timeit(lambda: block(1), number=iterations) / iterations
+        print(
+            "%-8s %12.2f %12.2f %7.2fx"
+            % (name, nested_us * 1e6, do_us * 1e6, nested_us / do_us)
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,91 @@
+"""
+``EitherBatch`` against a list of ``Either`` for validating a batch of records.
+
+The list version builds every ``Left``/``Right``, then scans the list once for
+the errors and once for the valid values; ``EitherBatch`` sorts the results in the
+pass that validates them.  Also compares ``map`` over the valid values, finding the
+first error, and the memory kept per record.
+
+Usage::
+
+  python -m benchmarks.bench_either_batch [records]
+"""
+from pyeffects.Either import Left, Right
+from pyeffects.EitherBatch import EitherBatch
+import sys
+import time
+import tracemalloc
+
+
+def validate(record):
+    return Right(record) if record % 100 else Left("invalid %d" % record)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def allocated(func):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def with_list(records):
+    eithers = [validate(r) for r in records]
+    lefts = [e.value for e in eithers if e.is_left()]
+    rights = [e.value for e in eithers if e.is_right()]
+    return eithers, lefts, rights
+
+
+def with_batch(records):
+    batch = EitherBatch.from_eithers(validate(r) for r in records)
+    lefts, rights = batch.partition()
+    return batch, lefts, rights
+
+
+def first_left(eithers):
+    for either in eithers:
+        if either.is_left():
+            return either
+    return Right([e.value for e in eithers])
+
+
+def main(count):
+    records = list(range(1, count + 1))
+    list_s, (eithers, list_lefts, list_rights) = timed(lambda: with_list(records))
+    batch_s, (batch, batch_lefts, batch_rights) = timed(lambda: with_batch(records))
+    assert (list_lefts, list_rights) == (batch_lefts, batch_rights)
+    print("%-18s %10s %10s %8s" % ("operation", "list s", "batch s", "speedup"))
+    rows = [("validate+partition", list_s, batch_s)]
+    map_list_s, _ = timed(lambda: [e.map(lambda v: v * 2) for e in eithers])
+    map_batch_s, _ = timed(lambda: batch.map(lambda v: v * 2))
+    rows.append(("map", map_list_s, map_batch_s))
+    seq_list_s, expected = timed(lambda: first_left(eithers))
+    seq_batch_s, result = timed(batch.sequence)
+    assert expected == result
+    rows.append(("sequence", seq_list_s, seq_batch_s))
+    for name, list_time, batch_time in rows:
+        print(
+            "%-18s %10.4f %10.6f %7.1fx"
+            % (name, list_time, batch_time, list_time / max(batch_time, 1e-9))
+        )
+    del eithers, batch
+    list_bytes, kept = allocated(lambda: [validate(r) for r in records])
+    del kept
+    batch_bytes, kept = allocated(
+        lambda: EitherBatch.from_eithers(validate(r) for r in records)
+    )
+    print(
+        "bytes per record: list %.1f, batch %.1f"
+        % (list_bytes / count, batch_bytes / count)
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,98 @@
+"""
+64 threads subscribing to one shared ``Future``.
+
+Measures subscribing while the future is pending, draining those subscribers on
+completion, and subscribing once it has completed.  The legacy future mirrors the
+previous implementation: a ``BoundedSemaphore`` around every subscribe and
+``list.pop(0)`` to drain.
+
+Usage::
+
+  python -m benchmarks.bench_future_contention [threads] [subscribes_per_thread]
+"""
+from pyeffects.Future import Dispatch, Future
+from pyeffects.Try import Success
+import sys
+import threading
+import time
+
+
+class LegacyFuture:
+    def __init__(self):
+        self.subscribers = []
+        self.value = None
+        self.semaphore = threading.BoundedSemaphore(1)
+
+    def _callback(self, value):
+        self.value = value
+        self.semaphore.acquire()
+        while len(self.subscribers) > 0:
+            self.subscribers.pop(0)(value)
+        self.semaphore.release()
+
+    def on_complete(self, subscriber):
+        self.semaphore.acquire()
+        if self.value is not None:
+            self.semaphore.release()
+            subscriber(self.value)
+        else:
+            self.subscribers.append(subscriber)
+            self.semaphore.release()
+
+
+def _new_future():
+    return Future(lambda cb: None, Dispatch.INLINE)
+
+
+def _subscribe_from_threads(future, threads, per_thread):
+    barrier = threading.Barrier(threads + 1)
+
+    def subscribe():
+        barrier.wait()
+        for _ in range(per_thread):
+            future.on_complete(_noop)
+
+    workers = [threading.Thread(target=subscribe) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def _noop(value):
+    pass
+
+
+def _measure(make_future, threads, per_thread):
+    future = make_future()
+    pending = _subscribe_from_threads(future, threads, per_thread)
+    start = time.perf_counter()
+    future._callback(Success(1))
+    drain = time.perf_counter() - start
+    completed = _subscribe_from_threads(future, threads, per_thread)
+    return pending, drain, completed
+
+
+def main(threads, per_thread):
+    total = threads * per_thread
+    print("%d threads x %d subscribes" % (threads, per_thread))
+    print(
+        "%-8s %16s %12s %18s"
+        % ("future", "pending subs/s", "drain", "completed subs/s")
+    )
+    for name, make_future in (("legacy", LegacyFuture), ("current", _new_future)):
+        pending, drain, completed = _measure(make_future, threads, per_thread)
+        print(
+            "%-8s %16.0f %10.3fms %18.0f"
+            % (name, total / pending, drain * 1000, total / completed)
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 64,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2000,
+    )
@@ -0,0 +1,60 @@
+"""
+``Future.gather`` against the previous ``reduce``/``flat_map`` based ``traverse``.
+
+Inputs are futures that complete on a deferred scheduler after the combinator has
+subscribed, so both versions wait on pending values.  The nested version is
+quadratic and is skipped above ``--legacy-limit`` elements.
+
+Usage::
+
+  python -m benchmarks.bench_future_gather [--legacy-limit N]
+"""
+from functools import reduce
+from pyeffects.Future import Dispatch, Future
+import sys
+import time
+
+
+def legacy_traverse(arr):
+    return reduce(
+        lambda acc, elem: acc.flat_map(
+            lambda values: elem.map(lambda value: values + [value])
+        ),
+        arr,
+        Future.of([]),
+    )
+
+
+def _measure(combine, n):
+    tasks = []
+    futures = [
+        Future.run(lambda i=i: i, executor=tasks.append, dispatch=Dispatch.INLINE)
+        for i in range(n)
+    ]
+    start = time.perf_counter()
+    result = combine(futures)
+    for task in tasks:
+        task()
+    value = result.result()
+    elapsed = time.perf_counter() - start
+    assert value.get() == list(range(n))
+    return elapsed
+
+
+def main(legacy_limit):
+    Future.set_default_dispatch(Dispatch.INLINE)
+    print("%-8s %14s %14s" % ("n", "gather", "legacy"))
+    for n in (10, 1000, 100000):
+        gathered = _measure(Future.gather, n)
+        if n <= legacy_limit:
+            legacy = "%12.3fms" % (_measure(legacy_traverse, n) * 1000)
+        else:
+            legacy = "skipped"
+        print("%-8d %12.3fms %14s" % (n, gathered * 1000, legacy))
+
+
+if __name__ == "__main__":
+    limit = 1000
+    if "--legacy-limit" in sys.argv:
+        limit = int(sys.argv[sys.argv.index("--legacy-limit") + 1])
+    main(limit)
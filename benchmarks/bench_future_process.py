@@ -0,0 +1,72 @@
+"""
+Core scaling of ``Future.run_in_process`` on pure-Python CPU-bound work.
+
+Runs the same batch of tasks through ``Future.run`` (threads, limited by the
+GIL) and through ``Future.run_in_process`` with 1, 2, 4, ... worker processes
+up to the number of cores.
+
+Usage::
+
+  python -m benchmarks.bench_future_process [tasks] [iterations]
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pyeffects.Future import Future
+import os
+import sys
+import time
+
+
+def count_primes(limit):
+    found = 0
+    for n in range(2, limit):
+        divisor = 2
+        while divisor * divisor <= n:
+            if n % divisor == 0:
+                break
+            divisor += 1
+        else:
+            found += 1
+    return found
+
+
+def _time(make_futures):
+    start = time.perf_counter()
+    results = Future.wait_all(make_futures())
+    elapsed = time.perf_counter() - start
+    assert all(result.is_success() for result in results)
+    return elapsed
+
+
+def main(tasks, limit):
+    cores = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=cores) as pool:
+        threaded = _time(
+            lambda: [
+                Future.run(lambda: count_primes(limit), executor=pool)
+                for _ in range(tasks)
+            ]
+        )
+    print("%-22s %10s %10s" % ("mode", "seconds", "speedup"))
+    print("%-22s %10.3f %10s" % ("threads (%d)" % cores, threaded, "1.00x"))
+    workers = 1
+    while True:
+        Future.set_process_pool_size(workers)
+        Future.run_in_process(count_primes, 10).result()
+        elapsed = _time(
+            lambda: [Future.run_in_process(count_primes, limit) for _ in range(tasks)]
+        )
+        print(
+            "%-22s %10.3f %9.2fx"
+            % ("processes (%d)" % workers, elapsed, threaded / elapsed)
+        )
+        if workers >= cores:
+            break
+        workers = min(workers * 2, cores)
+    Future.set_process_pool_size(None)
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 16,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 30000,
+    )
@@ -0,0 +1,55 @@
+"""
+10k concurrently retrying tasks with ``Future.retry``.
+
+Every task fails on its first attempts and succeeds on the last one.  Reports the
+wall time and the peak number of live threads, which stays at the pool size plus
+the timer thread because no thread sleeps between attempts.
+
+Usage::
+
+  python -m benchmarks.bench_future_retry [tasks] [attempts]
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pyeffects.Future import Future
+from pyeffects.Retry import RetryPolicy
+import sys
+import threading
+import time
+
+
+def main(tasks, attempts):
+    calls = [0] * tasks
+    lock = threading.Lock()
+
+    def flaky(i):
+        with lock:
+            calls[i] += 1
+            count = calls[i]
+        if count < attempts:
+            raise RuntimeError("Failed")
+        return i
+
+    policy = RetryPolicy(attempts, 0.01, 0.1)
+    peak = threading.active_count()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        start = time.perf_counter()
+        futures = [
+            Future.retry(lambda i=i: flaky(i), policy, executor=pool)
+            for i in range(tasks)
+        ]
+        result = Future.gather(futures)
+        while not result.is_done():
+            peak = max(peak, threading.active_count())
+            time.sleep(0.01)
+        elapsed = time.perf_counter() - start
+    assert result.get() == list(range(tasks))
+    print("%d tasks x %d attempts" % (tasks, attempts))
+    print("%-12s %10.3fs" % ("wall time", elapsed))
+    print("%-12s %10d" % ("peak threads", peak))
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 3,
+    )
@@ -0,0 +1,58 @@
+"""
+Throughput and p99 latency of ``Future.run`` on different executors.
+
+Compares the old one-thread-per-task path against the shared default pool
+and a caller-supplied ``ThreadPoolExecutor``.
+
+Usage::
+
+  python -m benchmarks.bench_future_run [tasks]
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pyeffects.Future import Future, thread_per_task
+import sys
+import threading
+import time
+
+
+def _measure(executor, tasks):
+    latencies = [0.0] * tasks
+    remaining = [tasks]
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def task(i, submitted):
+        def work():
+            latencies[i] = time.perf_counter() - submitted
+            with lock:
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    done.set()
+            return i
+
+        return work
+
+    start = time.perf_counter()
+    for i in range(tasks):
+        Future.run(task(i, time.perf_counter()), executor=executor)
+    done.wait()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return tasks / elapsed, latencies[int(tasks * 0.99) - 1]
+
+
+def main(tasks):
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        executors = [
+            ("thread per task", thread_per_task),
+            ("default pool", Future.default_executor()),
+            ("ThreadPoolExecutor(4)", pool),
+        ]
+        print("%-24s %14s %14s" % ("executor", "tasks/sec", "p99 latency"))
+        for name, executor in executors:
+            throughput, p99 = _measure(executor, tasks)
+            print("%-24s %14.0f %12.3fms" % (name, throughput, p99 * 1000))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
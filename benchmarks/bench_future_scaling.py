@@ -0,0 +1,111 @@
+"""
+Thread scaling of ``Future.run`` on CPU-bound pure-Python work.
+
+Runs the same batch of tasks on thread pools of 1 to 32 workers and reports
+throughput and speedup over one worker.  On a GIL build the speedup stays near 1x;
+on a free-threaded build (``python3.13t`` and later) it should follow the number
+of cores.  The interpreter build and whether the GIL is enabled are printed first.
+A second table measures the runtime's own shared state: every worker completes
+futures that all workers subscribe to.
+
+Usage::
+
+  python -m benchmarks.bench_future_scaling [tasks] [limit]
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pyeffects.Future import Dispatch, Future
+import os
+import sys
+import sysconfig
+import threading
+import time
+
+THREADS = (1, 2, 4, 8, 16, 32)
+
+
+def count_primes(limit):
+    found = 0
+    for n in range(2, limit):
+        divisor = 2
+        while divisor * divisor <= n:
+            if n % divisor == 0:
+                break
+            divisor += 1
+        else:
+            found += 1
+    return found
+
+
+def _gil_enabled():
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def _cpu_bound(workers, tasks, limit):
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        start = time.perf_counter()
+        futures = [
+            Future.run(lambda: count_primes(limit), executor=pool) for _ in range(tasks)
+        ]
+        results = Future.wait_all(futures)
+        elapsed = time.perf_counter() - start
+    assert all(result.is_success() for result in results)
+    return tasks / elapsed
+
+
+def _shared_state(workers, rounds):
+    futures = [Future(None, Dispatch.INLINE) for _ in range(rounds)]
+    barrier = threading.Barrier(workers + 1)
+    received = [0] * workers
+
+    def work(index):
+        def on_done(value):
+            received[index] += 1
+
+        barrier.wait()
+        for i, future in enumerate(futures):
+            future.on_complete(on_done)
+            if i % workers == index:
+                future._try_complete(future.value or Future.of(i).value)
+
+    threads = [threading.Thread(target=work, args=[i]) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    assert sum(received) == workers * rounds
+    return workers * rounds / elapsed
+
+
+def main(tasks, limit):
+    print(
+        "python %s, free-threaded build: %s, GIL enabled: %s, cores: %s"
+        % (
+            sys.version.split()[0],
+            bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+            _gil_enabled(),
+            os.cpu_count(),
+        )
+    )
+    print("%-8s %14s %10s" % ("threads", "tasks/s", "speedup"))
+    base = None
+    for workers in THREADS:
+        rate = _cpu_bound(workers, tasks, limit)
+        base = base or rate
+        print("%-8d %14.1f %9.2fx" % (workers, rate, rate / base))
+    print("%-8s %14s %10s" % ("threads", "subscribes/s", "speedup"))
+    base = None
+    for workers in THREADS:
+        rate = _shared_state(workers, 20000)
+        base = base or rate
+        print("%-8d %14.0f %9.2fx" % (workers, rate, rate / base))
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 64,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20000,
+    )
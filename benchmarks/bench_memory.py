@@ -0,0 +1,44 @@
+"""
+Bytes per instance of ``Some``, ``Right`` and ``Success``, measured with tracemalloc.
+
+Each class is compared with a stand-in that keeps the previous layout: a plain
+class storing ``value`` and ``biased`` in the instance ``__dict__``.  The values
+are preallocated so only the containers are counted.
+
+Usage::
+
+  python -m benchmarks.bench_memory [count]
+"""
+from pyeffects.Either import Right
+from pyeffects.Option import Some
+from pyeffects.Try import Success
+import sys
+import tracemalloc
+
+
+class DictLayout:
+    def __init__(self, value):
+        self.value = value
+        self.biased = True
+
+
+def bytes_per_instance(cls, values):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(value) for value in values]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before - sys.getsizeof(instances)) / len(instances)
+
+
+def main(count):
+    values = list(range(count))
+    before = bytes_per_instance(DictLayout, values)
+    print("%-10s %14s %14s" % ("class", "bytes before", "bytes after"))
+    for cls in (Some, Right, Success):
+        after = bytes_per_instance(cls, values)
+        print("%-10s %14.1f %14.1f" % (cls.__name__, before, after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,54 @@
+"""
+Cost of the Future instrumentation, disabled and enabled.
+
+Runs ``Future.run(...).map(...)`` chains on a scheduler that calls tasks in place, so
+the numbers are the runtime overhead alone, and prints the collected histograms.
+
+Usage::
+
+  python -m benchmarks.bench_metrics [iterations]
+"""
+from pyeffects.Future import Dispatch, Future
+from pyeffects.Metrics import InMemorySink, QUEUE_TIME, RUN_TIME, SUBSCRIBERS, set_sink
+import sys
+import time
+
+
+def _call(task):
+    task()
+
+
+def _time(iterations):
+    start = time.perf_counter()
+    for i in range(iterations):
+        Future.run(lambda: i, executor=_call, dispatch=Dispatch.INLINE).map(
+            lambda v: v + 1
+        )
+    return (time.perf_counter() - start) / iterations
+
+
+def main(iterations):
+    _time(iterations)
+    disabled = _time(iterations)
+    sink = InMemorySink()
+    set_sink(sink)
+    enabled = _time(iterations)
+    set_sink(None)
+    print("%-10s %12s" % ("metrics", "per chain"))
+    print("%-10s %10.3fus" % ("disabled", disabled * 1e6))
+    print("%-10s %10.3fus" % ("enabled", enabled * 1e6))
+    for name in (QUEUE_TIME, RUN_TIME, SUBSCRIBERS):
+        histogram = sink.histogram(name)
+        print(
+            "%-20s count=%d p50=%s p99=%s"
+            % (
+                name,
+                histogram.count,
+                histogram.percentile(0.5),
+                histogram.percentile(0.99),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
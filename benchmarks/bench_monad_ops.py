@@ -0,0 +1,88 @@
+"""
+``map``, ``flat_map`` and ``filter`` of ``Option``, ``Either`` and ``Try`` against the
+generic paths.
+
+``Monad.map`` is the generic ``map`` that allocates a closure and goes through
+``flat_map`` and ``of``; ``filter`` is compared with the same predicate written as
+a ``flat_map``.  Each operation also runs in trusted mode, which skips the check
+that the function is callable.
+
+Usage::
+
+  python -m benchmarks.bench_monad_ops [iterations]
+"""
+from pyeffects.Either import Left, Right
+from pyeffects.Monad import Monad, set_trusted
+from pyeffects.Option import Some, empty
+from pyeffects.Try import Failure, Success
+import sys
+import timeit
+
+
+def increment(v):
+    return v + 1
+
+
+def positive(v):
+    return v > 0
+
+
+def cases():
+    some, right, success = Some(1), Right(1), Success(1)
+    return [
+        (
+            "Option.map",
+            lambda: Monad.map(some, increment),
+            lambda: some.map(increment),
+        ),
+        (
+            "Either.map",
+            lambda: Monad.map(right, increment),
+            lambda: right.map(increment),
+        ),
+        (
+            "Try.map",
+            lambda: Monad.map(success, increment),
+            lambda: success.map(increment),
+        ),
+        (
+            "Option.filter",
+            lambda: some.flat_map(lambda v: some if positive(v) else empty),
+            lambda: some.filter(positive),
+        ),
+        (
+            "Either.filter",
+            lambda: right.flat_map(lambda v: right if positive(v) else Left("no")),
+            lambda: right.filter(positive, "no"),
+        ),
+        (
+            "Try.filter",
+            lambda: success.flat_map(
+                lambda v: success if positive(v) else Failure(ValueError())
+            ),
+            lambda: success.filter(positive),
+        ),
+    ]
+
+
+def main(iterations):
+    print(
+        "%-14s %12s %12s %12s %8s"
+        % ("operation", "generic ns", "fast ns", "trusted ns", "speedup")
+    )
+    for name, generic, fast in cases():
+        generic_ns = timeit.timeit(generic, number=iterations) / iterations * 1e9
+        fast_ns = timeit.timeit(fast, number=iterations) / iterations * 1e9
+        set_trusted(True)
+        try:
+            trusted_ns = timeit.timeit(fast, number=iterations) / iterations * 1e9
+        finally:
+            set_trusted(False)
+        print(
+            "%-14s %12.1f %12.1f %12.1f %7.2fx"
+            % (name, generic_ns, fast_ns, trusted_ns, generic_ns / trusted_ns)
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
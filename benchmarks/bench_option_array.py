@@ -0,0 +1,74 @@
+"""
+``OptionArray`` against a list of ``Option`` for a column of nullable floats.
+
+Compares the time of ``map``, ``filter`` and ``get_or_else`` over the column and
+the memory each representation takes, measured with tracemalloc.  Needs NumPy.
+
+Usage::
+
+  python -m benchmarks.bench_option_array [size]
+"""
+from pyeffects.Option import Option
+import sys
+import time
+import tracemalloc
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def allocated(func):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def main(size):
+    import numpy
+    from pyeffects.OptionArray import OptionArray
+
+    values = [float(i) if i % 10 else None for i in range(size)]
+    list_bytes, options = allocated(lambda: [Option.of(v) for v in values])
+    array_bytes, array = allocated(lambda: OptionArray.from_values(values))
+    print(
+        "bytes per element: list %.1f, OptionArray %.1f"
+        % (list_bytes / size, array_bytes / size)
+    )
+
+    print("%-12s %10s %12s %8s" % ("operation", "list s", "array s", "speedup"))
+    cases = [
+        (
+            "map",
+            lambda: [o.map(lambda v: v * 2.0 + 1.0) for o in options],
+            lambda: array.map(lambda v: v * 2.0 + 1.0),
+        ),
+        (
+            "filter",
+            lambda: [o.filter(lambda v: v > 100.0) for o in options],
+            lambda: array.filter(lambda v: v > 100.0),
+        ),
+        (
+            "get_or_else",
+            lambda: [o.get_or_else(0.0) for o in options],
+            lambda: array.get_or_else(0.0),
+        ),
+        (
+            "sqrt",
+            lambda: [o.map(lambda v: v**0.5) for o in options],
+            lambda: array.map(numpy.sqrt),
+        ),
+    ]
+    for name, with_list, with_array in cases:
+        list_s, _ = timed(with_list)
+        array_s, _ = timed(with_array)
+        print("%-12s %10.3f %12.4f %7.1fx" % (name, list_s, array_s, list_s / array_s))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,102 @@
+"""
+A compiled ``Pipeline`` against the same chain of ``map``, ``filter`` and
+``flat_map`` calls on ``Option``, ``Either`` and ``Try``.
+
+Every record goes through four steps; the chain allocates a container per step
+while the pipeline only wraps the final value.
+
+Usage::
+
+  python -m benchmarks.bench_pipeline [records]
+"""
+from pyeffects.Either import Either, Left, Right
+from pyeffects.Option import Option, Some, empty
+from pyeffects.Pipeline import Pipeline
+from pyeffects.Try import Success, Try
+import sys
+import time
+
+
+def strip(v):
+    return v.strip()
+
+
+def non_empty(v):
+    return len(v) > 0
+
+
+def parse(v):
+    return int(v)
+
+
+def halve(v):
+    return v // 2
+
+
+def chained(records):
+    return {
+        "Option": lambda: [
+            Option.of(r)
+            .map(strip)
+            .filter(non_empty)
+            .flat_map(lambda v: Some(int(v)) if v.isdigit() else empty)
+            .map(halve)
+            for r in records
+        ],
+        "Either": lambda: [
+            Either.of(r)
+            .map(strip)
+            .filter(non_empty, "blank")
+            .flat_map(lambda v: Right(int(v)) if v.isdigit() else Left("nan"))
+            .map(halve)
+            for r in records
+        ],
+        "Try": lambda: [
+            Try.of(r)
+            .map(strip)
+            .filter(non_empty)
+            .flat_map(lambda v: Try.of(lambda: parse(v)))
+            .map(halve)
+            for r in records
+        ],
+    }
+
+
+def fused():
+    return {
+        "Option": Pipeline.of_option()
+        .map(strip)
+        .filter(non_empty)
+        .flat_map(lambda v: Some(int(v)) if v.isdigit() else empty)
+        .map(halve),
+        "Either": Pipeline.of_either()
+        .map(strip)
+        .filter(non_empty, "blank")
+        .flat_map(lambda v: Right(int(v)) if v.isdigit() else Left("nan"))
+        .map(halve),
+        "Try": Pipeline.of_try().map(strip).filter(non_empty).map(parse).map(halve),
+    }
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(count):
+    records = [" %d " % i if i % 10 else " x " for i in range(count)]
+    pipelines = fused()
+    print("%-8s %12s %12s %8s" % ("kind", "chained s", "pipeline s", "speedup"))
+    for kind, chain in chained(records).items():
+        chained_s, expected = timed(chain)
+        fused_s, result = timed(lambda: pipelines[kind].apply_all(records))
+        assert [str(r) for r in result] == [str(r) for r in expected]
+        print(
+            "%-8s %12.3f %12.3f %7.2fx"
+            % (kind, chained_s, fused_s, chained_s / fused_s)
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,42 @@
+"""
+Per-element cost of a ``Stream`` pipeline against one ``Future`` per element.
+
+Both versions square, filter and collect the same integers.  The future version
+wraps every element in ``Future.of(...).map(...)``, which is what event handling
+looked like before ``Stream``.
+
+Usage::
+
+  python -m benchmarks.bench_stream [elements]
+"""
+from pyeffects.Future import Dispatch, Future
+from pyeffects.Stream import Stream
+import sys
+import time
+
+
+def with_futures(n):
+    values = []
+    for i in range(n):
+        future = Future.of(i).with_dispatch(Dispatch.INLINE).map(lambda v: v * v)
+        future.on_success(lambda v: v.value % 2 == 0 and values.append(v.value))
+    return values
+
+
+def with_stream(n):
+    stream = Stream.from_iterable(range(n)).map(lambda v: v * v)
+    return stream.filter(lambda v: v % 2 == 0).to_list().get()
+
+
+def main(n):
+    print("%-10s %14s" % ("version", "per element"))
+    for name, func in (("futures", with_futures), ("stream", with_stream)):
+        start = time.perf_counter()
+        values = func(n)
+        elapsed = time.perf_counter() - start
+        assert len(values) == (n + 1) // 2
+        print("%-10s %12.3fus" % (name, elapsed / n * 1e6))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,80 @@
+"""
+``tail_rec_m`` against loops written as recursive ``flat_map``.
+
+The recursive loops stay below the interpreter recursion limit; ``tail_rec_m`` runs
+the same loop and a million-step one in constant stack depth.
+
+Usage::
+
+  python -m benchmarks.bench_tail_rec [steps]
+"""
+from pyeffects.Either import Left, Right
+from pyeffects.Future import Future
+from pyeffects.Option import Option, Some
+import sys
+import time
+
+RECURSIVE_STEPS = 200
+
+
+def option_recursive(n):
+    if n == 0:
+        return Some("done")
+    return Some(n - 1).flat_map(option_recursive)
+
+
+def option_step(n):
+    return Some(Left(n - 1) if n > 0 else Right("done"))
+
+
+def future_recursive(n):
+    if n == 0:
+        return Future.of("done")
+    return Future.of(n - 1).flat_map(future_recursive)
+
+
+def future_step(n):
+    return Future.of(Left(n - 1) if n > 0 else Right("done"))
+
+
+def _time(func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(steps):
+    repeat = max(1, steps // RECURSIVE_STEPS)
+    print("%-8s %12s %14s %14s" % ("monad", "steps", "recursive", "tail_rec_m"))
+    for name, recursive, tail_rec in (
+        (
+            "Option",
+            lambda: option_recursive(RECURSIVE_STEPS),
+            lambda n: Option.tail_rec_m(n, option_step),
+        ),
+        (
+            "Future",
+            lambda: future_recursive(RECURSIVE_STEPS),
+            lambda n: Future.tail_rec_m(n, future_step),
+        ),
+    ):
+        per_step = _time(recursive, repeat) / RECURSIVE_STEPS
+        looped = _time(lambda: tail_rec(RECURSIVE_STEPS), repeat) / RECURSIVE_STEPS
+        print(
+            "%-8s %12d %12.3fus %12.3fus"
+            % (name, RECURSIVE_STEPS, per_step * 1e6, looped * 1e6)
+        )
+        print(
+            "%-8s %12d %14s %12.3fus"
+            % (
+                name,
+                steps,
+                "RecursionError",
+                _time(lambda: tail_rec(steps)) / steps * 1e6,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,64 @@
+"""
+100k pending timers on the hashed timer wheel.
+
+Schedules ``Future.delay`` timers and reports the cost of inserting and cancelling
+them, the number of live threads and the memory held by each pending future and
+its timer.  Then lets a tenth of them fire and reports how late they ran.
+
+Usage::
+
+  python -m benchmarks.bench_timer [timers]
+"""
+from pyeffects.Future import Dispatch, Future
+from pyeffects.Timer import Timer
+import sys
+import threading
+import time
+import tracemalloc
+
+
+def main(timers):
+    threads = threading.active_count()
+    start = time.perf_counter()
+    futures = [Future.delay(60 + i % 600, i) for i in range(timers)]
+    inserted = time.perf_counter() - start
+    print("%d pending timers" % Timer.default().pending())
+    print("%-22s %10.3fus" % ("insert per timer", inserted / timers * 1e6))
+    print("%-22s %10d" % ("extra threads", threading.active_count() - threads))
+    start = time.perf_counter()
+    for future in futures:
+        future.cancel()
+    cancelled = time.perf_counter() - start
+    print("%-22s %10.3fus" % ("cancel per timer", cancelled / timers * 1e6))
+    print("%-22s %10d" % ("pending after cancel", Timer.default().pending()))
+
+    tracemalloc.start()
+    futures = [Future.delay(60 + i % 600, i) for i in range(timers)]
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print("%-22s %10.1fMB" % ("memory held", held / 1e6))
+    print("%-22s %10.0fB" % ("memory per timer", held / timers))
+    for future in futures:
+        future.cancel()
+
+    fired = []
+    futures = [
+        Future.delay(0.1, time.monotonic() + 0.1, Dispatch.INLINE).map(
+            lambda deadline: fired.append(time.monotonic() - deadline)
+        )
+        for _ in range(timers // 10)
+    ]
+    Future.wait_all(futures)
+    fired.sort()
+    print(
+        "%-22s %10.3fms %10.3fms"
+        % (
+            "lateness p50/p99",
+            fired[len(fired) // 2] * 1e3,
+            fired[-len(fired) // 100] * 1e3,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,6 @@
+import importlib.util
+
+collect_ignore = []
+
+if importlib.util.find_spec("numpy") is None:
+    collect_ignore.append("pyeffects/OptionArray.py")
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+"""
+pyeffects.BatchLoader
+~~~~~~~~~~~~----
+
+This module implements the BatchLoader class.
+"""
+from functools import partial
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from .Future import Dispatch, ExecutorLike, Future, _is_executor, _submit
+from .Promise import Promise
+from .Timer import Timer, TimerHandle
+from .Try import Failure, Success, Try
+import threading
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """Coalesces loads of single keys into calls of a batch function.
+
+    Keys passed to :meth:`load` within ``max_delay`` seconds of each other are
+    collected and fetched with one ``batch_fn(keys)`` call on ``executor``, or as soon
+    as ``max_batch_size`` keys are waiting.  ``batch_fn`` returns one value per key,
+    in the order of the keys; an ``Exception`` in place of a value fails only the
+    future of that key.  Keys are deduplicated through a per-loader cache, so loading
+    a key again returns the same :class:`Future` until it is cleared.  Failed keys
+    are evicted from the cache, so loading them again retries them.
+
+    :param batch_fn: function taking a list of keys and returning a list of values.
+    :param max_batch_size: the most keys passed to one ``batch_fn`` call.
+    :param max_delay: seconds to wait for more keys after the first one of a batch.
+    :param executor: optional ``concurrent.futures.Executor`` or scheduler callable
+      to run ``batch_fn`` on, defaults to :meth:`Future.default_executor`
+    :param cache: whether to keep loaded futures to deduplicate keys.
+    :param dispatch: optional :class:`Dispatch` for subscribers of the loaded futures
+
+    Usage::
+
+      >>> from pyeffects.BatchLoader import *
+      >>> calls = []
+      >>> def fetch_squares(keys):
+      ...   calls.append(keys)
+      ...   return [key * key for key in keys]
+      ...
+      >>> loader = BatchLoader(fetch_squares, max_batch_size=10)
+      >>> Future.gather([loader.load(1), loader.load(2), loader.load(1)]).result()
+      Success([1, 4, 1])
+      >>> calls
+      [[1, 2]]
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], List[V]],
+        max_batch_size: int = 100,
+        max_delay: float = 0.005,
+        executor: Optional[ExecutorLike] = None,
+        cache: bool = True,
+        dispatch: Optional[Dispatch] = None,
+    ) -> None:
+        if not hasattr(batch_fn, "__call__"):
+            raise TypeError("BatchLoader expects a callable")
+        if not isinstance(max_batch_size, int) or max_batch_size < 1:
+            raise TypeError("BatchLoader expects max_batch_size to be a positive int")
+        if max_delay < 0:
+            raise TypeError("BatchLoader expects max_delay to be at least 0")
+        if executor is not None and not _is_executor(executor):
+            raise TypeError("BatchLoader expects an Executor or a callable scheduler")
+        if dispatch is not None and not isinstance(dispatch, Dispatch):
+            raise TypeError("BatchLoader expects a Dispatch")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.executor = executor
+        self.cache = cache
+        self.dispatch = dispatch
+        self._lock = threading.Lock()
+        self._cache = {}  # type: Dict[K, Future[V]]
+        self._queue = []  # type: List[Tuple[K, Promise[V]]]
+        self._timer = None  # type: Optional[TimerHandle]
+
+    def load(self, key: K) -> Future[V]:
+        """Returns a :class:`Future <Future>` of the value for ``key``.
+
+        :param key: the hashable key to load.
+        :rtype: pyEffects.Future
+        """
+        batch = None
+        with self._lock:
+            if self.cache:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    return cached
+            promise = Promise(self.dispatch)  # type: Promise[V]
+            if self.cache:
+                self._cache[key] = promise.future
+            self._queue.append((key, promise))
+            if len(self._queue) >= self.max_batch_size:
+                batch = self._take()
+            elif self._timer is None:
+                self._timer = Timer.default().schedule(
+                    self.max_delay, self.dispatch_now
+                )
+        if batch is not None:
+            self._dispatch(batch)
+        return promise.future
+
+    def load_many(self, keys: Iterable[K]) -> Future[List[V]]:
+        """Returns a :class:`Future <Future>` of the values for ``keys``, in order.
+
+        :param keys: the hashable keys to load.
+        :rtype: pyEffects.Future
+        """
+        return Future.gather([self.load(key) for key in keys])
+
+    def dispatch_now(self) -> None:
+        """Sends the keys waiting for the current batch without waiting for ``max_delay``."""
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._dispatch(batch)
+
+    def clear(self, key: K) -> None:
+        """Removes ``key`` from the cache, so that loading it again fetches it again.
+
+        :param key: the key to forget.
+        """
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear_all(self) -> None:
+        """Empties the cache."""
+        with self._lock:
+            self._cache.clear()
+
+    def _take(self) -> List[Tuple[K, Promise[V]]]:
+        batch, self._queue = self._queue, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _dispatch(self, batch: List[Tuple[K, Promise[V]]]) -> None:
+        executor = self.executor or Future.default_executor()
+        _submit(executor, partial(self._run_batch, batch))
+
+    def _run_batch(self, batch: List[Tuple[K, Promise[V]]]) -> None:
+        keys = [key for key, _ in batch]
+        try:
+            values = self.batch_fn(keys)
+            if not isinstance(values, list) or len(values) != len(keys):
+                raise ValueError("BatchLoader batch_fn must return one value per key")
+            results = [
+                Failure(value) if isinstance(value, Exception) else Success(value)
+                for value in values
+            ]  # type: List[Try[V]]
+        except Exception as err:
+            results = [Failure(err)] * len(keys)
+        if self.cache and any(result.is_failure() for result in results):
+            with self._lock:
+                for (key, promise), result in zip(batch, results):
+                    if result.is_failure() and self._cache.get(key) is promise.future:
+                        del self._cache[key]
+        for (_, promise), result in zip(batch, results):
+            promise.try_complete(result)
+
+    def __str__(self) -> str:
+        return "BatchLoader(" + str(self.max_batch_size) + ")"
+
+    def __repr__(self) -> str:
+        return self.__str__()
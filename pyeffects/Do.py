@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+"""
+pyeffects.Do
+~~~~~~~~~~~~----
+
+This module implements the do decorator for writing flat_map chains as generators.
+"""
+from functools import wraps
+from typing import Any, Callable, Generator, TypeVar
+from .Future import Dispatch, Future
+from .Monad import Monad
+from .Try import Failure, Success, Try, success_none
+import inspect
+
+A = TypeVar("A")
+
+DoBlock = Callable[..., Generator[Monad, Any, A]]
+
+
+def do(func: DoBlock) -> Callable[..., Monad]:
+    """Turns a generator function into a function returning a monad.
+
+    Every value the generator yields is an :class:`Option`, :class:`Either`,
+    :class:`Try` or :class:`Future`, and the ``yield`` expression evaluates to the
+    value inside it, as if the rest of the function were passed to ``flat_map``.  The
+    first ``Empty``, ``Left`` or ``Failure`` is returned as it is and the generator
+    is closed, without raising into it; otherwise the value the generator returns is
+    wrapped like the first value it yielded.  The generator has to yield at least
+    once.
+
+    When the first value is a :class:`Future`, the function returns a
+    :class:`Future` right away and the generator is resumed by the thread that
+    completes each yielded future.  Exceptions raised by the generator fail that
+    future; for the other monads they propagate, like they do from ``flat_map``.
+
+    :param func: generator function yielding monads.
+    :rtype: function
+
+    Usage::
+
+      >>> from pyeffects.Do import do
+      >>> from pyeffects.Option import *
+      >>> @do
+      ... def add(a, b):
+      ...   x = yield Option.of(a)
+      ...   y = yield Option.of(b)
+      ...   return x + y
+      ...
+      >>> add(1, 2), add(1, None)
+      (Some(3), Empty())
+    """
+    if not inspect.isgeneratorfunction(func):
+        raise TypeError("do expects a generator function")
+
+    @wraps(func)
+    def run(*args: Any, **kwargs: Any) -> Monad:
+        gen = func(*args, **kwargs)
+        try:
+            first = next(gen)
+        except StopIteration:
+            raise TypeError("do expects the generator to yield at least once")
+        if isinstance(first, Future):
+            return _run_future(gen, first)
+        of = _success if isinstance(first, Try) else first.of
+        value = first
+        while True:
+            if not value.biased:
+                gen.close()
+                return value
+            try:
+                value = gen.send(value.value)
+            except StopIteration as stop:
+                return of(stop.value)
+
+    return run
+
+
+def _success(value: A) -> Try[A]:
+    return success_none if value is None else Success(value)
+
+
+def _run_future(gen: Generator, first: Future) -> Future:
+    result = Future(None, first.dispatch, first.token)  # type: Future
+
+    def resume(value: Try) -> None:
+        while True:
+            if value.is_failure() or result.value is not None:
+                gen.close()
+                result._try_complete(value)
+                return
+            try:
+                future = gen.send(value.value)
+            except StopIteration as stop:
+                result._try_complete(Success(stop.value))
+                return
+            except Exception as err:
+                result._try_complete(Failure(err))
+                return
+            if not isinstance(future, Future):
+                gen.close()
+                result._try_complete(
+                    Failure(TypeError("do expects a Future block to yield Futures"))
+                )
+                return
+            value = future.value
+            if value is None:
+                future._on_complete(resume, Dispatch.INLINE)  # type: ignore
+                return
+
+    value = first.value
+    if value is None:
+        first._on_complete(resume, Dispatch.INLINE)  # type: ignore
+    else:
+        resume(value)
+    return result
@@ -14,6 +14,8 @@ B = TypeVar("B")
 
 
 class Either(Monad[A]):
+    __slots__ = ()
+
     @staticmethod
     def of(value: B) -> "Either[B]":
         """Constructs a :class:`Either <Either>`.
@@ -31,7 +33,7 @@ class Either(Monad[A]):
           >>> Left(2.5)
           Left(2.5)
         """
-        return Right(value)
+        return right_none if value is None else Right(value)
 
     def flat_map(self, func: Callable[[A], "Monad[B]"]) -> "Monad[B]":
         """Flatmaps a function for :class:`Either <Either>`.
@@ -45,12 +47,56 @@ class Either(Monad[A]):
           >>> Either.of(5).flat_map(lambda v: Right(v * v))
           Right(25)
         """
-        if not hasattr(func, "__call__"):
+        if not (self._trusted or hasattr(func, "__call__")):
             raise TypeError("Either.flat_map expects a callable")
-        if self.is_right():
+        if self.biased:
             return func(self.value)
         return self  # type: ignore
 
+    def map(self, func: Callable[[A], B]) -> "Either[B]":
+        """Maps a function over the right value of :class:`Either <Either>`.
+
+        :param func: function to apply to the right value.
+        :rtype: pyEffects.Either
+
+        Usage::
+
+          >>> from pyeffects.Either import *
+          >>> Right(5).map(lambda v: v * v)
+          Right(25)
+          >>> Left(5).map(lambda v: v * v)
+          Left(5)
+        """
+        if not (self._trusted or hasattr(func, "__call__")):
+            raise TypeError("map expects a callable")
+        if self.biased:
+            value = func(self.value)
+            return right_none if value is None else Right(value)
+        return self  # type: ignore
+
+    def filter(self, func: Callable[[A], bool], otherwise: B) -> "Either":
+        """Keeps a right :class:`Either <Either>` only if ``func`` holds for its value.
+
+        A right value failing the predicate becomes ``Left(otherwise)``.
+
+        :param func: predicate to test the right value with.
+        :param otherwise: left value to use when the predicate does not hold.
+        :rtype: pyEffects.Either
+
+        Usage::
+
+          >>> from pyeffects.Either import *
+          >>> Right(5).filter(lambda v: v > 3, "too small")
+          Right(5)
+          >>> Right(2).filter(lambda v: v > 3, "too small")
+          Left(too small)
+        """
+        if not (self._trusted or hasattr(func, "__call__")):
+            raise TypeError("Either.filter expects a callable")
+        if not self.biased or func(self.value):
+            return self
+        return Left(otherwise)
+
     def is_right(self) -> bool:
         """Returns if the :class:`Either <Either>` is a right projection.
 
@@ -87,9 +133,11 @@ class Either(Monad[A]):
 
 
 class Left(Either[A]):
+    __slots__ = ("value",)
+    biased = False
+
     def __init__(self, value: A) -> None:
         self.value = value
-        self.biased = False
 
     def left(self):
         return self.value
@@ -102,9 +150,11 @@ class Left(Either[A]):
 
 
 class Right(Either[A]):
+    __slots__ = ("value",)
+    biased = True
+
     def __init__(self, value: A) -> None:
         self.value = value
-        self.biased = True
 
     def right(self):
         return self.value
@@ -114,3 +164,6 @@ class Right(Either[A]):
 
     def __repr__(self) -> str:
         return self.__str__()
+
+
+right_none = Right(None)  # type: Right
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+"""
+pyeffects.EitherBatch
+~~~~~~~~~~~~----
+
+This module implements the EitherBatch class.
+"""
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+from .Either import Either, Left, Right
+from array import array
+
+RIGHT = 1
+LEFT = 0
+
+
+class EitherBatch:
+    """A batch of :class:`Either` values stored column-wise.
+
+    Instead of a ``Left`` or ``Right`` object per record, a batch keeps one byte per
+    record telling which side it is on, and the values in two lists: the left values
+    and the right values, each in record order.  Building a batch sorts the records
+    into the two lists in one pass, so :meth:`partition`, :meth:`lefts` and
+    :meth:`rights` return them without copying or scanning again.  The returned
+    lists are shared with the batch and must not be modified.
+
+    :meth:`map` and :meth:`flat_map` only call their function on right values, like
+    ``Either.map`` and ``Either.flat_map``, and return a new batch.
+
+    Usage::
+
+      >>> from pyeffects.EitherBatch import *
+      >>> def parse(text):
+      ...   return Right(int(text)) if text.isdigit() else Left(text)
+      ...
+      >>> batch = EitherBatch.from_eithers(parse(t) for t in ["1", "x", "3"])
+      >>> batch.partition()
+      (['x'], [1, 3])
+      >>> batch.map(lambda v: v * 10).to_eithers()
+      [Right(10), Left(x), Right(30)]
+      >>> batch.sequence()
+      Left(x)
+    """
+
+    def __init__(self, tags: bytearray, lefts: List[Any], rights: List[Any]) -> None:
+        if len(tags) != len(lefts) + len(rights):
+            raise TypeError("EitherBatch expects one value per tag")
+        self._tags = tags
+        self._lefts = lefts
+        self._rights = rights
+        self._offsets = None  # type: Optional[array]
+
+    @staticmethod
+    def from_eithers(eithers: Iterable[Either]) -> "EitherBatch":
+        """Constructs a :class:`EitherBatch <EitherBatch>` from :class:`Either` values.
+
+        ``eithers`` is consumed in one pass, so it can be a generator that validates
+        records as they are read.
+
+        :param eithers: the :class:`Either` values.
+        :rtype: pyEffects.EitherBatch
+        """
+        tags = bytearray()
+        lefts = []  # type: List[Any]
+        rights = []  # type: List[Any]
+        tag = tags.append
+        left = lefts.append
+        right = rights.append
+        for either in eithers:
+            if either.biased:
+                tag(RIGHT)
+                right(either.value)
+            else:
+                tag(LEFT)
+                left(either.value)
+        return EitherBatch(tags, lefts, rights)
+
+    @staticmethod
+    def of_rights(values: Iterable[Any]) -> "EitherBatch":
+        """Constructs a :class:`EitherBatch <EitherBatch>` of right values.
+
+        :param values: the right values.
+        :rtype: pyEffects.EitherBatch
+        """
+        rights = list(values)
+        return EitherBatch(bytearray([RIGHT]) * len(rights), [], rights)
+
+    def map(self, func: Callable[[Any], Any]) -> "EitherBatch":
+        """Applies ``func`` to every right value.
+
+        :param func: function to apply to the right values.
+        :rtype: pyEffects.EitherBatch
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("EitherBatch.map expects a callable")
+        return EitherBatch(self._tags, self._lefts, [func(v) for v in self._rights])
+
+    def flat_map(self, func: Callable[[Any], Either]) -> "EitherBatch":
+        """Applies ``func``, which returns an :class:`Either`, to every right value.
+
+        Right values for which ``func`` returns a ``Left`` move to the left side.
+
+        :param func: function returning an :class:`Either` for a right value.
+        :rtype: pyEffects.EitherBatch
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("EitherBatch.flat_map expects a callable")
+        tags = bytearray(self._tags)
+        lefts = []  # type: List[Any]
+        rights = []  # type: List[Any]
+        left_values = iter(self._lefts)
+        right_values = iter(self._rights)
+        for index, tag in enumerate(self._tags):
+            if tag == LEFT:
+                lefts.append(next(left_values))
+                continue
+            either = func(next(right_values))
+            if either.biased:
+                rights.append(either.value)
+            else:
+                tags[index] = LEFT
+                lefts.append(either.value)
+        return EitherBatch(tags, lefts, rights)
+
+    def lefts(self) -> List[Any]:
+        """Returns the left values in record order, without copying them.
+
+        :rtype: list
+        """
+        return self._lefts
+
+    def rights(self) -> List[Any]:
+        """Returns the right values in record order, without copying them.
+
+        :rtype: list
+        """
+        return self._rights
+
+    def partition(self) -> Tuple[List[Any], List[Any]]:
+        """Returns the left values and the right values, without copying them.
+
+        :rtype: tuple of two lists
+        """
+        return self._lefts, self._rights
+
+    def sequence(self) -> Either:
+        """Returns the first ``Left`` of the batch, or ``Right`` of the list of all values.
+
+        :rtype: pyEffects.Either
+        """
+        if self._lefts:
+            return Left(self._lefts[0])
+        return Right(list(self._rights))
+
+    def to_eithers(self) -> List[Either]:
+        """Returns the batch as a list of :class:`Either`, in record order.
+
+        :rtype: list
+        """
+        return list(self)
+
+    def __iter__(self) -> Iterator[Either]:
+        left_values = iter(self._lefts)
+        right_values = iter(self._rights)
+        for tag in self._tags:
+            if tag == LEFT:
+                yield Left(next(left_values))
+            else:
+                yield Right(next(right_values))
+
+    def __getitem__(self, index: int) -> Either:
+        offsets = self._offsets
+        if offsets is None:
+            offsets = self._offsets = self._index()
+        tag = self._tags[index]
+        if tag == LEFT:
+            return Left(self._lefts[offsets[index]])
+        return Right(self._rights[offsets[index]])
+
+    def _index(self) -> array:
+        offsets = array("q", bytes(8 * len(self._tags)))
+        counts = [0, 0]
+        for index, tag in enumerate(self._tags):
+            offsets[index] = counts[tag]
+            counts[tag] += 1
+        return offsets
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, EitherBatch)
+            and self._tags == other._tags
+            and self._lefts == other._lefts
+            and self._rights == other._rights
+        )
+
+    def __str__(self) -> str:
+        return (
+            "EitherBatch("
+            + str(len(self._lefts))
+            + " lefts, "
+            + str(len(self._rights))
+            + " rights)"
+        )
+
+    def __repr__(self) -> str:
+        return self.__str__()
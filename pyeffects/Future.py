@@ -6,27 +6,285 @@ pyeffects.Future
 
 This module implements the Future class.
 """
-from typing import Callable, List, TypeVar
+from concurrent.futures import (
+    CancelledError,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from enum import Enum
+from typing import Callable, Iterable, List, Optional, Set, Tuple, TypeVar, Union
+from .Either import Left
 from .Monad import Monad
-from .Option import empty, Some
-from .Try import Success, Failure, Try
-from functools import reduce
+from . import Metrics
+from .Retry import RetryPolicy
+from .Timer import Timer, TimerHandle
+from .Try import Success, Failure, Try, success_none
+from functools import partial
+from collections import deque
+import asyncio
+import multiprocessing
+import os
+import pickle
+import sys
 import threading
+import time
 
 A = TypeVar("A", covariant=True)
 B = TypeVar("B")
 
+Scheduler = Callable[[Callable[[], None]], None]
+ExecutorLike = Union[Executor, Scheduler]
+
+_default_executor = None  # type: Optional[ExecutorLike]
+_default_executor_lock = threading.Lock()
+
+_process_pool = None  # type: Optional[ProcessPoolExecutor]
+_process_pool_size = None  # type: Optional[int]
+_process_pool_lock = threading.Lock()
+
+MAX_INLINE_DEPTH = 64
+_inline_state = threading.local()
+_running_state = threading.local()
+
+
+class Dispatch(Enum):
+    """How a :class:`Future <Future>` runs the subscribers waiting on it when it completes.
+
+    * ``INLINE`` runs them on the completing thread.  Once more than
+      ``MAX_INLINE_DEPTH`` inline continuations are nested on one thread, the rest are
+      queued and run by the outermost one after it returns, so the stack stays bounded.
+    * ``POOLED`` hands each one to :meth:`Future.default_executor`.
+    * ``THREAD`` starts a new thread for each one.
+    """
+
+    INLINE = "inline"
+    POOLED = "pooled"
+    THREAD = "thread"
+
+
+_default_dispatch = Dispatch.THREAD
+
+
+def thread_per_task(task: Callable[[], None]) -> None:
+    """Scheduler that starts a new thread for every task.
+
+    This is how :meth:`Future.run` behaved before executors were pluggable.
+
+    Usage::
+
+      >>> from pyeffects.Future import *
+      >>> Future.run(lambda: 5, executor=thread_per_task)
+      Future(...)
+    """
+    thread = threading.Thread(target=task)
+    thread.start()
+
+
+def _submit(executor: ExecutorLike, task: Callable[[], None]) -> None:
+    if isinstance(executor, Executor):
+        executor.submit(task)
+    else:
+        executor(task)
+
+
+def _is_executor(executor: object) -> bool:
+    return isinstance(executor, Executor) or hasattr(executor, "__call__")
+
+
+def loop_executor(
+    loop: asyncio.AbstractEventLoop, executor: Optional[Executor] = None
+) -> Scheduler:
+    """Scheduler that runs tasks through ``loop.run_in_executor``.
+
+    Tasks are handed to the loop with ``call_soon_threadsafe``, so the scheduler may be
+    used from any thread.
+
+    :param loop: the event loop that owns the executor.
+    :param executor: optional executor passed on to ``run_in_executor``, defaults to
+      the loop's default executor.
+
+    Usage::
+
+      >>> import asyncio
+      >>> from pyeffects.Future import *
+      >>> async def main():
+      ...   return await Future.run(lambda: 5, executor=loop_executor(asyncio.get_running_loop()))
+      ...
+      >>> asyncio.run(main())
+      5
+    """
+
+    def schedule(task: Callable[[], None]) -> None:
+        loop.call_soon_threadsafe(loop.run_in_executor, executor, task)
+
+    return schedule
+
+
+def _try_of_done(done) -> Try:
+    if done.cancelled():
+        return Failure(CancelledError())
+    err = done.exception()
+    return Success(done.result()) if err is None else Failure(err)
+
+
+def _settle_asyncio(target: asyncio.Future, value: Try) -> None:
+    if target.done():
+        return
+    if value.is_success():
+        target.set_result(value.value)
+    else:
+        target.set_exception(value.value)
+
+
+def _run_chunk(func: Callable, chunk: List[tuple]) -> list:
+    return [func(*args) for args in chunk]
+
+
+def _timed_out(timeout: Optional[float]) -> Failure:
+    return Failure(TimeoutError("Future did not complete within %s seconds" % timeout))
+
+
+def _notify(subscriber: Callable, value: Try) -> None:
+    try:
+        subscriber(value)
+    except Exception:
+        threading.excepthook(
+            threading.ExceptHookArgs([*sys.exc_info(), threading.current_thread()])  # type: ignore
+        )
+
+
+def _notify_metered(
+    sink: Metrics.MetricsSink, completed: float, subscriber: Callable, value: Try
+) -> None:
+    sink.observe(Metrics.NOTIFY_TIME, time.perf_counter() - completed)
+    _notify(subscriber, value)
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+def _run_inline(call: Callable, subscriber: Callable, value: Try) -> None:
+    depth = getattr(_inline_state, "depth", 0)
+    if depth >= MAX_INLINE_DEPTH:
+        _inline_state.queue.append((subscriber, value))
+        return
+    if depth == 0 and not getattr(_inline_state, "queue", None):
+        _inline_state.queue = deque()
+    _inline_state.depth = depth + 1
+    try:
+        call(subscriber, value)
+    finally:
+        _inline_state.depth = depth
+        if depth == 0:
+            # drained even when ``call`` raises, so queued continuations still run
+            queue = _inline_state.queue
+            while queue:
+                _inline_state.depth = 1
+                try:
+                    _notify(*queue.popleft())
+                finally:
+                    _inline_state.depth = 0
+
+
+def _notify_inline(subscriber: Callable, value: Try) -> None:
+    _run_inline(_notify, subscriber, value)
+
+
+def _call(subscriber: Callable, value: Try) -> None:
+    subscriber(value)
+
+
+class CancellationToken:
+    """Cancels every :class:`Future <Future>` created with it at once.
+
+    Futures derived with ``map``, ``flat_map`` and ``gather`` share the token of the
+    futures they were created from.  Functions passed to :meth:`Future.run` can check
+    the token cooperatively to stop work that is no longer needed.
+
+    Usage::
+
+      >>> from pyeffects.Future import *
+      >>> token = CancellationToken()
+      >>> result = Future.run(lambda: 5, executor=lambda task: None, token=token)
+      >>> token.cancel()
+      >>> result
+      Future(Failure())
+      >>> token.is_cancelled()
+      True
+    """
+
+    def __init__(self) -> None:
+        self._cancelled = False
+        self._futures = set()  # type: Set[Future]
+        self._lock = threading.Lock()
+
+    def cancel(self) -> None:
+        """Cancels every pending :class:`Future <Future>` created with this token."""
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            futures, self._futures = self._futures, set()
+        for future in futures:
+            future.cancel()
+
+    def is_cancelled(self) -> bool:
+        """Returns if the token has been cancelled.
+
+        :rtype: bool
+        """
+        return self._cancelled
+
+    def raise_if_cancelled(self) -> None:
+        """Raises ``concurrent.futures.CancelledError`` if the token has been cancelled."""
+        if self._cancelled:
+            raise CancelledError()
+
+    def _register(self, future: "Future") -> bool:
+        with self._lock:
+            if self._cancelled:
+                return False
+            self._futures.add(future)
+            return True
+
+    def _unregister(self, future: "Future") -> None:
+        with self._lock:
+            self._futures.discard(future)
+
 
 class Future(Monad[A]):
-    subscribers: List[Callable[[A], None]]
+    # Thread safety, with or without the GIL: ``value``, ``subscribers``, ``dispatch``
+    # and ``_done_event`` are only assigned while holding ``_lock``.  ``value`` is
+    # written once with an immutable ``Try`` and never changes afterwards, so readers
+    # may read it without the lock as long as they read it once into a local and take
+    # the lock before acting on ``None``.
+    subscribers: List[Tuple[Callable[[A], None], Optional[Dispatch]]]
 
-    def __init__(self, func) -> None:
+    def __init__(
+        self,
+        func=None,
+        dispatch: Optional[Dispatch] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> None:
         self.subscribers = []
-        self.cache = empty
-        self.semaphore = threading.BoundedSemaphore(1)
+        self._lock = threading.Lock()
         self.biased = True
         self.value = None  # type: ignore
-        func(self._callback)
+        self.dispatch = dispatch
+        self.token = token
+        self._done_event = None  # type: Optional[threading.Event]
+        self._sink = Metrics._sink
+        if self._sink is not None:
+            self._sink.count(Metrics.PENDING)
+        if token is not None and not token._register(self):
+            self.cancel()
+        if func is not None:
+            func(self._callback)
 
     @staticmethod
     def of(value: B) -> "Future[B]":
@@ -45,24 +303,263 @@ class Future(Monad[A]):
         """
         return Future(lambda cb: cb(Success(value)))
 
+    def _task(self, func: Callable[[], A]) -> Callable[[], None]:
+        sink = self._sink
+        if sink is None:
+            return partial(self._run, func)
+        return partial(self._run_metered, func, sink, time.perf_counter())
+
+    def _run(self, func: Callable[[], A]) -> None:
+        if self.value is not None:
+            return
+        self._callback(self._exec(func))
+
+    def _run_metered(
+        self, func: Callable[[], A], sink: Metrics.MetricsSink, queued: float
+    ) -> None:
+        if self.value is not None:
+            return
+        started = time.perf_counter()
+        sink.observe(Metrics.QUEUE_TIME, started - queued)
+        sink.count(Metrics.RUNNING)
+        try:
+            value = self._exec(func)
+        finally:
+            sink.count(Metrics.RUNNING, -1)
+        sink.observe(Metrics.RUN_TIME, time.perf_counter() - started)
+        self._callback(value)
+
+    def _exec(self, func: Callable[[], A]) -> Try[A]:
+        running = getattr(_running_state, "future", None)
+        _running_state.future = self
+        try:
+            value = func()
+            return success_none if value is None else Success(value)
+        except Exception as err:
+            return Failure(err)
+        finally:
+            _running_state.future = running
+
+    @staticmethod
+    def default_executor() -> ExecutorLike:
+        """Returns the executor used by :meth:`Future.run` when none is given.
+
+        Unless replaced with :meth:`Future.set_default_executor`, this is a shared
+        thread pool bounded to ``min(32, cpu_count + 4)`` workers, created on first use.
+
+        :rtype: concurrent.futures.Executor or callable
+        """
+        global _default_executor
+        if _default_executor is None:
+            with _default_executor_lock:
+                if _default_executor is None:
+                    _default_executor = ThreadPoolExecutor(
+                        max_workers=min(32, (os.cpu_count() or 1) + 4),
+                        thread_name_prefix="pyeffects",
+                    )
+        return _default_executor
+
+    @staticmethod
+    def set_default_executor(executor: Optional[ExecutorLike]) -> None:
+        """Sets the executor used by :meth:`Future.run` when none is given.
+
+        :param executor: a ``concurrent.futures.Executor``, a scheduler callable that
+          accepts a no-argument task, or ``None`` to go back to the shared thread pool.
+
+        Usage::
+
+          >>> from pyeffects.Future import *
+          >>> Future.set_default_executor(lambda task: task())
+          >>> Future.run(lambda: 5)
+          Future(Success(5))
+          >>> Future.set_default_executor(None)
+        """
+        global _default_executor
+        if executor is not None and not _is_executor(executor):
+            raise TypeError(
+                "Future.set_default_executor expects an Executor or a callable"
+            )
+        with _default_executor_lock:
+            _default_executor = executor
+
+    @staticmethod
+    def process_pool() -> ProcessPoolExecutor:
+        """Returns the process pool used by :meth:`Future.run_in_process`.
+
+        The pool is created on first use with :meth:`Future.set_process_pool_size`
+        workers, or ``os.cpu_count()`` if no size was set.  Its workers are started
+        with the ``forkserver`` method where available and ``spawn`` otherwise, never
+        by forking this process, whose runtime threads could deadlock a forked child.
+
+        :rtype: concurrent.futures.ProcessPoolExecutor
+        """
+        global _process_pool
+        if _process_pool is None:
+            with _process_pool_lock:
+                if _process_pool is None:
+                    _process_pool = ProcessPoolExecutor(
+                        max_workers=_process_pool_size, mp_context=_process_context()
+                    )
+        return _process_pool
+
+    @staticmethod
+    def set_process_pool_size(size: Optional[int]) -> None:
+        """Sets the number of worker processes used by :meth:`Future.run_in_process`.
+
+        A running pool is shut down once its pending work finishes and replaced on next use.
+
+        :param size: number of worker processes, or ``None`` for ``os.cpu_count()``.
+        """
+        global _process_pool, _process_pool_size
+        if size is not None and (not isinstance(size, int) or size < 1):
+            raise TypeError("Future.set_process_pool_size expects a positive int")
+        with _process_pool_lock:
+            pool, _process_pool = _process_pool, None
+            _process_pool_size = size
+        if pool is not None:
+            pool.shutdown(wait=False)
+
     @staticmethod
-    def _exec(func: Callable[[], A], cb: Callable[[Try[A]], None]):
+    def _submit_to_process(func: Callable, target: Callable, *args) -> "Future":
         try:
-            data = func()
-            cb(Success(data))
+            pickle.dumps(func)
         except Exception as err:
-            cb(Failure(err))
+            return Future(
+                lambda cb: cb(
+                    Failure(
+                        TypeError(
+                            "Future.run_in_process expects a picklable callable, "
+                            "such as a module-level function: %s" % err
+                        )
+                    )
+                )
+            )
+        done = Future.process_pool().submit(target, *args)
+        return Future(lambda cb: done.add_done_callback(lambda d: cb(_try_of_done(d))))
 
     @staticmethod
-    def _run_on_thread(func: Callable[[], A], cb: Callable[[Try[A]], None]):
-        thread = threading.Thread(target=Future._exec, args=[func, cb])
-        thread.start()
+    def run_in_process(func: Callable[..., B], *args) -> "Future[B]":
+        """Constructs a :class:`Future <Future>` that runs ``func(*args)`` in a worker process.
+
+        Use this instead of :meth:`Future.run` for CPU-bound work, which threads cannot
+        speed up.  ``func`` and ``args`` are pickled, so ``func`` has to be importable
+        from the worker (a module-level function or builtin, not a lambda).  An
+        unpicklable ``func`` results in a ``Failure(TypeError)``.
+
+        :param func: function to run in a worker process.
+        :param args: positional arguments for ``func``.
+        :rtype: pyEffects.Future
+
+        Usage::
+
+          >>> from pyeffects.Future import *
+          >>> Future.run_in_process(pow, 2, 10).result()
+          Success(1024)
+          >>> Future.run_in_process(lambda: 5).result()
+          Failure(Future.run_in_process expects a picklable callable, ...)
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("Future.run_in_process expects a callable")
+        return Future._submit_to_process(func, func, *args)
 
     @staticmethod
-    def run(func: Callable[[], A]) -> "Future[A]":
-        """Constructs a :class:`Future <Future>` that runs asynchronously on another thread.
+    def map_in_process(
+        func: Callable[..., B], iterable: Iterable, chunksize: Optional[int] = None
+    ) -> "Future[List[B]]":
+        """Constructs a :class:`Future <Future>` of ``func`` applied to every element in worker processes.
+
+        Elements are submitted in chunks to amortize the cost of sending many small tasks
+        between processes.  Tuples are unpacked into positional arguments.
 
-        :param func: function to run on new thread and return a new :class:`Future` object
+        :param func: function to run in worker processes.
+        :param iterable: arguments to call ``func`` with.
+        :param chunksize: optional number of elements per task, defaults to splitting the
+          input into about four tasks per worker.
+        :rtype: pyEffects.Future
+
+        Usage::
+
+          >>> from pyeffects.Future import *
+          >>> Future.map_in_process(abs, [-1, -2, -3], chunksize=2).result()
+          Success([1, 2, 3])
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("Future.map_in_process expects a callable")
+        calls = [args if isinstance(args, tuple) else (args,) for args in iterable]
+        if chunksize is None:
+            workers = _process_pool_size or os.cpu_count() or 1
+            chunksize = max(1, -(-len(calls) // (workers * 4)))
+        elif not isinstance(chunksize, int) or chunksize < 1:
+            raise TypeError("Future.map_in_process expects a positive int chunksize")
+        chunks = [
+            Future._submit_to_process(func, _run_chunk, func, calls[i : i + chunksize])
+            for i in range(0, len(calls), chunksize)
+        ]
+        if chunks and chunks[0].is_failure():
+            return chunks[0]
+        return Future.gather(chunks).map(  # type: ignore
+            lambda results: [value for chunk in results for value in chunk]
+        )
+
+    @staticmethod
+    def default_dispatch() -> Dispatch:
+        """Returns the :class:`Dispatch` used by futures that do not set their own.
+
+        :rtype: pyEffects.Future.Dispatch
+        """
+        return _default_dispatch
+
+    @staticmethod
+    def set_default_dispatch(dispatch: Dispatch) -> None:
+        """Sets the :class:`Dispatch` used by futures that do not set their own.
+
+        :param dispatch: the new default :class:`Dispatch` mode.
+
+        Usage::
+
+          >>> from pyeffects.Future import *
+          >>> Future.set_default_dispatch(Dispatch.INLINE)
+          >>> Future.default_dispatch()
+          <Dispatch.INLINE: 'inline'>
+          >>> Future.set_default_dispatch(Dispatch.THREAD)
+        """
+        global _default_dispatch
+        if not isinstance(dispatch, Dispatch):
+            raise TypeError("Future.set_default_dispatch expects a Dispatch")
+        _default_dispatch = dispatch
+
+    def with_dispatch(self, dispatch: Optional[Dispatch]) -> "Future[A]":
+        """Sets the :class:`Dispatch` this :class:`Future <Future>` and futures derived from it use.
+
+        :param dispatch: a :class:`Dispatch` mode, or ``None`` to follow the default.
+        :rtype: pyEffects.Future
+
+        Usage::
+
+          >>> from pyeffects.Future import *
+          >>> Future.run(lambda: 5).with_dispatch(Dispatch.INLINE).map(lambda v: v * v)
+          Future(...)
+        """
+        if dispatch is not None and not isinstance(dispatch, Dispatch):
+            raise TypeError("Future.with_dispatch expects a Dispatch")
+        with self._lock:
+            self.dispatch = dispatch
+        return self
+
+    @staticmethod
+    def run(
+        func: Callable[[], A],
+        executor: Optional[ExecutorLike] = None,
+        dispatch: Optional[Dispatch] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> "Future[A]":
+        """Constructs a :class:`Future <Future>` that runs asynchronously on an executor.
+
+        :param func: function to run asynchronously and return a new :class:`Future` object
+        :param executor: optional ``concurrent.futures.Executor`` or scheduler callable
+          to run ``func`` on, defaults to :meth:`Future.default_executor`
+        :param dispatch: optional :class:`Dispatch` for subscribers of the new future
+        :param token: optional :class:`CancellationToken` that cancels the new future
         :rtype: pyEffects.Future
 
         Usage::
@@ -78,15 +575,387 @@ class Future(Monad[A]):
         """
         if not hasattr(func, "__call__"):
             raise TypeError("Future.run expects a callable")
-        return Future(lambda cb: Future._run_on_thread(func, cb))
+        if executor is None:
+            executor = Future.default_executor()
+        elif not _is_executor(executor):
+            raise TypeError("Future.run expects an Executor or a callable scheduler")
+        if dispatch is not None and not isinstance(dispatch, Dispatch):
+            raise TypeError("Future.run expects a Dispatch")
+        if token is not None and not isinstance(token, CancellationToken):
+            raise TypeError("Future.run expects a CancellationToken")
+        future = Future(None, dispatch, token)  # type: Future[A]
+        _submit(executor, future._task(func))  # type: ignore
+        return future
+
+    @staticmethod
+    def retry(
+        func: Callable[[], A],
+        policy: Optional[RetryPolicy] = None,
+        executor: Optional[ExecutorLike] = None,
+        dispatch: Optional[Dispatch] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> "Future[A]":
+        """Constructs a :class:`Future <Future>` that runs a function until it succeeds.
+
+        Every attempt runs like :meth:`Future.run`.  Between attempts nothing waits on
+        a worker thread: the next attempt is submitted by the shared
+        :class:`Timer <pyeffects.Timer.Timer>` once the policy's backoff delay has
+        passed.  The result is the first ``Success``, or the last ``Failure``.
+
+        :param func: function to run asynchronously.
+        :param policy: the :class:`RetryPolicy` to follow, defaults to ``RetryPolicy()``.
+        :param executor: optional ``concurrent.futures.Executor`` or scheduler callable
+          to run every attempt on, defaults to :meth:`Future.default_executor`
+        :param dispatch: optional :class:`Dispatch` for subscribers of the new future
+        :param token: optional :class:`CancellationToken` that cancels the new future
+          and stops further attempts
+        :rtype: pyEffects.Future
+
+        Usage::
+
+          >>> from pyeffects.Future import *
+          >>> from pyeffects.Retry import RetryPolicy
+          >>> calls = []
+          >>> def flaky():
+          ...   calls.append(1)
+          ...   if len(calls) < 3:
+          ...     raise RuntimeError("failed")
+          ...   return len(calls)
+          ...
+          >>> Future.retry(flaky, RetryPolicy(max_attempts=3, base_delay=0.01)).result()
+          Success(3)
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("Future.retry expects a callable")
+        if policy is None:
+            policy = RetryPolicy()
+        elif not isinstance(policy, RetryPolicy):
+            raise TypeError("Future.retry expects a RetryPolicy")
+        if executor is None:
+            executor = Future.default_executor()
+        elif not _is_executor(executor):
+            raise TypeError("Future.retry expects an Executor or a callable scheduler")
+        if dispatch is not None and not isinstance(dispatch, Dispatch):
+            raise TypeError("Future.retry expects a Dispatch")
+        if token is not None and not isinstance(token, CancellationToken):
+            raise TypeError("Future.retry expects a CancellationToken")
+        result = Future(None, dispatch, token)  # type: Future[A]
+        timers = []  # type: List[TimerHandle]
+
+        def attempt(count: int, delay: Optional[float]) -> None:
+            if result.value is not None:
+                return
+            future = Future(None, Dispatch.INLINE, token)  # type: Future[A]
+            future._on_complete(partial(settle, count, delay), Dispatch.INLINE)  # type: ignore
+            _submit(executor, future._task(func))  # type: ignore
+
+        def settle(count: int, delay: Optional[float], value: Try) -> None:
+            if value.is_success() or not policy.should_retry(value.error(), count):  # type: ignore
+                result._try_complete(value)
+                return
+            delay = policy.next_delay(count, delay)  # type: ignore
+            timers[:] = [
+                Timer.default().schedule(delay, partial(attempt, count + 1, delay))
+            ]
+
+        def stop(_: Try) -> None:
+            for timer in timers:
+                timer.cancel()
+
+        result._on_complete(stop, Dispatch.INLINE)  # type: ignore
+        attempt(1, None)
+        return result
+
+    @staticmethod
+    def delay(
+        seconds: float,
+        value: B = None,  # type: ignore
+        dispatch: Optional[Dispatch] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> "Future[B]":
+        """Constructs a :class:`Future <Future>` that succeeds with a value after a delay.
+
+        The delay is kept by the shared :class:`Timer <pyeffects.Timer.Timer>`, so no
+        thread waits for it.  Cancelling the future removes its timer.
+
+        :param seconds: seconds to wait before completing.
+        :param value: value to complete with.
+        :param dispatch: optional :class:`Dispatch` for subscribers of the new future
+        :param token: optional :class:`CancellationToken` that cancels the new future
+        :rtype: pyEffects.Future
+
+        Usage::
+
+          >>> from pyeffects.Future import *
+          >>> Future.delay(0.01, "abc").result()
+          Success(abc)
+        """
+        if dispatch is not None and not isinstance(dispatch, Dispatch):
+            raise TypeError("Future.delay expects a Dispatch")
+        if token is not None and not isinstance(token, CancellationToken):
+            raise TypeError("Future.delay expects a CancellationToken")
+        result = Future(None, dispatch, token)  # type: Future[B]
+        if result.value is None:
+            timer = Timer.default().schedule(
+                seconds, partial(result._try_complete, Success(value))  # type: ignore
+            )
+            result._on_complete(lambda _: timer.cancel(), Dispatch.INLINE)
+        return result
+
+    @staticmethod
+    def schedule(
+        at: float,
+        func: Callable[[], A],
+        executor: Optional[ExecutorLike] = None,
+        dispatch: Optional[Dispatch] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> "Future[A]":
+        """Constructs a :class:`Future <Future>` that runs a function at a given time.
+
+        Until then the function waits on the shared :class:`Timer <pyeffects.Timer.Timer>`
+        rather than on a thread; at ``at`` it is submitted to ``executor`` like
+        :meth:`Future.run`.  Cancelling the future before then removes its timer.
+
+        :param at: the time to run ``func`` at, in seconds since the epoch as returned
+          by ``time.time()``.  Times in the past run ``func`` straight away.
+        :param func: function to run asynchronously.
+        :param executor: optional ``concurrent.futures.Executor`` or scheduler callable
+          to run ``func`` on, defaults to :meth:`Future.default_executor`
+        :param dispatch: optional :class:`Dispatch` for subscribers of the new future
+        :param token: optional :class:`CancellationToken` that cancels the new future
+        :rtype: pyEffects.Future
+
+        Usage::
+
+          >>> import time
+          >>> from pyeffects.Future import *
+          >>> Future.schedule(time.time() + 0.01, lambda: "abc").result()
+          Success(abc)
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("Future.schedule expects a callable")
+        if executor is None:
+            executor = Future.default_executor()
+        elif not _is_executor(executor):
+            raise TypeError(
+                "Future.schedule expects an Executor or a callable scheduler"
+            )
+        if dispatch is not None and not isinstance(dispatch, Dispatch):
+            raise TypeError("Future.schedule expects a Dispatch")
+        if token is not None and not isinstance(token, CancellationToken):
+            raise TypeError("Future.schedule expects a CancellationToken")
+        result = Future(None, dispatch, token)  # type: Future
+        if result.value is None:
+            timer = Timer.default().schedule(
+                at - time.time(),
+                lambda: _submit(executor, result._task(func)),  # type: ignore
+            )
+            result._on_complete(lambda _: timer.cancel(), Dispatch.INLINE)
+        return result
+
+    @staticmethod
+    def raise_if_cancelled() -> None:
+        """Raises ``concurrent.futures.CancelledError`` if the running task was cancelled.
+
+        Functions passed to :meth:`Future.run` can call this between steps of long
+        running work to stop early once their :class:`Future <Future>` has been
+        cancelled, directly or through its :class:`CancellationToken`.
+
+        Usage::
+
+          >>> from pyeffects.Future import *
+          >>> def work():
+          ...   Future.raise_if_cancelled()
+          ...   return 5
+          ...
+          >>> Future.run(work).result()
+          Success(5)
+        """
+        future = getattr(_running_state, "future", None)
+        if future is not None and future.is_cancelled():
+            raise CancelledError()
+
+    def cancel(self) -> bool:
+        """Cancels the :class:`Future <Future>` if it has not completed yet.
+
+        The future completes with a ``Failure(CancelledError)``, so continuations added
+        with ``map`` and ``flat_map`` that have not started are skipped.  Work that was
+        scheduled with :meth:`Future.run` and has not started yet does not run.
+
+        :rtype: bool, whether the future was cancelled by this call
+
+        Usage::
+
+          >>> from pyeffects.Future import *
+          >>> result = Future.run(lambda: 5, executor=lambda task: None)
+          >>> result.cancel()
+          True
+          >>> result.is_cancelled()
+          True
+          >>> Future.of(5).cancel()
+          False
+        """
+        return self._try_complete(Failure(CancelledError()))
+
+    def is_cancelled(self) -> bool:
+        """Returns if the :class:`Future <Future>` was cancelled.
+
+        :rtype: bool
+        """
+        value = self.value
+        return (
+            value is not None
+            and value.is_failure()  # type: ignore
+            and isinstance(value.value, CancelledError)  # type: ignore
+        )
 
     def get(self) -> A:  # type: ignore
-        if self.is_success():
-            return self.value.get()  # type: ignore
+        value = self.value
+        if value is not None and value.is_success():  # type: ignore
+            return value.get()  # type: ignore
 
     def error(self) -> Exception:  # type: ignore
-        if self.is_failure():
-            return self.value.error()  # type: ignore
+        value = self.value
+        if value is not None and value.is_failure():  # type: ignore
+            return value.error()  # type: ignore
+
+    def result(self, timeout: Optional[float] = None) -> Try[A]:
+        """Blocks until the :class:`Future <Future>` completes and returns its result.
+
+        :param timeout: optional number of seconds to wait for.
+        :rtype: pyEffects.Try
+
+        Usage::
+
+          >>> import time
+          >>> from pyeffects.Future import *
+          >>> def delayed_result():
+          ...   time.sleep(0.1)
+          ...   return "abc"
+          ...
+          >>> Future.run(delayed_result).result()
+          Success(abc)
+          >>> Future.run(delayed_result).result(timeout=0.01)
+          Failure(Future did not complete within 0.01 seconds)
+        """
+        value = self.value
+        if value is not None:
+            return value  # type: ignore
+        with self._lock:
+            if self.value is None and self._done_event is None:
+                self._done_event = threading.Event()
+            done_event = self._done_event
+        if done_event is not None:
+            done_event.wait(timeout)
+        value = self.value
+        if value is None:
+            return _timed_out(timeout)
+        return value  # type: ignore
+
+    def within(self, seconds: float, cancel: bool = False) -> "Future[A]":
+        """Returns a :class:`Future <Future>` that fails if this one takes too long.
+
+        The result completes like this future, or with ``Failure(TimeoutError)`` once
+        ``seconds`` have passed.  The deadline is kept by the shared
+        :class:`Timer <pyeffects.Timer.Timer>`, so no thread waits for it.
+
+        :param seconds: seconds to wait for this future.
+        :param cancel: whether to cancel this future when the deadline passes.
+        :rtype: pyEffects.Future
+
+        Usage::
+
+          >>> from pyeffects.Future import *
+          >>> Future.delay(1, "abc").within(0.01).result()
+          Failure(Future did not complete within 0.01 seconds)
+          >>> Future.of("abc").within(0.01)
+          Future(Success(abc))
+        """
+        if self.value is not None:
+            return self
+        result = Future(None, self.dispatch, self.token)  # type: Future
+
+        def expire() -> None:
+            if result._try_complete(_timed_out(seconds)) and cancel:
+                self.cancel()
+
+        timer = Timer.default().schedule(seconds, expire)
+        result._on_complete(lambda _: timer.cancel(), Dispatch.INLINE)
+        self._on_complete(result._try_complete, Dispatch.INLINE)  # type: ignore
+        return result
+
+    @staticmethod
+    def wait_all(
+        futures: Iterable["Future[B]"], timeout: Optional[float] = None
+    ) -> List[Try[B]]:
+        """Blocks until every :class:`Future <Future>` completes or the timeout expires.
+
+        :param futures: the futures to wait for.
+        :param timeout: optional number of seconds to wait for all of them.
+        :rtype: list of pyEffects.Try, with a ``Failure(TimeoutError)`` for each
+          future that had not completed in time
+
+        Usage::
+
+          >>> from pyeffects.Future import *
+          >>> Future.wait_all([Future.run(lambda: 1), Future.run(lambda: 2)])
+          [Success(1), Success(2)]
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        results = []
+        for future in futures:
+            if deadline is None:
+                results.append(future.result())
+            else:
+                remaining = max(0.0, deadline - time.monotonic())
+                value = future.result(remaining)
+                results.append(_timed_out(timeout) if future.value is None else value)
+        return results
+
+    @staticmethod
+    def wait_any(
+        futures: Iterable["Future[B]"], timeout: Optional[float] = None
+    ) -> Try[B]:
+        """Blocks until any :class:`Future <Future>` completes and returns its result.
+
+        :param futures: the futures to wait for.
+        :param timeout: optional number of seconds to wait for.
+        :rtype: pyEffects.Try, ``Failure(TimeoutError)`` if none completed in time
+
+        Usage::
+
+          >>> import time
+          >>> from pyeffects.Future import *
+          >>> def delayed_result():
+          ...   time.sleep(0.2)
+          ...   return "slow"
+          ...
+          >>> Future.wait_any([Future.run(delayed_result), Future.run(lambda: "fast")])
+          Success(fast)
+        """
+        futures = list(futures)
+        if not futures:
+            raise ValueError("Future.wait_any expects at least one future")
+        first = []  # type: List[Try[B]]
+        done_event = threading.Event()
+
+        def on_done(value: Try[B]) -> None:
+            if not first:
+                first.append(value)
+            done_event.set()
+
+        for future in futures:
+            future._on_complete(on_done, Dispatch.INLINE)  # type: ignore
+            if done_event.is_set():
+                break
+        completed = done_event.wait(timeout)
+        for future in futures:
+            future._unsubscribe(on_done)  # type: ignore
+        if not completed:
+            return Failure(
+                TimeoutError("No future completed within %s seconds" % timeout)
+            )
+        return first[0]
 
     def flat_map(self, func: Callable[[A], "Monad[B]"]) -> "Monad[B]":
         """Flatmaps a function for :class:`Future <Future>`.
@@ -102,31 +971,458 @@ class Future(Monad[A]):
         """
         if not hasattr(func, "__call__"):
             raise TypeError("Future.flat_map expects a callable")
-        return Future(
-            lambda cb: self.on_complete(
-                lambda value: cb(value) if value.is_failure() else func(value.value).on_complete(cb)  # type: ignore
+
+        result = Future(None, self.dispatch, self.token)  # type: Future[B]
+
+        def continue_with(value: Try[A]) -> None:
+            if result.value is not None:
+                return
+            if value.is_failure():
+                result._callback(value)  # type: ignore
+                return
+            try:
+                func(value.value)._on_complete(result._callback, Dispatch.INLINE)  # type: ignore
+            except Exception as err:
+                result._callback(Failure(err))
+
+        self.on_complete(continue_with)  # type: ignore
+        return result
+
+    @classmethod
+    def tail_rec_m(cls, init: B, step: Callable[[B], "Monad"]) -> "Future":
+        """Runs an asynchronous loop in constant stack depth.
+
+        ``step`` returns a :class:`Future` of ``Left(state)`` to continue the loop, or of
+        ``Right(result)`` to end it.  Steps that have already completed are run in a
+        loop, and pending ones resume the loop from the thread that completes them.
+
+        :param init: the initial state of the loop.
+        :param step: function returning a :class:`Future` of ``Left(state)`` or ``Right(result)``.
+        :rtype: pyEffects.Future
+
+        Usage::
+
+          >>> from pyeffects.Either import Left, Right
+          >>> from pyeffects.Future import *
+          >>> Future.tail_rec_m(0, lambda n: Future.of(Left(n + 1) if n < 100000 else Right(n)))
+          Future(Success(100000))
+        """
+        if not hasattr(step, "__call__"):
+            raise TypeError("Future.tail_rec_m expects a callable")
+        result = Future()  # type: Future
+
+        def resume(value: Try) -> None:
+            while True:
+                if value.is_failure():
+                    result._try_complete(value)
+                    return
+                either = value.value
+                if either.is_right():  # type: ignore
+                    result._try_complete(Success(either.value))  # type: ignore
+                    return
+                if result.value is not None:
+                    return
+                try:
+                    future = step(either.value)  # type: ignore
+                except Exception as err:
+                    result._try_complete(Failure(err))
+                    return
+                value = future.value
+                if value is None:
+                    future._on_complete(resume, Dispatch.INLINE)  # type: ignore
+                    return
+
+        resume(Success(Left(init)))
+        return result
+
+    @staticmethod
+    def gather(
+        futures: Iterable["Future[B]"], token: Optional[CancellationToken] = None
+    ) -> "Future[List[B]]":
+        """Combines futures into one :class:`Future <Future>` of the list of their values.
+
+        Every input is subscribed to at once.  The result completes as soon as the last
+        input does, or with the first failure.
+
+        :param futures: the futures to combine.
+        :param token: optional :class:`CancellationToken` for the result, defaults to
+          the token of the first input that has one.
+        :rtype: pyEffects.Future
+
+        Usage::
+
+          >>> from pyeffects.Future import *
+          >>> Future.gather([Future.of(1), Future.of(2), Future.of(3)])
+          Future(Success([1, 2, 3]))
+        """
+        futures = list(futures)
+        if not futures:
+            return Future.of([])
+        if token is None:
+            token = next((f.token for f in futures if f.token is not None), None)
+        values = [None] * len(futures)  # type: List
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def subscribe(cb: Callable[[Try[List[B]]], None]) -> None:
+            def on_done(index: int, value: Try[B]) -> None:
+                with lock:
+                    if remaining[0] <= 0:
+                        return
+                    if value.is_failure():
+                        remaining[0] = 0
+                    else:
+                        values[index] = value.value
+                        remaining[0] -= 1
+                    done = remaining[0] == 0
+                if done:
+                    cb(value if value.is_failure() else Success(values))  # type: ignore
+
+            for index, future in enumerate(futures):
+                future._on_complete(partial(on_done, index), Dispatch.INLINE)  # type: ignore
+
+        return Future(subscribe, None, token)
+
+    @staticmethod
+    def traverse_with_limit(
+        iterable: Iterable,
+        func: Callable[..., "Future[B]"],
+        max_in_flight: int,
+        ordered: bool = True,
+        fail_fast: bool = True,
+        token: Optional[CancellationToken] = None,
+    ) -> "Future[list]":
+        """Applies ``func`` to every element with at most ``max_in_flight`` futures pending at once.
+
+        Elements are pulled from ``iterable`` lazily, one for every future that completes,
+        so memory for pending work stays constant however long the input is.
+
+        :param iterable: the elements to traverse, consumed lazily.
+        :param func: function returning a :class:`Future` for an element.
+        :param max_in_flight: maximum number of futures pending at the same time.
+        :param ordered: whether results keep the input order, or are listed in the order
+          they complete.
+        :param fail_fast: if ``True``, the result fails with the first failure, no more
+          elements are pulled and the futures still in flight are cancelled.  If
+          ``False``, every element is processed and the result is a list of ``Try``
+          values.
+        :param token: optional :class:`CancellationToken` for the result.  Cancelling the
+          result stops pulling elements.
+        :rtype: pyEffects.Future
+
+        Usage::
+
+          >>> from pyeffects.Future import *
+          >>> Future.traverse_with_limit(range(5), lambda v: Future.run(lambda: v * v), 2).result()
+          Success([0, 1, 4, 9, 16])
+          >>> Future.traverse_with_limit(["1", "a"], lambda v: Future.run(lambda: int(v)), 2, fail_fast=False).result()
+          Success([Success(1), Failure(invalid literal for int() with base 10: 'a')])
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("Future.traverse_with_limit expects a callable")
+        if not isinstance(max_in_flight, int) or max_in_flight < 1:
+            raise TypeError(
+                "Future.traverse_with_limit expects a positive max_in_flight"
             )
+        iterator = iter(iterable)
+        result = Future(None, None, token)  # type: Future[list]
+        results = []  # type: list
+        pending = {}  # type: dict
+        lock = threading.Lock()
+        in_flight = 0
+        pulled_count = 0
+        exhausted = False
+        error = None  # type: Optional[Exception]
+        pumping = False
+        pump_again = False
+
+        def on_done(index: int, value: Try[B]) -> None:
+            nonlocal in_flight
+            if fail_fast and value.is_failure():
+                result._try_complete(value)  # type: ignore
+                return
+            with lock:
+                in_flight -= 1
+                pending.pop(index, None)
+                item = value.value if fail_fast else value
+                if ordered:
+                    results[index] = item
+                else:
+                    results.append(item)
+            pump()
+
+        def start(index: int, element) -> None:
+            try:
+                future = func(element)
+            except Exception as err:
+                failed = Failure(err)  # type: Try[B]
+                future = Future(lambda cb: cb(failed))
+            with lock:
+                if not future.is_done():
+                    pending[index] = future
+            if result.is_failure():
+                future.cancel()
+            future._on_complete(partial(on_done, index), Dispatch.INLINE)  # type: ignore
+
+        def settle(value: Try[list]) -> None:
+            if value.is_success():
+                return
+            with lock:
+                outstanding = list(pending.values())
+                pending.clear()
+            for future in outstanding:
+                future.cancel()
+
+        def pump() -> None:
+            nonlocal in_flight, pulled_count, exhausted, error, pumping, pump_again
+            with lock:
+                if pumping:
+                    pump_again = True
+                    return
+                pumping = True
+            while True:
+                pulled = None
+                with lock:
+                    if (
+                        result.value is None
+                        and not exhausted
+                        and in_flight < max_in_flight
+                    ):
+                        try:
+                            pulled = (pulled_count, next(iterator))
+                        except StopIteration:
+                            exhausted = True
+                        except Exception as err:
+                            exhausted = True
+                            error = err
+                        else:
+                            in_flight += 1
+                            pulled_count += 1
+                            if ordered:
+                                results.append(None)
+                    if pulled is None:
+                        if pump_again:
+                            pump_again = False
+                            continue
+                        pumping = False
+                        finished = exhausted and in_flight == 0
+                        break
+                start(*pulled)
+            if error is not None:
+                result._try_complete(Failure(error))
+            elif finished:
+                result._try_complete(Success(results))
+
+        result._on_complete(settle, Dispatch.INLINE)  # type: ignore
+        pump()
+        return result
+
+    @staticmethod
+    def race(futures: Iterable["Future[B]"], cancel_losers: bool = True) -> "Future[B]":
+        """Completes with the result of whichever :class:`Future <Future>` completes first.
+
+        :param futures: the futures to race.
+        :param cancel_losers: whether to cancel the other futures once there is a winner.
+          If ``False`` the race only stops listening to them.
+        :rtype: pyEffects.Future
+
+        Usage::
+
+          >>> import time
+          >>> from pyeffects.Future import *
+          >>> def slow():
+          ...   time.sleep(0.2)
+          ...   return "slow"
+          ...
+          >>> Future.race([Future.run(slow), Future.run(lambda: "fast")]).result()
+          Success(fast)
+        """
+        return Future._first("race", futures, lambda value: True, cancel_losers)
+
+    @staticmethod
+    def first_success(
+        futures: Iterable["Future[B]"], cancel_losers: bool = True
+    ) -> "Future[B]":
+        """Completes with the first successful result, or the last failure if all fail.
+
+        :param futures: the futures to race.
+        :param cancel_losers: whether to cancel the other futures once there is a winner.
+          If ``False`` the race only stops listening to them.
+        :rtype: pyEffects.Future
+
+        Usage::
+
+          >>> import time
+          >>> from pyeffects.Future import *
+          >>> def slow():
+          ...   time.sleep(0.1)
+          ...   return "slow"
+          ...
+          >>> failed = Future.run(lambda: int("abc"))
+          >>> Future.first_success([failed, Future.run(slow)]).result()
+          Success(slow)
+        """
+        return Future._first(
+            "first_success", futures, lambda value: value.is_success(), cancel_losers
         )
 
     @staticmethod
-    def traverse(arr):
-        return reduce(
-            lambda acc, elem: acc.flat_map(
-                lambda values: elem.map(lambda value: values + [value])
-            ),
-            arr,
-            Future.of([]),
+    def _first(
+        name: str,
+        futures: Iterable["Future[B]"],
+        accept: Callable[[Try[B]], bool],
+        cancel_losers: bool,
+    ) -> "Future[B]":
+        futures = list(futures)
+        if not futures:
+            raise ValueError("Future.%s expects at least one future" % name)
+        token = next((f.token for f in futures if f.token is not None), None)
+        result = Future(None, None, token)  # type: Future[B]
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def on_done(value: Try[B]) -> None:
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last or accept(value):
+                result._try_complete(value)
+
+        def settle(_: Try[B]) -> None:
+            for future in futures:
+                if cancel_losers:
+                    future.cancel()
+                else:
+                    future._unsubscribe(on_done)  # type: ignore
+
+        result._on_complete(settle, Dispatch.INLINE)  # type: ignore
+        for future in futures:
+            if result.value is not None:
+                break
+            future._on_complete(on_done, Dispatch.INLINE)  # type: ignore
+        if result.value is not None and not cancel_losers:
+            future._unsubscribe(on_done)  # type: ignore
+        return result
+
+    @staticmethod
+    def traverse(
+        arr: Iterable["Future[B]"], token: Optional[CancellationToken] = None
+    ) -> "Future[List[B]]":
+        """Combines futures into one :class:`Future <Future>` of the list of their values.
+
+        Same as :meth:`Future.gather`.
+
+        :param arr: the futures to combine.
+        :param token: optional :class:`CancellationToken` for the result.
+        :rtype: pyEffects.Future
+        """
+        return Future.gather(arr, token)
+
+    @staticmethod
+    def from_asyncio(
+        fut_or_coro, loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> "Future":
+        """Constructs a :class:`Future <Future>` from an asyncio future, task or coroutine.
+
+        :param fut_or_coro: an awaitable future/task, or a coroutine to schedule on ``loop``.
+        :param loop: the event loop the coroutine runs on, defaults to the running loop
+          for coroutines and to the future's own loop otherwise.
+        :rtype: pyEffects.Future
+
+        Usage::
+
+          >>> import asyncio
+          >>> from pyeffects.Future import *
+          >>> async def compute():
+          ...   return 5
+          ...
+          >>> async def main():
+          ...   return await Future.from_asyncio(compute()).map(lambda v: v * v)
+          ...
+          >>> asyncio.run(main())
+          25
+        """
+        if asyncio.iscoroutine(fut_or_coro):
+            target = loop or asyncio.get_running_loop()
+            done = asyncio.run_coroutine_threadsafe(fut_or_coro, target)
+            return Future(
+                lambda cb: done.add_done_callback(lambda d: cb(_try_of_done(d)))
+            )
+        if asyncio.isfuture(fut_or_coro):
+            target = loop or fut_or_coro.get_loop()
+            return Future(
+                lambda cb: target.call_soon_threadsafe(
+                    fut_or_coro.add_done_callback, lambda d: cb(_try_of_done(d))
+                )
+            )
+        raise TypeError("Future.from_asyncio expects an asyncio future or coroutine")
+
+    def to_asyncio(
+        self, loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> asyncio.Future:
+        """Converts this :class:`Future <Future>` into an asyncio future.
+
+        The result is delivered to ``loop`` with ``call_soon_threadsafe`` from the
+        completing thread; no thread is started for it.  Cancelling the asyncio future
+        cancels this future.
+
+        :param loop: the event loop that owns the new future, defaults to the running loop.
+        :rtype: asyncio.Future
+
+        Usage::
+
+          >>> import asyncio
+          >>> from pyeffects.Future import *
+          >>> async def main():
+          ...   return await Future.run(lambda: 5).to_asyncio()
+          ...
+          >>> asyncio.run(main())
+          5
+        """
+        target = loop or asyncio.get_running_loop()
+        aio_future = target.create_future()
+        self._on_complete(
+            partial(target.call_soon_threadsafe, _settle_asyncio, aio_future),  # type: ignore
+            Dispatch.INLINE,
+        )
+        aio_future.add_done_callback(
+            lambda done: self.cancel() if done.cancelled() else None
         )
+        return aio_future
+
+    def __await__(self):
+        return self.to_asyncio().__await__()
 
     def _callback(self, value: Try[A]) -> None:
-        self.value = value  # type: ignore
-        self.semaphore.acquire()
-        self.cache = Some(value)  # type: ignore
-        while len(self.subscribers) > 0:
-            sub = self.subscribers.pop(0)
-            t = threading.Thread(target=sub, args=[value])
-            t.start()
-        self.semaphore.release()
+        self._try_complete(value)
+
+    def _try_complete(self, value: Try[A]) -> bool:
+        with self._lock:
+            if self.value is not None:
+                return False
+            subscribers = self.subscribers
+            if self._sink is not None:
+                self._sink.count(Metrics.PENDING, -1)
+                self._sink.observe(Metrics.SUBSCRIBERS, len(subscribers))
+            self.value = value  # type: ignore
+            self.subscribers = []
+            done_event = self._done_event
+        if done_event is not None:
+            done_event.set()
+        if self.token is not None:
+            self.token._unregister(self)
+        notify = _notify
+        if self._sink is not None and subscribers:
+            notify = partial(_notify_metered, self._sink, time.perf_counter())
+        for sub, dispatch in subscribers:
+            dispatch = dispatch or self.dispatch or _default_dispatch
+            if dispatch is Dispatch.INLINE:
+                _notify_inline(sub, value)
+            elif dispatch is Dispatch.POOLED:
+                _submit(Future.default_executor(), partial(notify, sub, value))
+            else:
+                threading.Thread(target=notify, args=[sub, value]).start()
+        return True
 
     def is_done(self) -> bool:
         """Return is done for :class:`Future <Future>`.
@@ -160,7 +1456,8 @@ class Future(Monad[A]):
           >>> Future.run(error).is_success()
           False
         """
-        return self.value and self.value.is_success()  # type: ignore
+        value = self.value
+        return value is not None and value.is_success()  # type: ignore
 
     def is_failure(self) -> bool:
         """Return is failure for :class:`Future <Future>`.
@@ -170,12 +1467,16 @@ class Future(Monad[A]):
         Usage::
 
           >>> from pyeffects.Future import *
+          >>> import time
           >>> def error():
           ...   raise RuntimeError()
-          >>> Future.run(error).is_failure()
+          >>> failed = Future.run(error)
+          >>> time.sleep(0.1)
+          >>> failed.is_failure()
           True
         """
-        return self.value and self.value.is_failure()  # type: ignore
+        value = self.value
+        return value is not None and value.is_failure()  # type: ignore
 
     def on_complete(self, subscriber: Callable[[A], None]) -> None:
         """Calls a subscriber function when :class:`Future <Future>` completes.
@@ -191,13 +1492,27 @@ class Future(Monad[A]):
           >>> val.on_complete(lambda v: print(v))
           Success(25)
         """
-        self.semaphore.acquire()
-        if self.cache.is_defined():
-            self.semaphore.release()
-            subscriber(self.cache.value)
-        else:
-            self.subscribers.append(subscriber)
-            self.semaphore.release()
+        self._on_complete(subscriber)
+
+    def _on_complete(
+        self, subscriber: Callable[[A], None], dispatch: Optional[Dispatch] = None
+    ) -> None:
+        value = self.value
+        if value is None:
+            with self._lock:
+                value = self.value
+                if value is None:
+                    self.subscribers.append((subscriber, dispatch))
+                    return
+        _run_inline(_call, subscriber, value)  # type: ignore
+
+    def _unsubscribe(self, subscriber: Callable[[A], None]) -> None:
+        with self._lock:
+            self.subscribers = [
+                (sub, dispatch)
+                for sub, dispatch in self.subscribers
+                if sub is not subscriber
+            ]
 
     def on_success(self, subscriber: Callable[[A], None]) -> None:
         """Calls a subscriber function when :class:`Future <Future>` completes successfully.
@@ -215,17 +1530,7 @@ class Future(Monad[A]):
           ...   raise RuntimeError()
           >>> Future.run(error).on_success(lambda _: print(42))
         """
-        self.semaphore.acquire()
-        if self.is_failure():
-            self.semaphore.release()
-            return
-
-        if self.cache.is_defined():
-            self.semaphore.release()
-            subscriber(self.cache.value)
-        else:
-            self.subscribers.append(subscriber)
-            self.semaphore.release()
+        self.on_complete(lambda value: subscriber(value) if value.is_success() else None)  # type: ignore
 
     def on_failure(self, subscriber: Callable[[Exception], None]) -> None:
         """Calls a subscriber function when :class:`Future <Future>` completes with error.
@@ -238,20 +1543,15 @@ class Future(Monad[A]):
           >>> val = Future.of(5).map(lambda v: v * v)
           >>> val.on_failure(lambda v: print(v))
 
+          >>> import time
           >>> def error():
           ...   raise RuntimeError()
-          >>> Future.run(error).on_failure(lambda _: print('ERROR!'))
+          >>> failed = Future.run(error)
+          >>> time.sleep(0.1)
+          >>> failed.on_failure(lambda _: print('ERROR!'))
           ERROR!
         """
-        self.semaphore.acquire()
-        if self.is_success():
-            self.semaphore.release()
-            return
-
-        if self.is_failure():
-            subscriber(self.error())
-
-        self.semaphore.release()
+        self.on_complete(lambda value: subscriber(value.error()) if value.is_failure() else None)  # type: ignore
 
     def __str__(self) -> str:
         return "Future(" + str(self.value) + ")"
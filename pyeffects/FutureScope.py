@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+"""
+pyeffects.FutureScope
+~~~~~~~~~~~~----
+
+This module implements the FutureScope class.
+"""
+from concurrent.futures import CancelledError, InvalidStateError
+from typing import Any, Callable, List, Optional, TypeVar
+from .Future import (
+    CancellationToken,
+    Dispatch,
+    ExecutorLike,
+    Future,
+    _is_executor,
+    _submit,
+)
+from .Try import Failure, Success, Try
+import threading
+
+A = TypeVar("A")
+
+
+class FutureScope:
+    """Ties the futures started in a ``with`` block to that block.
+
+    Every :class:`Future` started with :meth:`run` shares the scope's
+    :class:`CancellationToken`.  With ``cancel_on_failure`` the first failure cancels
+    its siblings.  Leaving the block waits for every started function to return,
+    for at most ``timeout`` seconds after which the rest are cancelled; with
+    ``wait=False``, or when the block raises, everything still pending is cancelled
+    instead.  Functions that are already running should check
+    :meth:`Future.raise_if_cancelled` to stop early.
+
+    After the block, :attr:`result` holds ``Success`` of the values of the futures
+    in the order they were started, or the first ``Failure``.
+
+    :param cancel_on_failure: whether the first failure cancels the other futures.
+    :param wait: whether leaving the block waits for the futures or cancels them.
+    :param timeout: optional number of seconds to wait when leaving the block.
+
+    Usage::
+
+      >>> from pyeffects.FutureScope import *
+      >>> with FutureScope() as scope:
+      ...   first = scope.run(lambda: 1)
+      ...   second = scope.run(lambda: 2)
+      ...
+      >>> scope.result
+      Success([1, 2])
+    """
+
+    def __init__(
+        self,
+        cancel_on_failure: bool = True,
+        wait: bool = True,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.cancel_on_failure = cancel_on_failure
+        self.wait = wait
+        self.timeout = timeout
+        self.token = CancellationToken()
+        self.futures = []  # type: List[Future]
+        self.result = None  # type: Optional[Try[List[Any]]]
+        self._error = None  # type: Optional[Exception]
+        self._active = 0
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+
+    def __enter__(self) -> "FutureScope":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None or not self.wait:
+            self.cancel()
+        if not self.join(self.timeout):
+            self.cancel()
+        with self._condition:
+            self._closed = True
+        self.result = self._aggregate(exc)
+
+    def run(
+        self,
+        func: Callable[[], A],
+        executor: Optional[ExecutorLike] = None,
+        dispatch: Optional[Dispatch] = None,
+    ) -> Future[A]:
+        """Starts ``func`` like :meth:`Future.run` as a child of the scope.
+
+        :param func: function to run asynchronously.
+        :param executor: optional ``concurrent.futures.Executor`` or scheduler callable
+          to run ``func`` on, defaults to :meth:`Future.default_executor`
+        :param dispatch: optional :class:`Dispatch` for subscribers of the new future
+        :raises concurrent.futures.InvalidStateError: if the scope has been exited.
+        :rtype: pyEffects.Future
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("FutureScope.run expects a callable")
+        if executor is None:
+            executor = Future.default_executor()
+        elif not _is_executor(executor):
+            raise TypeError(
+                "FutureScope.run expects an Executor or a callable scheduler"
+            )
+        with self._condition:
+            if self._closed:
+                raise InvalidStateError("FutureScope is closed")
+            future = Future(None, dispatch, self.token)  # type: Future[A]
+            self.futures.append(future)
+            self._active += 1
+        future._on_complete(self._on_done, Dispatch.INLINE)  # type: ignore
+        _submit(executor, self._track(future._task(func)))  # type: ignore
+        return future
+
+    def cancel(self) -> None:
+        """Cancels every pending :class:`Future` of the scope."""
+        self.token.cancel()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until every function started in the scope has returned.
+
+        :param timeout: optional number of seconds to wait for.
+        :rtype: bool, whether every function returned in time
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._active == 0, timeout)
+
+    def _track(self, task: Callable[[], None]) -> Callable[[], None]:
+        def tracked() -> None:
+            try:
+                task()
+            finally:
+                with self._condition:
+                    self._active -= 1
+                    if self._active == 0:
+                        self._condition.notify_all()
+
+        return tracked
+
+    def _on_done(self, value: Try) -> None:
+        if value.is_success() or isinstance(value.error(), CancelledError):
+            return
+        with self._condition:
+            first = self._error is None
+            if first:
+                self._error = value.error()
+        if first and self.cancel_on_failure:
+            self.cancel()
+
+    def _aggregate(self, exc: Optional[BaseException]) -> Try[List[Any]]:
+        if isinstance(exc, Exception):
+            return Failure(exc)
+        if self._error is not None:
+            return Failure(self._error)
+        values = []
+        for future in self.futures:
+            value = future.value
+            if value is None:
+                return Failure(CancelledError())
+            if value.is_failure():
+                return value
+            values.append(value.value)
+        return Success(values)
+
+    def __str__(self) -> str:
+        return "FutureScope(" + str(self.result) + ")"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+"""
+pyeffects.Metrics
+~~~~~~~~~~~~----
+
+This module implements the opt-in instrumentation of the Future runtime.
+
+The runtime reports to the sink set with :func:`set_sink`:
+
+* ``future.pending``: counter moved up when a :class:`Future` is created and down
+  when it completes, so its total is the number of pending futures.
+* ``future.running``: counter moved up and down around the functions passed to
+  ``Future.run``, so its total is the number of busy worker threads.
+* ``future.queue_time``: seconds between submitting a function and a worker
+  starting it.
+* ``future.run_time``: seconds spent running the function.
+* ``future.subscribers``: number of subscribers notified when a future completes.
+* ``future.notify_time``: seconds between a future completing and a pooled or
+  threaded subscriber starting.
+
+While no sink is set, the runtime only pays for one attribute check per event.
+"""
+from bisect import bisect_left
+from typing import Dict, List, Optional
+import threading
+
+PENDING = "future.pending"
+RUNNING = "future.running"
+QUEUE_TIME = "future.queue_time"
+RUN_TIME = "future.run_time"
+SUBSCRIBERS = "future.subscribers"
+NOTIFY_TIME = "future.notify_time"
+
+
+class MetricsSink:
+    """Receives the events of the Future runtime.
+
+    Subclasses override :meth:`count` and :meth:`observe` to export the events, for
+    example to StatsD or Prometheus.  Both are called on the threads running the
+    futures, so they should be cheap and thread-safe.
+    """
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Adds ``value`` to the counter ``name``.
+
+        :param name: the metric name.
+        :param value: the amount to add, negative to move the counter down.
+        """
+
+    def observe(self, name: str, value: float) -> None:
+        """Records ``value`` in the histogram ``name``.
+
+        :param name: the metric name.
+        :param value: the observed value.
+        """
+
+
+class Histogram:
+    """Counts observations in buckets with fixed upper bounds.
+
+    A histogram is not thread-safe on its own; :class:`InMemorySink` only updates
+    it while holding its lock.
+
+    :param bounds: sorted upper bounds of the buckets, an overflow bucket is added.
+
+    Usage::
+
+      >>> from pyeffects.Metrics import *
+      >>> histogram = Histogram([1, 10, 100])
+      >>> for value in [0.5, 5, 7, 50]:
+      ...   histogram.observe(value)
+      ...
+      >>> histogram.count, histogram.buckets
+      (4, [1, 2, 1, 0])
+      >>> histogram.percentile(0.5)
+      10
+    """
+
+    def __init__(self, bounds: List[float]) -> None:
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None  # type: Optional[float]
+        self.max = None  # type: Optional[float]
+
+    def observe(self, value: float) -> None:
+        """Records ``value``.
+
+        :param value: the observed value.
+        """
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Returns the upper bound of the bucket holding the ``q`` quantile.
+
+        :param q: the quantile, between 0 and 1.
+        :rtype: float, or ``None`` when nothing was observed; the largest observed
+          value for the overflow bucket
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+        return self.max
+
+    def __str__(self) -> str:
+        return "Histogram(count=%d, total=%s)" % (self.count, self.total)
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+DEFAULT_BOUNDS = [0.00001 * 2**i for i in range(20)]
+COUNT_BOUNDS = [0] + [2**i for i in range(11)]
+
+
+class InMemorySink(MetricsSink):
+    """Keeps counters and histograms in memory, for tests and periodic export.
+
+    :param bounds: bucket upper bounds for histograms of durations, defaults to powers
+      of two from 10 microseconds to about 5 seconds.
+    :param count_bounds: bucket upper bounds for ``future.subscribers``, defaults to
+      zero and powers of two up to 1024.
+
+    Usage::
+
+      >>> from pyeffects.Metrics import *
+      >>> from pyeffects.Future import Future
+      >>> sink = InMemorySink()
+      >>> set_sink(sink)
+      >>> Future.run(lambda: 5).result()
+      Success(5)
+      >>> set_sink(None)
+      >>> sink.counter(PENDING), sink.histogram(RUN_TIME).count
+      (0, 1)
+    """
+
+    def __init__(
+        self,
+        bounds: Optional[List[float]] = None,
+        count_bounds: Optional[List[float]] = None,
+    ) -> None:
+        self.bounds = bounds or DEFAULT_BOUNDS
+        self.count_bounds = count_bounds or COUNT_BOUNDS
+        self.counters = {}  # type: Dict[str, int]
+        self.histograms = {}  # type: Dict[str, Histogram]
+        self._lock = threading.Lock()
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(self._bounds(name))
+            histogram.observe(value)
+
+    def counter(self, name: str) -> int:
+        """Returns the total of the counter ``name``.
+
+        :rtype: int
+        """
+        return self.counters.get(name, 0)
+
+    def histogram(self, name: str) -> Histogram:
+        """Returns the histogram ``name``, empty if nothing was observed.
+
+        :rtype: pyEffects.Histogram
+        """
+        return self.histograms.get(name) or Histogram(self._bounds(name))
+
+    def _bounds(self, name: str) -> List[float]:
+        return self.count_bounds if name == SUBSCRIBERS else self.bounds
+
+    def reset(self) -> None:
+        """Forgets every counter and histogram."""
+        with self._lock:
+            self.counters = {}
+            self.histograms = {}
+
+
+_sink = None  # type: Optional[MetricsSink]
+
+
+def sink() -> Optional[MetricsSink]:
+    """Returns the sink the Future runtime reports to, or ``None`` when disabled.
+
+    :rtype: pyEffects.MetricsSink
+    """
+    return _sink
+
+
+def set_sink(new_sink: Optional[MetricsSink]) -> None:
+    """Sets the sink the Future runtime reports to, ``None`` disables reporting.
+
+    Futures report to the sink that was set when they were created.
+
+    :param new_sink: the :class:`MetricsSink` to report to.
+    """
+    global _sink
+    if new_sink is not None and not isinstance(new_sink, MetricsSink):
+        raise TypeError("set_sink expects a MetricsSink")
+    _sink = new_sink
@@ -5,8 +5,10 @@ B = TypeVar("B")
 
 
 class Monad(Generic[A]):
+    __slots__ = ()
     value: A
     biased: bool
+    _trusted = False
 
     @staticmethod
     def of(x: B) -> "Monad[B]":
@@ -15,8 +17,39 @@ class Monad(Generic[A]):
     def flat_map(self, f: Callable[[A], "Monad[B]"]) -> "Monad[B]":
         raise NotImplementedError("flat_map method needs to be implemented")
 
+    @classmethod
+    def tail_rec_m(cls, init: B, step: Callable[[B], "Monad"]) -> "Monad":
+        """Runs a monadic loop in constant stack depth.
+
+        ``step`` is called with the current state and returns the monad wrapping an
+        ``Either``: ``Left(state)`` continues the loop with a new state and
+        ``Right(result)`` ends it.  The loop stops early when ``step`` returns an empty,
+        left or failed monad.
+
+        :param init: the initial state of the loop.
+        :param step: function returning a monad of ``Left(state)`` or ``Right(result)``.
+
+        Usage::
+
+          >>> from pyeffects.Option import *
+          >>> from pyeffects.Either import Left, Right
+          >>> Option.tail_rec_m(0, lambda n: Some(Left(n + 1) if n < 1000000 else Right(n)))
+          Some(1000000)
+        """
+        if not hasattr(step, "__call__"):
+            raise TypeError("tail_rec_m expects a callable")
+        state = init
+        while True:
+            result = step(state)
+            if not result.biased:
+                return result
+            either = result.value
+            if either.is_right():  # type: ignore
+                return result.of(either.value)  # type: ignore
+            state = either.value  # type: ignore
+
     def map(self, func: Callable[[A], B]) -> "Monad[B]":
-        if not hasattr(func, "__call__"):
+        if not (self._trusted or hasattr(func, "__call__")):
             raise TypeError("map expects a callable")
 
         def wrapped(x: A) -> "Monad[B]":  # type: ignore
@@ -25,7 +58,7 @@ class Monad(Generic[A]):
         return self.flat_map(wrapped)
 
     def foreach(self, func: Callable[[A], B]) -> None:
-        if not hasattr(func, "__call__"):
+        if not (self._trusted or hasattr(func, "__call__")):
             raise TypeError("foreach expects a callable")
         self.map(func)
 
@@ -41,7 +74,7 @@ class Monad(Generic[A]):
             return v
 
     def or_else_supply(self, func: Callable[[], A]) -> A:
-        if not hasattr(func, "__call__"):
+        if not (self._trusted or hasattr(func, "__call__")):
             raise TypeError("or_else_supply expects a callable")
         if self.biased:
             return self.value
@@ -59,3 +92,32 @@ class Monad(Generic[A]):
 
 def identity(value):
     return value
+
+
+def set_trusted(trusted: bool) -> None:
+    """Turns the checks that functions passed to monads are callable off or on.
+
+    In trusted mode ``map``, ``flat_map``, ``filter``, ``foreach`` and
+    ``or_else_supply`` of :class:`Option`, :class:`Either` and :class:`Try` call
+    their argument without checking it first, so passing something that is not
+    callable raises from the call itself instead of the ``TypeError`` of the check.
+
+    :param trusted: whether to skip the checks.
+
+    Usage::
+
+      >>> from pyeffects.Monad import set_trusted, is_trusted
+      >>> set_trusted(True)
+      >>> is_trusted()
+      True
+      >>> set_trusted(False)
+    """
+    Monad._trusted = bool(trusted)
+
+
+def is_trusted() -> bool:
+    """Returns whether the callable checks are turned off.
+
+    :rtype: bool
+    """
+    return Monad._trusted
@@ -14,6 +14,8 @@ B = TypeVar("B")
 
 
 class Option(Monad[A]):
+    __slots__ = ()
+
     @staticmethod
     def of(value: B) -> "Option[B]":
         """Constructs a :class:`Option <Option>`.
@@ -45,13 +47,54 @@ class Option(Monad[A]):
           >>> Some(5).flat_map(lambda v: Some(v * v))
           Some(25)
         """
-        if not hasattr(func, "__call__"):
+        if not (self._trusted or hasattr(func, "__call__")):
             raise TypeError("Option.flat_map expects a callable")
-        if self.is_defined():
+        if self.biased:
             return func(self.value)
         else:
             return empty
 
+    def map(self, func: Callable[[A], B]) -> "Option[B]":
+        """Maps a function over :class:`Option <Option>`, ``None`` results are empty.
+
+        :param func: function to apply to the value.
+        :rtype: pyEffects.Option
+
+        Usage::
+
+          >>> from pyeffects.Option import *
+          >>> Some(5).map(lambda v: v * v)
+          Some(25)
+          >>> Some(5).map(lambda v: None)
+          Empty()
+        """
+        if not (self._trusted or hasattr(func, "__call__")):
+            raise TypeError("map expects a callable")
+        if self.biased:
+            value = func(self.value)
+            return empty if value is None else Some(value)
+        return empty
+
+    def filter(self, func: Callable[[A], bool]) -> "Option[A]":
+        """Keeps the value of :class:`Option <Option>` only if ``func`` holds for it.
+
+        :param func: predicate to test the value with.
+        :rtype: pyEffects.Option
+
+        Usage::
+
+          >>> from pyeffects.Option import *
+          >>> Some(5).filter(lambda v: v > 3)
+          Some(5)
+          >>> Some(5).filter(lambda v: v > 7)
+          Empty()
+        """
+        if not (self._trusted or hasattr(func, "__call__")):
+            raise TypeError("Option.filter expects a callable")
+        if self.biased and func(self.value):
+            return self
+        return empty
+
     def is_defined(self) -> bool:
         """Returns if the :class:`Option <Option>` is defined or not.
 
@@ -88,9 +131,11 @@ class Option(Monad[A]):
 
 
 class Some(Option[A]):
+    __slots__ = ("value",)
+    biased = True
+
     def __init__(self, value: A) -> None:
         self.value = value
-        self.biased = True
 
     def __str__(self) -> str:
         return "Some(" + str(self.value) + ")"
@@ -100,9 +145,15 @@ class Some(Option[A]):
 
 
 class Empty(Option[A]):
-    def __init__(self) -> None:
-        self.value = None  # type: ignore
-        self.biased = False
+    __slots__ = ()
+    value = None  # type: ignore
+    biased = False
+
+    def __new__(cls) -> "Empty[A]":
+        return empty
+
+    def __reduce__(self) -> tuple:
+        return Empty, ()
 
     def __str__(self) -> str:
         return "Empty()"
@@ -111,4 +162,4 @@ class Empty(Option[A]):
         return self.__str__()
 
 
-empty = Empty()  # type: ignore
+empty = object.__new__(Empty)  # type: Empty
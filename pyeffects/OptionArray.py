@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+"""
+pyeffects.OptionArray
+~~~~~~~~~~~~----
+
+This module implements the OptionArray class.
+
+OptionArray needs NumPy, which is an optional dependency: ``pip install pyeffects[numpy]``.
+NumPy is imported when an OptionArray is first created, so importing this module
+does not require it.
+"""
+from typing import Any, Callable, Iterable, List, Optional
+from .Option import Option, Some, empty
+
+
+def _numpy() -> Any:
+    try:
+        import numpy  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "OptionArray requires numpy, install it with: pip install pyeffects[numpy]"
+        )
+    return numpy
+
+
+class OptionArray:
+    """A column of optional values stored as a NumPy masked array.
+
+    The values are kept in one NumPy array and whether each of them is defined in a
+    boolean mask, instead of a :class:`Some` or ``Empty`` object per element.
+    :meth:`map`, :meth:`filter` and :meth:`flat_map` take functions working on whole
+    arrays, such as NumPy ufuncs, and apply them to every defined value at once.
+    Values that a function leaves masked, like ``numpy.ma.log`` of a negative
+    number, become empty, the way ``Option.map`` turns ``None`` into ``Empty``.
+
+    :param values: array-like of the values, the ones at empty positions are ignored.
+    :param defined: optional array-like of booleans, ``True`` where a value is
+      defined; defaults to every value being defined.
+
+    Usage::
+
+      >>> import numpy
+      >>> from pyeffects.OptionArray import *
+      >>> prices = OptionArray.from_options([Some(1.5), empty, Some(4.0)])
+      >>> prices.map(numpy.sqrt).filter(lambda v: v > 1.5).to_options()
+      [Empty(), Empty(), Some(2.0)]
+      >>> prices.get_or_else(0.0)
+      array([1.5, 0. , 4. ])
+    """
+
+    def __init__(self, values: Any, defined: Optional[Any] = None) -> None:
+        numpy = _numpy()
+        mask = numpy.ma.nomask if defined is None else ~numpy.asarray(defined, bool)
+        self.data = numpy.ma.array(values, mask=mask)
+        if self.data.ndim != 1:
+            raise TypeError("OptionArray expects a one dimensional array")
+
+    @staticmethod
+    def _of(data: Any) -> "OptionArray":
+        array = OptionArray.__new__(OptionArray)
+        array.data = data
+        return array
+
+    @staticmethod
+    def from_values(
+        values: Iterable[Any], dtype: Optional[Any] = None
+    ) -> "OptionArray":
+        """Constructs a :class:`OptionArray <OptionArray>` where ``None`` values are empty.
+
+        :param values: the values, ``None`` for empty ones.
+        :param dtype: optional NumPy dtype of the values.
+        :rtype: pyEffects.OptionArray
+
+        Usage::
+
+          >>> from pyeffects.OptionArray import *
+          >>> OptionArray.from_values([1, None, 3])
+          OptionArray([1 -- 3])
+        """
+        numpy = _numpy()
+        values = list(values)
+        defined = numpy.fromiter((v is not None for v in values), bool, len(values))
+        filled = [0 if v is None else v for v in values]
+        return OptionArray(numpy.array(filled, dtype=dtype), defined)
+
+    @staticmethod
+    def from_options(
+        options: Iterable[Option], dtype: Optional[Any] = None
+    ) -> "OptionArray":
+        """Constructs a :class:`OptionArray <OptionArray>` from a list of :class:`Option`.
+
+        ``Some(None)`` is stored as an empty value.
+
+        :param options: the options.
+        :param dtype: optional NumPy dtype of the values.
+        :rtype: pyEffects.OptionArray
+        """
+        return OptionArray.from_values(
+            [option.value if option.biased else None for option in options], dtype
+        )
+
+    def to_options(self) -> List[Option]:
+        """Returns the values as a list of :class:`Option`.
+
+        :rtype: list
+        """
+        defined = self.is_defined().tolist()
+        return [
+            Some(value) if ok else empty
+            for value, ok in zip(self.data.data.tolist(), defined)
+        ]
+
+    def map(self, func: Callable[[Any], Any]) -> "OptionArray":
+        """Applies ``func`` to the array of values, typically a NumPy ufunc.
+
+        :param func: function taking and returning an array of the same length.
+        :rtype: pyEffects.OptionArray
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("OptionArray.map expects a callable")
+        numpy = _numpy()
+        result = numpy.ma.asarray(func(self.data))
+        if result.shape != self.data.shape:
+            raise TypeError("OptionArray.map expects the function to keep the length")
+        return OptionArray._of(
+            numpy.ma.array(result, mask=self.data.mask | result.mask)
+        )
+
+    def filter(self, func: Callable[[Any], Any]) -> "OptionArray":
+        """Empties the values for which ``func`` does not hold.
+
+        :param func: predicate taking an array of values and returning an array of bool.
+        :rtype: pyEffects.OptionArray
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("OptionArray.filter expects a callable")
+        numpy = _numpy()
+        keep = numpy.ma.filled(func(self.data), False).astype(bool)
+        return OptionArray._of(
+            numpy.ma.array(self.data.data, mask=self.data.mask | ~keep)
+        )
+
+    def flat_map(self, func: Callable[[Any], "OptionArray"]) -> "OptionArray":
+        """Applies ``func`` to the array of values, keeping only values defined in both.
+
+        :param func: function taking an array of values and returning an :class:`OptionArray` of the same length.
+        :rtype: pyEffects.OptionArray
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("OptionArray.flat_map expects a callable")
+        result = func(self.data)
+        if not isinstance(result, OptionArray) or len(result) != len(self):
+            raise TypeError(
+                "OptionArray.flat_map expects an OptionArray of the same length"
+            )
+        numpy = _numpy()
+        return OptionArray._of(
+            numpy.ma.array(result.data.data, mask=self.data.mask | result.data.mask)
+        )
+
+    def get_or_else(self, v: Any) -> Any:
+        """Returns a NumPy array of the values with ``v`` at the empty positions.
+
+        :param v: value to use for empty positions.
+        :rtype: numpy.ndarray
+        """
+        return self.data.filled(v)
+
+    def is_defined(self) -> Any:
+        """Returns a NumPy array of bool, ``True`` where a value is defined.
+
+        :rtype: numpy.ndarray
+        """
+        return ~_numpy().ma.getmaskarray(self.data)
+
+    def is_empty(self) -> Any:
+        """Returns a NumPy array of bool, ``True`` where the value is empty.
+
+        :rtype: numpy.ndarray
+        """
+        return _numpy().ma.getmaskarray(self.data)
+
+    def count(self) -> int:
+        """Returns the number of defined values.
+
+        :rtype: int
+        """
+        return int(self.data.count())
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: int) -> Option:
+        if _numpy().ma.getmaskarray(self.data)[index]:
+            return empty
+        return Some(self.data.data.item(index))
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, OptionArray) and self.to_options() == other.to_options()
+        )
+
+    def __str__(self) -> str:
+        return "OptionArray(" + str(self.data) + ")"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+"""
+pyeffects.Pipeline
+~~~~~~~~~~~~----
+
+This module implements the Pipeline class.
+"""
+from typing import Any, Callable, Generic, Iterable, List, Optional, Tuple, TypeVar
+from .Either import Left, Right, right_none
+from .Monad import Monad
+from .Option import Some, empty
+from .Try import Failure, Success, success_none
+
+A = TypeVar("A")
+B = TypeVar("B")
+C = TypeVar("C")
+
+_MAP = 0
+_FILTER = 1
+_FLAT_MAP = 2
+
+Step = Tuple[int, Callable[[Any], Any], Any]
+
+
+def _compile_option(steps: Tuple[Step, ...]) -> Callable[[Any], Monad]:
+    def run(value):
+        if value is None:
+            return empty
+        for kind, func, _ in steps:
+            if kind == _MAP:
+                value = func(value)
+                if value is None:
+                    return empty
+            elif kind == _FILTER:
+                if not func(value):
+                    return empty
+            else:
+                result = func(value)
+                if not result.biased:
+                    return result
+                value = result.value
+        return Some(value)
+
+    return run
+
+
+def _compile_either(steps: Tuple[Step, ...]) -> Callable[[Any], Monad]:
+    def run(value):
+        for kind, func, otherwise in steps:
+            if kind == _MAP:
+                value = func(value)
+            elif kind == _FILTER:
+                if not func(value):
+                    return Left(otherwise)
+            else:
+                result = func(value)
+                if not result.biased:
+                    return result
+                value = result.value
+        return right_none if value is None else Right(value)
+
+    return run
+
+
+def _compile_try(steps: Tuple[Step, ...]) -> Callable[[Any], Monad]:
+    def run(value):
+        try:
+            for kind, func, _ in steps:
+                if kind == _MAP:
+                    value = func(value)
+                    if hasattr(value, "__call__"):  # like Try.map, through Try.of
+                        value = value()
+                elif kind == _FILTER:
+                    if not func(value):
+                        return Failure(
+                            ValueError("Predicate does not hold for " + str(value))
+                        )
+                else:
+                    result = func(value)
+                    if not result.biased:
+                        return result
+                    value = result.value
+        except Exception as err:
+            return Failure(err)
+        return success_none if value is None else Success(value)
+
+    return run
+
+
+class Pipeline(Generic[A, B]):
+    """A reusable chain of ``map``, ``filter`` and ``flat_map`` steps run as one function.
+
+    A pipeline is built once with :meth:`of_option`, :meth:`of_either` or
+    :meth:`of_try` and the same methods as the containers, then called with plain
+    values.  Calling it runs every step on the value and wraps only the final result,
+    so no intermediate ``Some``, ``Right`` or ``Success`` is created, and it stops at
+    the first step that empties, fails or returns a ``Left``.  Functions are checked
+    to be callable when the pipeline is built, not on every call.
+
+    Building a step returns a new pipeline, so a pipeline can be shared and extended.
+    A pipeline gives the same result as the chain of container calls, except that Try
+    pipelines turn exceptions raised by any step into a ``Failure``, like
+    :meth:`Try.of`, where ``Try.map`` and ``Try.flat_map`` let them propagate.
+
+    Usage::
+
+      >>> from pyeffects.Pipeline import *
+      >>> square_evens = Pipeline.of_option().filter(lambda v: v % 2 == 0).map(lambda v: v * v)
+      >>> square_evens(4), square_evens(3), square_evens(None)
+      (Some(16), Empty(), Empty())
+      >>> square_evens.apply_all(range(5))
+      [Some(0), Empty(), Some(4), Empty(), Some(16)]
+    """
+
+    def __init__(
+        self,
+        family: str,
+        compiler: Callable[[Tuple[Step, ...]], Callable[[Any], Monad]],
+        steps: Tuple[Step, ...] = (),
+    ) -> None:
+        self.family = family
+        self.steps = steps
+        self._compiler = compiler
+        self._compiled = None  # type: Optional[Callable[[A], Monad]]
+
+    @staticmethod
+    def of_option() -> "Pipeline[Any, Any]":
+        """Starts a pipeline returning :class:`Option <Option>`; ``None`` values are empty.
+
+        :rtype: pyEffects.Pipeline
+        """
+        return Pipeline("Option", _compile_option)
+
+    @staticmethod
+    def of_either() -> "Pipeline[Any, Any]":
+        """Starts a pipeline returning :class:`Either <Either>`; values start as ``Right``.
+
+        :rtype: pyEffects.Pipeline
+        """
+        return Pipeline("Either", _compile_either)
+
+    @staticmethod
+    def of_try() -> "Pipeline[Any, Any]":
+        """Starts a pipeline returning :class:`Try <Try>`; values start as ``Success``.
+
+        :rtype: pyEffects.Pipeline
+        """
+        return Pipeline("Try", _compile_try)
+
+    def map(self, func: Callable[[B], C]) -> "Pipeline[A, C]":
+        """Adds a step applying ``func`` to the value.
+
+        :param func: function to apply to the value.
+        :rtype: pyEffects.Pipeline
+        """
+        return self._add(_MAP, func, None)
+
+    def filter(
+        self, func: Callable[[B], bool], otherwise: Any = None
+    ) -> "Pipeline[A, B]":
+        """Adds a step keeping the value only if ``func`` holds for it.
+
+        :param func: predicate to test the value with.
+        :param otherwise: left value used by Either pipelines when the predicate
+          does not hold.
+        :rtype: pyEffects.Pipeline
+        """
+        return self._add(_FILTER, func, otherwise)
+
+    def flat_map(self, func: Callable[[B], Monad[C]]) -> "Pipeline[A, C]":
+        """Adds a step applying ``func``, which returns a container of the pipeline's kind.
+
+        :param func: function returning an Option, Either or Try.
+        :rtype: pyEffects.Pipeline
+        """
+        return self._add(_FLAT_MAP, func, None)
+
+    def compile(self) -> Callable[[A], Monad[B]]:
+        """Returns the function running every step of the pipeline on a value.
+
+        :rtype: function
+        """
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = self._compiler(self.steps)
+        return compiled
+
+    def apply_all(self, values: Iterable[A]) -> List[Monad[B]]:
+        """Runs the pipeline on every value.
+
+        :param values: the values to run the pipeline on.
+        :rtype: list
+        """
+        return list(map(self.compile(), values))
+
+    def __call__(self, value: A) -> Monad[B]:
+        return self.compile()(value)
+
+    def _add(self, kind: int, func: Callable, extra: Any) -> "Pipeline":
+        if not hasattr(func, "__call__"):
+            raise TypeError("Pipeline steps expect a callable")
+        return Pipeline(
+            self.family, self._compiler, self.steps + ((kind, func, extra),)
+        )
+
+    def __str__(self) -> str:
+        names = ["map", "filter", "flat_map"]
+        return (
+            "Pipeline("
+            + ", ".join([self.family] + [names[kind] for kind, _, _ in self.steps])
+            + ")"
+        )
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""
+pyeffects.Promise
+~~~~~~~~~~~~----
+
+This module implements the Promise class.
+"""
+from concurrent.futures import InvalidStateError
+from typing import Generic, Optional, TypeVar
+from .Future import CancellationToken, Dispatch, Future
+from .Try import Failure, Success, Try
+
+A = TypeVar("A")
+
+
+class Promise(Generic[A]):
+    """The write side of a :class:`Future <Future>` that is completed from outside.
+
+    Use a :class:`Promise` to bridge callback-based libraries into a :class:`Future`
+    without wrapping the completion in a closure.  A promise can only be completed
+    once.
+
+    Usage::
+
+      >>> from pyeffects.Promise import *
+      >>> promise = Promise()
+      >>> promise.future
+      Future(None)
+      >>> promise.success(5)
+      >>> promise.future
+      Future(Success(5))
+    """
+
+    def __init__(
+        self,
+        dispatch: Optional[Dispatch] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> None:
+        self.future = Future(None, dispatch, token)  # type: Future[A]
+
+    def try_complete(self, value: Try[A]) -> bool:
+        """Completes the :class:`Promise <Promise>` with a result, unless it is already completed.
+
+        :param value: the ``Success`` or ``Failure`` to complete the future with.
+        :rtype: bool, whether this call completed the promise
+
+        Usage::
+
+          >>> from pyeffects.Promise import *
+          >>> promise = Promise()
+          >>> promise.try_complete(Success(5))
+          True
+          >>> promise.try_complete(Success(6))
+          False
+          >>> promise.future
+          Future(Success(5))
+        """
+        if not isinstance(value, Try):
+            raise TypeError("Promise.try_complete expects a Try")
+        return self.future._try_complete(value)
+
+    def complete(self, value: Try[A]) -> None:
+        """Completes the :class:`Promise <Promise>` with a result.
+
+        :param value: the ``Success`` or ``Failure`` to complete the future with.
+        :raises concurrent.futures.InvalidStateError: if the promise is already completed.
+
+        Usage::
+
+          >>> from pyeffects.Promise import *
+          >>> promise = Promise()
+          >>> promise.complete(Failure(RuntimeError("failed")))
+          >>> promise.future
+          Future(Failure(failed))
+        """
+        if not self.try_complete(value):
+            raise InvalidStateError("Promise is already completed")
+
+    def success(self, value: A) -> None:
+        """Completes the :class:`Promise <Promise>` with a successful value.
+
+        :param value: the value to complete the future with.
+        :raises concurrent.futures.InvalidStateError: if the promise is already completed.
+        """
+        self.complete(Success(value))
+
+    def failure(self, err: Exception) -> None:
+        """Completes the :class:`Promise <Promise>` with an error.
+
+        :param err: the exception to complete the future with.
+        :raises concurrent.futures.InvalidStateError: if the promise is already completed.
+        """
+        self.complete(Failure(err))
+
+    def is_completed(self) -> bool:
+        """Returns if the :class:`Promise <Promise>` has been completed.
+
+        :rtype: bool
+        """
+        return self.future.is_done()
+
+    def __str__(self) -> str:
+        return "Promise(" + str(self.future.value) + ")"
+
+    def __repr__(self) -> str:
+        return self.__str__()
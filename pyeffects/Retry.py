@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+"""
+pyeffects.Retry
+~~~~~~~~~~~~----
+
+This module implements the RetryPolicy used by Try.retry and Future.retry.
+"""
+from enum import Enum
+from typing import List, Optional, Type
+import random
+
+
+class Jitter(Enum):
+    """How a :class:`RetryPolicy <RetryPolicy>` randomizes the delay between attempts.
+
+    * ``NONE`` waits the exponential backoff delay exactly.
+    * ``FULL`` waits a random delay between zero and the backoff delay.
+    * ``DECORRELATED`` waits a random delay between ``base_delay`` and three times
+      the previous delay, so retries of many callers spread out over time.
+    """
+
+    NONE = "none"
+    FULL = "full"
+    DECORRELATED = "decorrelated"
+
+
+class RetryPolicy:
+    """Describes how often and how long to wait before retrying a failed call.
+
+    :param max_attempts: total number of calls, including the first one.
+    :param base_delay: seconds to wait before the first retry.
+    :param max_delay: upper bound in seconds for any delay.
+    :param multiplier: factor the delay grows by after every retry.
+    :param jitter: the :class:`Jitter` applied to every delay.
+    :param retry_on: list of exception classes to retry, like ``Try.recovers``;
+      defaults to retrying every ``Exception``.
+
+    Usage::
+
+      >>> from pyeffects.Retry import *
+      >>> policy = RetryPolicy(max_attempts=4, base_delay=0.1, jitter=Jitter.NONE)
+      >>> [policy.next_delay(attempt) for attempt in range(1, 4)]
+      [0.1, 0.2, 0.4]
+      >>> policy.should_retry(RuntimeError("failed"), 1)
+      True
+      >>> policy.should_retry(RuntimeError("failed"), 4)
+      False
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 10.0,
+        multiplier: float = 2.0,
+        jitter: Jitter = Jitter.FULL,
+        retry_on: Optional[List[Type[Exception]]] = None,
+    ) -> None:
+        if not isinstance(max_attempts, int) or max_attempts < 1:
+            raise TypeError("RetryPolicy expects max_attempts to be a positive int")
+        if base_delay < 0 or max_delay < base_delay:
+            raise TypeError("RetryPolicy expects 0 <= base_delay <= max_delay")
+        if multiplier < 1:
+            raise TypeError("RetryPolicy expects multiplier to be at least 1")
+        if not isinstance(jitter, Jitter):
+            raise TypeError("RetryPolicy expects a Jitter")
+        if retry_on is None:
+            retry_on = [Exception]
+        elif not isinstance(retry_on, list):
+            raise TypeError("RetryPolicy expects a list of errors for retry_on")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retry_on = retry_on
+
+    def should_retry(self, err: Exception, attempt: int) -> bool:
+        """Returns if a call that failed with ``err`` on its ``attempt``-th try should be retried.
+
+        :param err: the exception the call failed with.
+        :param attempt: number of calls made so far, starting at 1.
+        :rtype: bool
+        """
+        return attempt < self.max_attempts and any(
+            [isinstance(err, e) for e in self.retry_on]
+        )
+
+    def next_delay(self, attempt: int, previous: Optional[float] = None) -> float:
+        """Returns the seconds to wait before the next call.
+
+        :param attempt: number of calls made so far, starting at 1.
+        :param previous: the delay waited before the last call, used by ``DECORRELATED``.
+        :rtype: float
+        """
+        if self.jitter is Jitter.DECORRELATED:
+            upper = (previous or self.base_delay) * 3
+            return min(self.max_delay, random.uniform(self.base_delay, upper))
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        if self.jitter is Jitter.FULL:
+            return random.uniform(0, delay)
+        return delay
+
+    def __str__(self) -> str:
+        return (
+            "RetryPolicy(max_attempts=%d, base_delay=%s, max_delay=%s, jitter=%s)"
+            % (
+                self.max_attempts,
+                self.base_delay,
+                self.max_delay,
+                self.jitter.value,
+            )
+        )
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,830 @@
+# -*- coding: utf-8 -*-
+
+"""
+pyeffects.Stream
+~~~~~~~~~~~~----
+
+This module implements the Stream class.
+"""
+from collections import deque
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, TypeVar
+from .Future import Dispatch, Future
+from .Timer import Timer, TimerHandle
+from .Try import Failure, Success, Try
+import sys
+import threading
+
+A = TypeVar("A")
+B = TypeVar("B")
+
+UNBOUNDED = sys.maxsize
+MERGE_PREFETCH = 16
+
+_EMPTY = object()
+_PULL = object()
+
+
+class Subscription:
+    """The link between a :class:`Stream` and one of its subscribers.
+
+    A stream only emits as many elements as its subscriber has requested, which is
+    how a slow subscriber holds back a fast source.
+    """
+
+    def request(self, n: int) -> None:
+        """Asks for ``n`` more elements.
+
+        :param n: the number of elements, ``UNBOUNDED`` to stop counting.
+        """
+
+    def cancel(self) -> None:
+        """Stops the stream, no more elements are emitted after this returns."""
+
+
+class Subscriber(Generic[A]):
+    """Receives the elements of a :class:`Stream`.
+
+    Signals are delivered one at a time, never concurrently.  ``on_error`` and
+    ``on_complete`` are terminal: at most one of them is called, once, and nothing
+    follows it.  The default implementation requests every element up front;
+    override :meth:`on_subscribe` to request fewer.
+    """
+
+    subscription = None  # type: Optional[Subscription]
+
+    def on_subscribe(self, subscription: Subscription) -> None:
+        """Called once before any other signal.
+
+        :param subscription: the :class:`Subscription` to request elements with.
+        """
+        self.subscription = subscription
+        subscription.request(UNBOUNDED)
+
+    def on_next(self, value: A) -> None:
+        """Called with every element, at most as many times as requested."""
+
+    def on_error(self, err: Exception) -> None:
+        """Called when the stream fails."""
+
+    def on_complete(self) -> None:
+        """Called when the stream has emitted its last element."""
+
+
+def _add_demand(demand: int, n: int) -> int:
+    return min(demand + n, UNBOUNDED)
+
+
+class _Emitter(Subscription):
+    """Serializes signals to a subscriber and holds elements back until requested.
+
+    Elements either come from ``pull`` while there is demand, or are pushed with
+    :meth:`offer` from any thread and queued.  Whichever thread finds the emitter
+    idle drains it; the others only record their work, so a subscriber requesting
+    more from inside ``on_next`` does not grow the stack.
+    """
+
+    def __init__(
+        self,
+        downstream: Subscriber,
+        pull: Optional[Callable[[], Any]] = None,
+        on_cancel: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.downstream = downstream
+        self.pull = pull
+        self.on_cancel = on_cancel
+        self.queue = deque()  # type: deque
+        self.demand = 0
+        self.error = None  # type: Optional[Exception]
+        self.completed = False
+        self.finished = False
+        self.cancelled = False
+        self._wip = 0
+        self._lock = threading.Lock()
+
+    def request(self, n: int) -> None:
+        if n <= 0:
+            self.fail(ValueError("Stream demand must be positive"))
+            return
+        with self._lock:
+            self.demand = _add_demand(self.demand, n)
+        self._drain()
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self.cancelled:
+                return
+            self.cancelled = True
+            self.queue.clear()
+        if self.on_cancel is not None:
+            self.on_cancel()
+
+    def offer(self, value: Any) -> None:
+        with self._lock:
+            if self.cancelled or self.completed or self.error is not None:
+                return
+            self.queue.append(value)
+        self._drain()
+
+    def fail(self, err: Exception) -> None:
+        with self._lock:
+            if self.error is None and not self.completed:
+                self.error = err
+        self._drain()
+
+    def complete(self) -> None:
+        with self._lock:
+            self.completed = True
+        self._drain()
+
+    def _drain(self) -> None:
+        with self._lock:
+            self._wip += 1
+            if self._wip != 1:
+                return
+        missed = 1
+        while True:
+            self._emit()
+            with self._lock:
+                self._wip -= missed
+                missed = self._wip
+                if missed == 0:
+                    return
+
+    def _emit(self) -> None:
+        while not self.finished and not self.cancelled:
+            if self.error is not None:
+                self.finished = True
+                self.queue.clear()
+                self.downstream.on_error(self.error)
+                return
+            with self._lock:
+                if self.demand == 0:
+                    item = _EMPTY
+                elif self.queue:
+                    item = self.queue.popleft()
+                    if self.demand != UNBOUNDED:
+                        self.demand -= 1
+                elif self.pull is not None and not self.completed:
+                    item = _PULL
+                else:
+                    item = _EMPTY
+            if item is _PULL:
+                try:
+                    item = self.pull()  # type: ignore
+                except StopIteration:
+                    with self._lock:
+                        self.completed = True
+                    continue
+                except Exception as err:
+                    self.fail(err)
+                    continue
+                with self._lock:
+                    if self.demand != UNBOUNDED:
+                        self.demand -= 1
+            elif item is _EMPTY:
+                with self._lock:
+                    finished = self.completed and not self.queue
+                if finished:
+                    self.finished = True
+                    self.downstream.on_complete()
+                return
+            self._deliver(item)
+
+    def _deliver(self, item: Any) -> None:
+        self.downstream.on_next(item)
+
+
+class _Relay(Subscriber, Subscription):
+    """An operator that sits between a stream and its subscriber."""
+
+    def __init__(self, downstream: Subscriber) -> None:
+        self.downstream = downstream
+        self.upstream = None  # type: Optional[Subscription]
+        self.done = False
+
+    def on_subscribe(self, subscription: Subscription) -> None:
+        self.upstream = subscription
+        self.downstream.on_subscribe(self)
+
+    def on_next(self, value: Any) -> None:
+        if not self.done:
+            self.downstream.on_next(value)
+
+    def on_error(self, err: Exception) -> None:
+        if not self.done:
+            self.done = True
+            self.downstream.on_error(err)
+
+    def on_complete(self) -> None:
+        if not self.done:
+            self.done = True
+            self.downstream.on_complete()
+
+    def request(self, n: int) -> None:
+        self.upstream.request(n)  # type: ignore
+
+    def cancel(self) -> None:
+        self.done = True
+        self.upstream.cancel()  # type: ignore
+
+    def _fail(self, err: Exception) -> None:
+        self.upstream.cancel()  # type: ignore
+        self.on_error(err)
+
+
+class _Map(_Relay):
+    def __init__(self, downstream: Subscriber, func: Callable) -> None:
+        super().__init__(downstream)
+        self.func = func
+
+    def on_next(self, value: Any) -> None:
+        if self.done:
+            return
+        try:
+            value = self.func(value)
+        except Exception as err:
+            self._fail(err)
+            return
+        self.downstream.on_next(value)
+
+
+class _Filter(_Relay):
+    def __init__(self, downstream: Subscriber, func: Callable) -> None:
+        super().__init__(downstream)
+        self.func = func
+
+    def on_next(self, value: Any) -> None:
+        if self.done:
+            return
+        try:
+            keep = self.func(value)
+        except Exception as err:
+            self._fail(err)
+            return
+        if keep:
+            self.downstream.on_next(value)
+        else:
+            self.upstream.request(1)  # type: ignore
+
+
+class _Buffer(_Relay):
+    def __init__(self, downstream: Subscriber, size: int) -> None:
+        super().__init__(downstream)
+        self.size = size
+        self.buffer = []  # type: List
+
+    def on_next(self, value: Any) -> None:
+        if self.done:
+            return
+        self.buffer.append(value)
+        if len(self.buffer) == self.size:
+            buffer, self.buffer = self.buffer, []
+            self.downstream.on_next(buffer)
+
+    def on_complete(self) -> None:
+        if self.buffer and not self.done:
+            buffer, self.buffer = self.buffer, []
+            self.downstream.on_next(buffer)
+        super().on_complete()
+
+    def request(self, n: int) -> None:
+        self.upstream.request(min(n * self.size, UNBOUNDED))  # type: ignore
+
+
+class _Window(Subscriber):
+    def __init__(self, downstream: Subscriber, seconds: float) -> None:
+        self.seconds = seconds
+        self.emitter = _Emitter(downstream, on_cancel=self._cancel)
+        self.upstream = None  # type: Optional[Subscription]
+        self.window = []  # type: List
+        self.timer = None  # type: Optional[TimerHandle]
+        self.stopped = False
+        self._lock = threading.Lock()
+
+    def on_subscribe(self, subscription: Subscription) -> None:
+        self.upstream = subscription
+        self.emitter.downstream.on_subscribe(self.emitter)
+        self._schedule()
+        subscription.request(UNBOUNDED)
+
+    def on_next(self, value: Any) -> None:
+        with self._lock:
+            self.window.append(value)
+
+    def on_error(self, err: Exception) -> None:
+        self._stop()
+        self.emitter.fail(err)
+
+    def on_complete(self) -> None:
+        self._stop()
+        self._flush()
+        self.emitter.complete()
+
+    def _flush(self) -> None:
+        with self._lock:
+            window, self.window = self.window, []
+        if window:
+            self.emitter.offer(window)
+
+    def _tick(self) -> None:
+        self._flush()
+        self._schedule()
+
+    def _schedule(self) -> None:
+        with self._lock:
+            if not self.stopped:
+                self.timer = Timer.default().schedule(self.seconds, self._tick)
+
+    def _stop(self) -> None:
+        with self._lock:
+            self.stopped = True
+            timer, self.timer = self.timer, None
+        if timer is not None:
+            timer.cancel()
+
+    def _cancel(self) -> None:
+        self._stop()
+        self.upstream.cancel()  # type: ignore
+
+
+class _Concat(_Relay):
+    def __init__(self, downstream: Subscriber, func: Callable) -> None:
+        super().__init__(downstream)
+        self.func = func
+        self.requested = 0
+        self.inner = None  # type: Optional[Subscription]
+        self.active = False
+        self.outer_done = False
+        self._lock = threading.Lock()
+
+    def on_subscribe(self, subscription: Subscription) -> None:
+        super().on_subscribe(subscription)
+        subscription.request(1)
+
+    def on_next(self, value: Any) -> None:
+        if self.done:
+            return
+        try:
+            inner = self.func(value)
+            if not isinstance(inner, Stream):
+                raise TypeError("Stream.flat_map expects a function returning a Stream")
+        except Exception as err:
+            self._fail(err)
+            return
+        with self._lock:
+            self.active = True
+        inner._subscribe(_ConcatInner(self))
+
+    def on_complete(self) -> None:
+        with self._lock:
+            self.outer_done = True
+            finished = not self.active
+        if finished:
+            super().on_complete()
+
+    def request(self, n: int) -> None:
+        with self._lock:
+            self.requested = _add_demand(self.requested, n)
+            inner = self.inner
+        if inner is not None:
+            inner.request(n)
+
+    def cancel(self) -> None:
+        with self._lock:
+            inner, self.inner = self.inner, None
+        if inner is not None:
+            inner.cancel()
+        super().cancel()
+
+    def _inner_subscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self.inner = subscription
+            requested = self.requested
+        if self.done:
+            subscription.cancel()
+        elif requested > 0:
+            subscription.request(requested)
+
+    def _inner_next(self, value: Any) -> None:
+        with self._lock:
+            if self.requested != UNBOUNDED:
+                self.requested -= 1
+        if not self.done:
+            self.downstream.on_next(value)
+
+    def _inner_complete(self) -> None:
+        with self._lock:
+            self.inner = None
+            self.active = False
+            finished = self.outer_done
+        if finished:
+            super().on_complete()
+        elif not self.done:
+            self.upstream.request(1)  # type: ignore
+
+
+class _ConcatInner(Subscriber):
+    def __init__(self, parent: _Concat) -> None:
+        self.parent = parent
+
+    def on_subscribe(self, subscription: Subscription) -> None:
+        self.parent._inner_subscribe(subscription)
+
+    def on_next(self, value: Any) -> None:
+        self.parent._inner_next(value)
+
+    def on_error(self, err: Exception) -> None:
+        self.parent._fail(err)
+
+    def on_complete(self) -> None:
+        self.parent._inner_complete()
+
+
+class _MergeEmitter(_Emitter):
+    def __init__(self, downstream: Subscriber, count: int) -> None:
+        super().__init__(downstream, on_cancel=self._cancel_sources)
+        self.remaining = count
+        self.sources = []  # type: List[Subscription]
+
+    def _deliver(self, item: Any) -> None:
+        source, value = item
+        self.downstream.on_next(value)
+        source.request(1)
+
+    def _cancel_sources(self) -> None:
+        for source in list(self.sources):
+            source.cancel()
+
+    def _source_done(self) -> None:
+        with self._lock:
+            self.remaining -= 1
+            finished = self.remaining == 0
+        if finished:
+            self.complete()
+
+
+class _MergeSource(Subscriber):
+    def __init__(self, emitter: _MergeEmitter) -> None:
+        self.emitter = emitter
+        self.upstream = None  # type: Optional[Subscription]
+
+    def on_subscribe(self, subscription: Subscription) -> None:
+        self.upstream = subscription
+        self.emitter.sources.append(subscription)
+        if self.emitter.cancelled:
+            subscription.cancel()
+        else:
+            subscription.request(MERGE_PREFETCH)
+
+    def on_next(self, value: Any) -> None:
+        self.emitter.offer((self.upstream, value))
+
+    def on_error(self, err: Exception) -> None:
+        self.emitter.fail(err)
+        self.emitter._cancel_sources()
+
+    def on_complete(self) -> None:
+        self.emitter._source_done()
+
+
+class _CallbackSubscriber(Subscriber):
+    def __init__(
+        self,
+        on_result: Callable[[Try], None],
+        on_complete: Optional[Callable[[], None]],
+        batch_size: Optional[int],
+    ) -> None:
+        self.on_result = on_result
+        self.on_done = on_complete
+        self.batch_size = batch_size
+        self.received = 0
+
+    def on_subscribe(self, subscription: Subscription) -> None:
+        self.subscription = subscription
+        subscription.request(self.batch_size or UNBOUNDED)
+
+    def on_next(self, value: Any) -> None:
+        self.on_result(Success(value))
+        if self.batch_size is not None:
+            self.received += 1
+            if self.received == self.batch_size:
+                self.received = 0
+                self.subscription.request(self.batch_size)  # type: ignore
+
+    def on_error(self, err: Exception) -> None:
+        self.on_result(Failure(err))
+
+    def on_complete(self) -> None:
+        if self.on_done is not None:
+            self.on_done()
+
+
+class Stream(Generic[A]):
+    """A push-based sequence of elements with backpressure.
+
+    A :class:`Stream` describes where elements come from and how they are
+    transformed; nothing runs until it is subscribed to, and every subscription
+    runs the stream again.  Sources only emit as many elements as their subscriber
+    has requested, so a slow consumer holds back a fast producer instead of
+    queueing without bound.  Elements pass through operators as plain function
+    calls, without creating a :class:`Future` each.
+
+    Usage::
+
+      >>> from pyeffects.Stream import *
+      >>> Stream.of(1, 2, 3, 4).map(lambda v: v * v).filter(lambda v: v > 1).to_list()
+      Future(Success([4, 9, 16]))
+    """
+
+    def __init__(self, subscribe: Callable[[Subscriber], None]) -> None:
+        self._subscribe = subscribe
+
+    @staticmethod
+    def of(*values: B) -> "Stream[B]":
+        """Constructs a :class:`Stream <Stream>` of the given values.
+
+        :rtype: pyEffects.Stream
+
+        Usage::
+
+          >>> from pyeffects.Stream import *
+          >>> Stream.of(1, 2, 3).to_list()
+          Future(Success([1, 2, 3]))
+        """
+        return Stream.from_iterable(values)
+
+    @staticmethod
+    def from_iterable(iterable: Iterable[B]) -> "Stream[B]":
+        """Constructs a :class:`Stream <Stream>` that pulls its elements from an iterable.
+
+        Every subscription iterates ``iterable`` again, and only as far as requested.
+
+        :param iterable: the elements of the stream.
+        :rtype: pyEffects.Stream
+
+        Usage::
+
+          >>> from pyeffects.Stream import *
+          >>> Stream.from_iterable(range(3)).to_list()
+          Future(Success([0, 1, 2]))
+        """
+
+        def subscribe(subscriber: Subscriber) -> None:
+            iterator = iter(iterable)  # type: Iterator[B]
+            subscriber.on_subscribe(_Emitter(subscriber, iterator.__next__))
+
+        return Stream(subscribe)
+
+    @staticmethod
+    def from_futures(futures: Iterable[Future[B]]) -> "Stream[B]":
+        """Constructs a :class:`Stream <Stream>` of the values of futures, as they complete.
+
+        The stream fails with the first failed future and completes once every future
+        has completed.
+
+        :param futures: the futures to emit the values of.
+        :rtype: pyEffects.Stream
+
+        Usage::
+
+          >>> from pyeffects.Stream import *
+          >>> Stream.from_futures([Future.of(1), Future.of(2)]).to_list()
+          Future(Success([1, 2]))
+        """
+        futures = list(futures)
+
+        def subscribe(subscriber: Subscriber) -> None:
+            emitter = _Emitter(subscriber)
+            remaining = [len(futures)]
+            lock = threading.Lock()
+
+            def on_done(value: Try) -> None:
+                if value.is_failure():
+                    emitter.fail(value.error())
+                    return
+                emitter.offer(value.value)
+                with lock:
+                    remaining[0] -= 1
+                    finished = remaining[0] == 0
+                if finished:
+                    emitter.complete()
+
+            subscriber.on_subscribe(emitter)
+            if not futures:
+                emitter.complete()
+            for future in futures:
+                future._on_complete(on_done, Dispatch.INLINE)  # type: ignore
+
+        return Stream(subscribe)
+
+    @staticmethod
+    def empty() -> "Stream":
+        """Constructs a :class:`Stream <Stream>` that completes without elements.
+
+        :rtype: pyEffects.Stream
+        """
+        return Stream.from_iterable(())
+
+    @staticmethod
+    def failed(err: Exception) -> "Stream":
+        """Constructs a :class:`Stream <Stream>` that fails straight away.
+
+        :param err: the exception to fail with.
+        :rtype: pyEffects.Stream
+        """
+
+        def subscribe(subscriber: Subscriber) -> None:
+            emitter = _Emitter(subscriber)
+            subscriber.on_subscribe(emitter)
+            emitter.fail(err)
+
+        return Stream(subscribe)
+
+    def _lift(self, operator: Callable[[Subscriber], Subscriber]) -> "Stream":
+        return Stream(lambda subscriber: self._subscribe(operator(subscriber)))
+
+    def map(self, func: Callable[[A], B]) -> "Stream[B]":
+        """Maps a function over the elements of the :class:`Stream <Stream>`.
+
+        An exception raised by ``func`` fails the stream.
+
+        :param func: function to apply to every element.
+        :rtype: pyEffects.Stream
+
+        Usage::
+
+          >>> from pyeffects.Stream import *
+          >>> Stream.of(1, 2).map(lambda v: v + 1).to_list()
+          Future(Success([2, 3]))
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("Stream.map expects a callable")
+        return self._lift(lambda subscriber: _Map(subscriber, func))
+
+    def filter(self, func: Callable[[A], bool]) -> "Stream[A]":
+        """Keeps the elements of the :class:`Stream <Stream>` that match a predicate.
+
+        :param func: predicate to test every element with.
+        :rtype: pyEffects.Stream
+
+        Usage::
+
+          >>> from pyeffects.Stream import *
+          >>> Stream.of(1, 2, 3, 4).filter(lambda v: v % 2 == 0).to_list()
+          Future(Success([2, 4]))
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("Stream.filter expects a callable")
+        return self._lift(lambda subscriber: _Filter(subscriber, func))
+
+    def flat_map(self, func: Callable[[A], "Stream[B]"]) -> "Stream[B]":
+        """Replaces every element with the elements of the :class:`Stream <Stream>` ``func`` returns.
+
+        The inner streams are subscribed to one after another, so their elements keep
+        the order of the elements they came from.
+
+        :param func: function returning a pyEffects.Stream for every element.
+        :rtype: pyEffects.Stream
+
+        Usage::
+
+          >>> from pyeffects.Stream import *
+          >>> Stream.of(1, 2).flat_map(lambda v: Stream.of(v, v * 10)).to_list()
+          Future(Success([1, 10, 2, 20]))
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("Stream.flat_map expects a callable")
+        return self._lift(lambda subscriber: _Concat(subscriber, func))
+
+    def buffer(self, size: int) -> "Stream[List[A]]":
+        """Groups the elements of the :class:`Stream <Stream>` into lists of ``size``.
+
+        The last list holds the remaining elements and may be shorter.
+
+        :param size: the number of elements per list.
+        :rtype: pyEffects.Stream
+
+        Usage::
+
+          >>> from pyeffects.Stream import *
+          >>> Stream.of(1, 2, 3, 4, 5).buffer(2).to_list()
+          Future(Success([[1, 2], [3, 4], [5]]))
+        """
+        if not isinstance(size, int) or size < 1:
+            raise TypeError("Stream.buffer expects a positive int")
+        return self._lift(lambda subscriber: _Buffer(subscriber, size))
+
+    def window(self, seconds: float) -> "Stream[List[A]]":
+        """Groups the elements of the :class:`Stream <Stream>` into lists per time window.
+
+        Every ``seconds`` the elements received since the last window are emitted as a
+        list; windows without elements are skipped.  The windows are timed by the
+        shared :class:`Timer <pyeffects.Timer.Timer>`.  Time does not wait for the
+        subscriber, so this operator requests every element from its source and
+        queues finished windows until they are requested.
+
+        :param seconds: the length of a window.
+        :rtype: pyEffects.Stream
+
+        Usage::
+
+          >>> from pyeffects.Stream import *
+          >>> Stream.of(1, 2, 3).window(0.01).to_list()
+          Future(...)
+        """
+        if seconds <= 0:
+            raise TypeError("Stream.window expects a positive number of seconds")
+        return self._lift(lambda subscriber: _Window(subscriber, seconds))
+
+    def merge(self, *others: "Stream[A]") -> "Stream[A]":
+        """Interleaves the elements of several :class:`Stream <Stream>` as they arrive.
+
+        Every source is asked for a few elements ahead and topped up as its elements
+        are delivered.  The merged stream completes when every source has completed
+        and fails with the first source that fails.
+
+        :param others: the streams to merge with this one.
+        :rtype: pyEffects.Stream
+
+        Usage::
+
+          >>> from pyeffects.Stream import *
+          >>> Stream.of(1, 2).merge(Stream.of(3)).to_list().map(sorted)
+          Future(Success([1, 2, 3]))
+        """
+        streams = [self] + list(others)
+        if not all(isinstance(stream, Stream) for stream in streams):
+            raise TypeError("Stream.merge expects Streams")
+
+        def subscribe(subscriber: Subscriber) -> None:
+            emitter = _MergeEmitter(subscriber, len(streams))
+            subscriber.on_subscribe(emitter)
+            for stream in streams:
+                stream._subscribe(_MergeSource(emitter))
+
+        return Stream(subscribe)
+
+    def subscribe(
+        self,
+        subscriber: Any,
+        on_complete: Optional[Callable[[], None]] = None,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """Runs the :class:`Stream <Stream>`.
+
+        :param subscriber: a :class:`Subscriber`, or a function called with a
+          ``Success`` for every element and a ``Failure`` if the stream fails.
+        :param on_complete: optional function called when the stream completes, for
+          a function ``subscriber``.
+        :param batch_size: optional number of elements a function ``subscriber``
+          requests at a time, defaults to requesting every element up front.
+
+        Usage::
+
+          >>> from pyeffects.Stream import *
+          >>> Stream.of(1, 2).subscribe(print, lambda: print("done"))
+          Success(1)
+          Success(2)
+          done
+        """
+        if not isinstance(subscriber, Subscriber):
+            if not hasattr(subscriber, "__call__"):
+                raise TypeError("Stream.subscribe expects a Subscriber or a callable")
+            if batch_size is not None and (
+                not isinstance(batch_size, int) or batch_size < 1
+            ):
+                raise TypeError("Stream.subscribe expects a positive int batch_size")
+            subscriber = _CallbackSubscriber(subscriber, on_complete, batch_size)
+        self._subscribe(subscriber)
+
+    def to_list(self) -> Future[List[A]]:
+        """Runs the :class:`Stream <Stream>` and collects its elements.
+
+        :rtype: pyEffects.Future, of every element, or of the error the stream failed with
+
+        Usage::
+
+          >>> from pyeffects.Stream import *
+          >>> Stream.of(1, 2, 3).to_list().result()
+          Success([1, 2, 3])
+        """
+        result = Future()  # type: Future[List[A]]
+        values = []  # type: List[A]
+
+        def on_result(value: Try[A]) -> None:
+            if value.is_success():
+                values.append(value.value)
+            else:
+                result._try_complete(value)  # type: ignore
+
+        def on_complete() -> None:
+            result._try_complete(Success(values))  # type: ignore
+
+        self.subscribe(on_result, on_complete)
+        return result
+
+    def __str__(self) -> str:
+        return "Stream(...)"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+"""
+pyeffects.Timer
+~~~~~~~~~~~~----
+
+This module implements the Timer used to run delayed work without parking a thread per delay.
+"""
+from typing import Callable, Dict, List, Optional
+import math
+import sys
+import threading
+import time
+
+
+class TimerHandle:
+    """A task scheduled on a :class:`Timer <Timer>`, which can be cancelled until it runs."""
+
+    def __init__(
+        self, timer: "Timer", deadline: float, tick: int, task: Callable[[], None]
+    ) -> None:
+        self.deadline = deadline
+        self.task = task  # type: Optional[Callable[[], None]]
+        self._timer = timer
+        self._tick = tick
+
+    def cancel(self) -> None:
+        """Stops the task from running, if it has not started yet.
+
+        The task is removed from its slot of the timer wheel straight away.  A task
+        the timer thread has already taken out of the wheel still runs.
+        """
+        if self.task is not None:
+            self._timer._cancel(self)
+
+    def is_cancelled(self) -> bool:
+        """Returns if the task was cancelled or has already run.
+
+        :rtype: bool
+        """
+        return self.task is None
+
+
+class Timer:
+    """Runs tasks after a delay on a single background thread.
+
+    Pending tasks are kept in a hashed timer wheel: ``wheel_size`` slots that each
+    cover ``resolution`` seconds, with tasks further out than one rotation waiting
+    in their slot for later rotations.  Scheduling and cancelling a task are O(1),
+    and the thread only wakes up once per ``resolution`` while tasks are pending.
+    Tasks run on the timer thread itself, so they should only hand work off, for
+    example by submitting it to an executor or completing a :class:`Future`.
+
+    :param resolution: seconds covered by one slot, tasks may run up to this late.
+    :param wheel_size: number of slots in the wheel.
+
+    Usage::
+
+      >>> from pyeffects.Timer import *
+      >>> done = threading.Event()
+      >>> handle = Timer.default().schedule(0.01, done.set)
+      >>> done.wait(1)
+      True
+    """
+
+    _default = None  # type: Optional[Timer]
+    _default_lock = threading.Lock()
+
+    def __init__(self, resolution: float = 0.005, wheel_size: int = 512) -> None:
+        if resolution <= 0:
+            raise TypeError("Timer expects a positive resolution")
+        if not isinstance(wheel_size, int) or wheel_size < 1:
+            raise TypeError("Timer expects wheel_size to be a positive int")
+        self.resolution = resolution
+        self._slots = [
+            {} for _ in range(wheel_size)
+        ]  # type: List[Dict[TimerHandle, None]]
+        self._start = time.monotonic()
+        self._tick = 0
+        self._pending = 0
+        self._condition = threading.Condition(threading.Lock())
+        self._thread = None  # type: Optional[threading.Thread]
+
+    @staticmethod
+    def default() -> "Timer":
+        """Returns the :class:`Timer <Timer>` shared by the Future runtime.
+
+        :rtype: pyEffects.Timer
+        """
+        timer = Timer._default
+        if timer is None:
+            with Timer._default_lock:
+                if Timer._default is None:
+                    Timer._default = Timer()
+                timer = Timer._default
+        return timer
+
+    def schedule(self, delay: float, task: Callable[[], None]) -> TimerHandle:
+        """Runs ``task`` on the timer thread once ``delay`` seconds have passed.
+
+        :param delay: seconds to wait before running ``task``.
+        :param task: function to run.
+        :rtype: pyEffects.TimerHandle
+        """
+        if not hasattr(task, "__call__"):
+            raise TypeError("Timer.schedule expects a callable")
+        deadline = time.monotonic() + max(delay, 0.0)
+        tick = math.ceil((deadline - self._start) / self.resolution)
+        with self._condition:
+            handle = TimerHandle(self, deadline, max(tick, self._tick + 1), task)
+            self._slots[handle._tick % len(self._slots)][handle] = None
+            self._pending += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="pyeffects-timer", daemon=True
+                )
+                self._thread.start()
+            elif self._pending == 1:
+                self._condition.notify()
+        return handle
+
+    def pending(self) -> int:
+        """Returns the number of tasks waiting to run.
+
+        :rtype: int
+        """
+        return self._pending
+
+    def _cancel(self, handle: TimerHandle) -> None:
+        with self._condition:
+            slot = self._slots[handle._tick % len(self._slots)]
+            if slot.pop(handle, 0) is None:
+                self._pending -= 1
+            handle.task = None
+
+    def _expire(self, tick: int, now: int) -> List[Callable[[], None]]:
+        slot = self._slots[tick % len(self._slots)]
+        expired = [handle for handle in slot if handle._tick <= now]
+        tasks = []
+        for handle in expired:
+            del slot[handle]
+            tasks.append(handle.task)
+            handle.task = None
+        self._pending -= len(expired)
+        return tasks  # type: ignore
+
+    def _loop(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending == 0:
+                    self._condition.wait()
+                now = int((time.monotonic() - self._start) / self.resolution)
+                if now <= self._tick:
+                    self._condition.wait(
+                        self._start
+                        + (self._tick + 1) * self.resolution
+                        - time.monotonic()
+                    )
+                    continue
+                tasks = []  # type: List[Callable[[], None]]
+                for tick in range(max(self._tick, now - len(self._slots)) + 1, now + 1):
+                    tasks.extend(self._expire(tick, now))
+                self._tick = now
+            for task in tasks:
+                try:
+                    task()
+                except Exception:
+                    threading.excepthook(
+                        threading.ExceptHookArgs([*sys.exc_info(), threading.current_thread()])  # type: ignore
+                    )
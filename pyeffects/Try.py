@@ -6,14 +6,18 @@ pyeffects.Try
 
 This module implements the Try, Success, and Faiure classes.
 """
-from typing import Callable, List, Type, TypeVar, Union
+from typing import Callable, List, Optional, Type, TypeVar, Union
 from .Monad import Monad
+from .Retry import RetryPolicy
+import time
 
 A = TypeVar("A", covariant=True)
 B = TypeVar("B")
 
 
 class Try(Monad[A]):
+    __slots__ = ()
+
     @staticmethod
     def of(func_or_value: Union[B, Callable[[], B]]) -> "Try[B]":
         """Constructs a :class:`Try <Try>`.
@@ -36,10 +40,52 @@ class Try(Monad[A]):
         """
         try:
             value = func_or_value() if hasattr(func_or_value, "__call__") else func_or_value  # type: ignore
-            return Success(value)  # type: ignore
+            return success_none if value is None else Success(value)  # type: ignore
         except Exception as err:
             return Failure(err)
 
+    @staticmethod
+    def retry(func: Callable[[], B], policy: Optional[RetryPolicy] = None) -> "Try[B]":
+        """Constructs a :class:`Try <Try>` by calling a function until it succeeds.
+
+        Failed calls are retried while ``policy`` allows it, sleeping the policy's
+        backoff delay in between.  The result is the first ``Success``, or the last
+        ``Failure``.
+
+        :param func: function to call.
+        :param policy: the :class:`RetryPolicy` to follow, defaults to ``RetryPolicy()``.
+        :rtype: pyEffects.Try
+
+        Usage::
+
+          >>> from pyeffects.Retry import RetryPolicy
+          >>> from pyeffects.Try import *
+          >>> calls = []
+          >>> def flaky():
+          ...   calls.append(1)
+          ...   if len(calls) < 3:
+          ...     raise RuntimeError("failed")
+          ...   return len(calls)
+          ...
+          >>> Try.retry(flaky, RetryPolicy(max_attempts=3, base_delay=0.01))
+          Success(3)
+        """
+        if not hasattr(func, "__call__"):
+            raise TypeError("Try.retry expects a callable")
+        if policy is None:
+            policy = RetryPolicy()
+        elif not isinstance(policy, RetryPolicy):
+            raise TypeError("Try.retry expects a RetryPolicy")
+        attempt = 1
+        delay = None  # type: Optional[float]
+        while True:
+            result = Try.of(func)  # type: Try[B]
+            if result.is_success() or not policy.should_retry(result.error(), attempt):
+                return result
+            delay = policy.next_delay(attempt, delay)
+            time.sleep(delay)
+            attempt += 1
+
     def flat_map(self, func: Callable[[A], "Monad[B]"]) -> "Monad[B]":
         """Flatmaps a function for :class:`Try <Try>`.
 
@@ -52,13 +98,64 @@ class Try(Monad[A]):
           >>> Success(5).flat_map(lambda v: Success(v * v))
           Success(25)
         """
-        if not hasattr(func, "__call__"):
+        if not (self._trusted or hasattr(func, "__call__")):
             raise TypeError("Try.flat_map expects a callable")
-        if self.is_success():
+        if self.biased:
             return func(self.value)
         else:
             return self  # type: ignore
 
+    def map(self, func: Callable[[A], B]) -> "Try[B]":
+        """Maps a function over the value of a successful :class:`Try <Try>`.
+
+        :param func: function to apply to the value.
+        :rtype: pyEffects.Try
+
+        Usage::
+
+          >>> from pyeffects.Try import *
+          >>> Success(5).map(lambda v: v * v)
+          Success(25)
+        """
+        if not (self._trusted or hasattr(func, "__call__")):
+            raise TypeError("map expects a callable")
+        if not self.biased:
+            return self  # type: ignore
+        value = func(self.value)
+        if value is None:
+            return success_none
+        if hasattr(value, "__call__"):  # Try.of calls callable results
+            return Try.of(value)
+        return Success(value)
+
+    def filter(self, func: Callable[[A], bool]) -> "Try[A]":
+        """Keeps a successful :class:`Try <Try>` only if ``func`` holds for its value.
+
+        A value failing the predicate becomes a ``Failure`` of ``ValueError``, and an
+        exception raised by ``func`` becomes the ``Failure``.
+
+        :param func: predicate to test the value with.
+        :rtype: pyEffects.Try
+
+        Usage::
+
+          >>> from pyeffects.Try import *
+          >>> Success(5).filter(lambda v: v > 3)
+          Success(5)
+          >>> Success(2).filter(lambda v: v > 3)
+          Failure(Predicate does not hold for 2)
+        """
+        if not (self._trusted or hasattr(func, "__call__")):
+            raise TypeError("Try.filter expects a callable")
+        if not self.biased:
+            return self
+        try:
+            if func(self.value):
+                return self
+            return Failure(ValueError("Predicate does not hold for " + str(self.value)))
+        except Exception as err:
+            return Failure(err)
+
     def recover(
         self, err: Type[Exception], recover: Union[B, Callable[[], B]]
     ) -> "Try[B]":
@@ -188,9 +285,11 @@ class Try(Monad[A]):
 
 
 class Failure(Try[A]):
+    __slots__ = ("value",)
+    biased = False
+
     def __init__(self, value: Exception) -> None:
         self.value = value  # type: ignore
-        self.biased = False
 
     def __str__(self) -> str:
         return "Failure(" + str(self.value) + ")"
@@ -200,12 +299,17 @@ class Failure(Try[A]):
 
 
 class Success(Try[A]):
+    __slots__ = ("value",)
+    biased = True
+
     def __init__(self, value: A) -> None:
         self.value = value
-        self.biased = True
 
     def __str__(self) -> str:
         return "Success(" + str(self.value) + ")"
 
     def __repr__(self) -> str:
         return self.__str__()
+
+
+success_none = Success(None)  # type: Success
@@ -42,6 +42,9 @@ if sys.argv[-1] == 'publish':
 packages = ['pyeffects']
 
 requires = []
+extras_require = {
+    'numpy': ['numpy']
+}
 test_requirements = [
     'pytest-cov',
     'pytest-mock',
@@ -71,6 +74,7 @@ setup(
     include_package_data=True,
     python_requires=">=3.8",
     install_requires=requires,
+    extras_require=extras_require,
     license=about['__license__'],
     zip_safe=False,
     classifiers=[
@@ -91,7 +95,6 @@ setup(
     ],
     cmdclass={'test': PyTest},
     tests_require=test_requirements,
-    extras_require={},
     project_urls={
         'Source': 'https://github.com/vickumar1981/pyeffects',
     },
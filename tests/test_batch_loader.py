@@ -0,0 +1,133 @@
+from pyeffects.BatchLoader import *
+from pyeffects.Try import Try
+from .random_int_generator import random_int
+import threading
+import time
+
+
+class TestBatchLoader:
+    @staticmethod
+    def _recording(calls, func=lambda key: key * key):
+        def batch_fn(keys):
+            calls.append(keys)
+            return [func(key) for key in keys]
+
+        return batch_fn
+
+    def test_load_coalesces_keys_within_window(self):
+        calls = []
+        loader = BatchLoader(self._recording(calls), max_delay=0.02)
+        futures = [loader.load(key) for key in range(5)]
+        assert Future.gather(futures).result(1) == Success([0, 1, 4, 9, 16])
+        assert calls == [[0, 1, 2, 3, 4]]
+
+    def test_load_splits_at_max_batch_size(self):
+        calls = []
+        loader = BatchLoader(self._recording(calls), max_batch_size=2, max_delay=0.02)
+        assert loader.load_many(range(5)).result(1) == Success([0, 1, 4, 9, 16])
+        assert calls == [[0, 1], [2, 3], [4]]
+
+    def test_full_batch_does_not_wait_for_window(self):
+        tasks = []
+        loader = BatchLoader(lambda keys: keys, 2, 10, executor=tasks.append)
+        loader.load(1)
+        loader.load(2)
+        assert len(tasks) == 1
+
+    def test_repeated_keys_are_deduplicated(self):
+        calls = []
+        loader = BatchLoader(self._recording(calls), max_delay=0.02)
+        first = loader.load(3)
+        assert loader.load(3) is first
+        assert first.result(1) == Success(9)
+        assert loader.load(3) is first and calls == [[3]]
+
+    def test_cache_can_be_disabled_and_cleared(self):
+        calls = []
+        loader = BatchLoader(self._recording(calls), max_delay=0.01, cache=False)
+        assert loader.load(3) is not loader.load(3)
+        loader = BatchLoader(self._recording(calls), max_delay=0.01)
+        first = loader.load(3)
+        first.result(1)
+        loader.clear(3)
+        assert loader.load(3) is not first
+        loader.clear_all()
+        assert loader._cache == {}
+
+    def test_exception_values_fail_only_their_key(self):
+        def batch_fn(keys):
+            return [RuntimeError("Failed") if key == 1 else key for key in keys]
+
+        loader = BatchLoader(batch_fn, max_delay=0.01)
+        futures = [loader.load(key) for key in range(3)]
+        results = Future.wait_all(futures, 1)
+        assert results[0] == Success(0) and results[2] == Success(2)
+        assert isinstance(results[1].error(), RuntimeError)
+
+    def test_raising_batch_fn_fails_every_key(self):
+        def batch_fn(keys):
+            raise RuntimeError("Failed")
+
+        loader = BatchLoader(batch_fn, max_delay=0.01)
+        results = Future.wait_all([loader.load(1), loader.load(2)], 1)
+        assert all(isinstance(r.error(), RuntimeError) for r in results)
+
+    def test_misaligned_results_fail_every_key(self):
+        loader = BatchLoader(lambda keys: keys[:1], max_delay=0.01)
+        results = Future.wait_all([loader.load(1), loader.load(2)], 1)
+        assert all(isinstance(r.error(), ValueError) for r in results)
+
+    def test_failed_keys_are_retried(self):
+        attempts = []
+
+        def batch_fn(keys):
+            attempts.append(keys)
+            if len(attempts) == 1:
+                raise RuntimeError("Failed")
+            return keys
+
+        loader = BatchLoader(batch_fn, max_delay=0.01)
+        assert loader.load(1).result(1).is_failure()
+        assert loader.load(1).result(1) == Success(1)
+
+    def test_dispatch_now_sends_waiting_keys(self):
+        tasks = []
+        loader = BatchLoader(lambda keys: keys, max_delay=10, executor=tasks.append)
+        value = random_int()
+        result = loader.load(value)
+        loader.dispatch_now()
+        tasks.pop()()
+        assert result.get() == value
+
+    def test_loads_from_many_threads_share_batches(self):
+        calls = []
+        loader = BatchLoader(self._recording(calls, lambda key: key), 1000, 0.05)
+        futures = []
+        lock = threading.Lock()
+
+        def load(start):
+            for key in range(start, start + 100):
+                future = loader.load(key)
+                with lock:
+                    futures.append((key, future))
+
+        threads = [threading.Thread(target=load, args=[i * 100]) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(future.result(1) == Success(key) for key, future in futures)
+        assert sum(len(keys) for keys in calls) == 400 and len(calls) < 400
+
+    def test_loader_validates_arguments(self):
+        for args in (
+            [random_int()],
+            [lambda keys: keys, 0],
+            [lambda keys: keys, 1, -1],
+            [lambda keys: keys, 1, 0, random_int()],
+        ):
+            result = Try.of(lambda: BatchLoader(*args))
+            assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_loader_repr(self):
+        assert str(BatchLoader(lambda keys: keys)).startswith("BatchLoader")
@@ -0,0 +1,120 @@
+from pyeffects.Do import do
+from pyeffects.Either import Left, Right
+from pyeffects.Future import Future
+from pyeffects.Option import Option, Some, empty
+from pyeffects.Promise import Promise
+from pyeffects.Try import Failure, Success, Try
+from .random_int_generator import random_int
+import threading
+
+
+class TestDo:
+    def test_do_option_matches_flat_map(self):
+        @do
+        def add(a, b):
+            x = yield Option.of(a)
+            y = yield Option.of(b)
+            return x + y
+
+        a, b = random_int(), random_int()
+        expected = Option.of(a).flat_map(lambda x: Option.of(b).map(lambda y: x + y))
+        assert add(a, b) == expected
+        assert add(a, None) is empty
+
+    def test_do_either_short_circuits_and_closes_generator(self):
+        steps = []
+
+        @do
+        def validate(value):
+            try:
+                checked = yield (Right(value) if value > 0 else Left("negative"))
+                steps.append(checked)
+                return checked * 2
+            finally:
+                steps.append("closed")
+
+        value = random_int()
+        assert validate(value) == Right(value * 2)
+        assert validate(-value) == Left("negative")
+        assert steps == [value, "closed", "closed"]
+
+    def test_do_try_returns_failure(self):
+        error = RuntimeError("failed")
+
+        @do
+        def block():
+            x = yield Success(random_int())
+            yield Failure(error)
+            return x
+
+        assert block() == Failure(error)
+
+    def test_do_try_wraps_return_value_in_success(self):
+        @do
+        def block():
+            x = yield Try.of(lambda: 5)
+            return x
+
+        assert block() == Success(5)
+
+    def test_do_runs_long_loops_without_recursion(self):
+        @do
+        def count(n):
+            total = 0
+            for i in range(n):
+                total += yield Some(i)
+            return total
+
+        assert count(100000) == Some(sum(range(100000)))
+
+    def test_do_future_resumes_on_completing_thread(self):
+        promise = Promise()  # type: Promise[int]
+        threads = []
+
+        @do
+        def block():
+            x = yield Future.of(1)
+            y = yield promise.future
+            threads.append(threading.current_thread())
+            return x + y
+
+        future = block()
+        assert future.value is None
+        completer = threading.Thread(target=lambda: promise.success(2))
+        completer.start()
+        completer.join()
+        assert future.result(1) == Success(3)
+        assert threads == [completer]
+
+    def test_do_future_fails_on_failed_future_or_exception(self):
+        error = RuntimeError("failed")
+
+        def fail():
+            raise error
+
+        @do
+        def failed():
+            yield Future.run(lambda: 1)
+            yield Future.run(fail)
+            return 2
+
+        @do
+        def raising():
+            yield Future.of(1)
+            raise error
+
+        assert failed().result(1) == Failure(error)
+        assert raising().result(1) == Failure(error)
+
+    def test_do_requires_generator_function(self):
+        result = Try.of(lambda: do(lambda: random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_do_requires_a_yield(self):
+        @do
+        def block():
+            return random_int()
+            yield
+
+        result = Try.of(lambda: block())
+        assert result.is_failure() and isinstance(result.error(), TypeError)
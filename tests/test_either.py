@@ -84,3 +84,32 @@ class TestEither:
     def test_either_type_inequality(self):
         value = random_int()
         assert Right(value) != Left(value)
+
+    def test_either_instances_have_no_dict(self):
+        assert not hasattr(Right(random_int()), "__dict__")
+        assert not hasattr(Left(random_int()), "__dict__")
+
+    def test_either_of_none_is_interned(self):
+        assert Either.of(None) is right_none and right_none == Right(None)
+
+    def test_either_pickles(self):
+        import pickle
+
+        value = random_int()
+        assert pickle.loads(pickle.dumps(Right(value))) == Right(value)
+        assert pickle.loads(pickle.dumps(Left(value))) == Left(value)
+
+    def test_either_map(self):
+        value = random_int()
+        assert Right(value).map(lambda v: v + 1) == Right(value + 1)
+        assert Left(value).map(lambda v: v + 1) == Left(value)
+
+    def test_either_filter(self):
+        value = random_int()
+        assert Right(value).filter(lambda v: v == value, "no") == Right(value)
+        assert Right(value).filter(lambda v: v != value, "no") == Left("no")
+        assert Left(value).filter(lambda v: False, "no") == Left(value)
+
+    def test_either_filter_requires_callable(self):
+        result = Try.of(lambda: Right(random_int()).filter(random_int(), "no"))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
@@ -0,0 +1,68 @@
+from pyeffects.Either import Left, Right
+from pyeffects.EitherBatch import EitherBatch
+from pyeffects.Try import Try
+from .random_int_generator import random_int
+
+
+class TestEitherBatch:
+    @staticmethod
+    def _eithers():
+        return [
+            Right(random_int()),
+            Left("first"),
+            Right(random_int()),
+            Left("second"),
+            Right(random_int()),
+        ]
+
+    def test_either_batch_round_trips_eithers(self):
+        eithers = self._eithers()
+        batch = EitherBatch.from_eithers(eithers)
+        assert batch.to_eithers() == eithers and len(batch) == len(eithers)
+        assert [batch[i] for i in range(len(batch))] == eithers
+        assert batch[-1] == eithers[-1]
+
+    def test_either_batch_partition_keeps_record_order(self):
+        eithers = self._eithers()
+        lefts, rights = EitherBatch.from_eithers(eithers).partition()
+        assert lefts == [e.value for e in eithers if e.is_left()]
+        assert rights == [e.value for e in eithers if e.is_right()]
+
+    def test_either_batch_views_are_not_copied(self):
+        batch = EitherBatch.from_eithers(self._eithers())
+        assert batch.lefts() is batch.partition()[0]
+        assert batch.rights() is batch.partition()[1]
+
+    def test_either_batch_map_matches_either_map(self):
+        eithers = self._eithers()
+        mapped = EitherBatch.from_eithers(eithers).map(lambda v: v + 1)
+        assert mapped.to_eithers() == [e.map(lambda v: v + 1) for e in eithers]
+
+    def test_either_batch_flat_map_matches_either_flat_map(self):
+        def half(v):
+            return Right(v // 2) if v % 2 == 0 else Left("odd")
+
+        eithers = self._eithers() + [Right(2), Right(3)]
+        batch = EitherBatch.from_eithers(eithers).flat_map(half)
+        assert batch.to_eithers() == [e.flat_map(half) for e in eithers]
+        assert batch == EitherBatch.from_eithers(e.flat_map(half) for e in eithers)
+
+    def test_either_batch_map_only_calls_func_on_rights(self):
+        calls = []
+        EitherBatch.from_eithers([Left(1), Right(2)]).map(calls.append)
+        assert calls == [2]
+
+    def test_either_batch_sequence_returns_first_left(self):
+        assert EitherBatch.from_eithers(self._eithers()).sequence() == Left("first")
+
+    def test_either_batch_sequence_of_rights(self):
+        values = [random_int(), random_int()]
+        assert EitherBatch.of_rights(values).sequence() == Right(values)
+        assert EitherBatch.from_eithers([]).sequence() == Right([])
+
+    def test_either_batch_requires_callables(self):
+        batch = EitherBatch.of_rights([random_int()])
+        result = Try.of(lambda: batch.map(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+        result = Try.of(lambda: batch.flat_map(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
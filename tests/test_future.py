@@ -1,6 +1,12 @@
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from pyeffects.Either import Left, Right
 from pyeffects.Future import *
+from pyeffects.Retry import Jitter, RetryPolicy
+from pyeffects.Timer import Timer
 from pyeffects.Try import Try
 from .random_int_generator import random_int
+import asyncio
+import threading
 import time
 
 
@@ -53,9 +59,9 @@ class TestFuture:
         assert result.get() == value
 
     def test_failed_future_flat_maps_to_failure(self):
-        assert (
-            Future.run(self._fail_future).flat_map(lambda v: Future.of(v)).is_failure()
-        )
+        result = Future.run(self._fail_future).flat_map(lambda v: Future.of(v))
+        time.sleep(0.1)
+        assert result.is_failure()
 
     def test_future_flat_map_requires_callable(self):
         result = Try.of(lambda: Future.of(random_int()).flat_map(random_int()))
@@ -147,3 +153,903 @@ class TestFuture:
         time.sleep(0.2)
         assert result.is_failure() is True
         assert capsys.readouterr().out == "ERROR!"
+
+    def test_run_on_custom_scheduler(self):
+        value = random_int()
+        tasks = []
+        result = Future.run(lambda: value, executor=tasks.append)
+        assert result.is_done() is False and len(tasks) == 1
+        tasks[0]()
+        assert result.get() == value
+
+    def test_run_on_executor(self):
+        value = random_int()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = Future.run(lambda: value, executor=executor)
+        assert result.get() == value
+
+    def test_run_on_thread_per_task(self):
+        value = random_int()
+        result = Future.run(lambda: value, executor=thread_per_task)
+        time.sleep(0.1)
+        assert result.get() == value
+
+    def test_run_requires_executor(self):
+        result = Try.of(lambda: Future.run(lambda: 1, executor=random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_default_executor_is_shared(self):
+        assert Future.default_executor() is Future.default_executor()
+
+    def test_set_default_executor(self):
+        value = random_int()
+        Future.set_default_executor(lambda task: task())
+        try:
+            assert Future.run(lambda: value).get() == value
+        finally:
+            Future.set_default_executor(None)
+        assert isinstance(Future.default_executor(), ThreadPoolExecutor)
+
+    def test_set_default_executor_requires_executor(self):
+        result = Try.of(lambda: Future.set_default_executor(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_inline_dispatch_runs_on_completing_thread(self):
+        tasks = []
+        threads = []
+        result = Future.run(lambda: random_int(), executor=tasks.append)
+        result.with_dispatch(Dispatch.INLINE).on_complete(
+            lambda _: threads.append(threading.current_thread())
+        )
+        tasks[0]()
+        assert threads == [threading.current_thread()]
+
+    def test_inline_dispatch_is_inherited_by_map(self):
+        value = random_int()
+        tasks = []
+        result = Future.run(
+            lambda: value, executor=tasks.append, dispatch=Dispatch.INLINE
+        )
+        mapped = result.map(lambda v: v + 1).map(lambda v: v * 2)
+        tasks[0]()
+        assert mapped.dispatch is Dispatch.INLINE
+        assert mapped.get() == (value + 1) * 2
+
+    def test_inline_dispatch_guards_stack_depth(self):
+        tasks = []
+        result = Future.run(lambda: 0, executor=tasks.append, dispatch=Dispatch.INLINE)
+        for _ in range(MAX_INLINE_DEPTH * 4):
+            result = result.map(lambda v: v + 1)
+        tasks[0]()
+        time.sleep(0.2)
+        assert result.get() == MAX_INLINE_DEPTH * 4
+
+    def test_pooled_dispatch(self):
+        value = random_int()
+        tasks = []
+        result = Future.run(
+            lambda: value, executor=tasks.append, dispatch=Dispatch.POOLED
+        )
+        mapped = result.map(lambda v: v + 1)
+        tasks[0]()
+        time.sleep(0.1)
+        assert mapped.get() == value + 1
+
+    def test_set_default_dispatch(self):
+        Future.set_default_dispatch(Dispatch.INLINE)
+        try:
+            tasks = []
+            result = Future.run(lambda: 1, executor=tasks.append).map(lambda v: v + 1)
+            tasks[0]()
+            assert result.get() == 2
+        finally:
+            Future.set_default_dispatch(Dispatch.THREAD)
+        assert Future.default_dispatch() is Dispatch.THREAD
+
+    def test_dispatch_requires_dispatch_mode(self):
+        assert Try.of(lambda: Future.set_default_dispatch("inline")).is_failure()
+        assert Try.of(lambda: Future.of(1).with_dispatch("inline")).is_failure()
+        assert Try.of(lambda: Future.run(lambda: 1, dispatch="inline")).is_failure()
+
+    def test_failing_subscriber_does_not_stop_others(self):
+        tasks = []
+        values = []
+        result = Future.run(lambda: 1, executor=tasks.append, dispatch=Dispatch.INLINE)
+        result.on_complete(lambda _: 1 / 0)
+        result.on_complete(values.append)
+        original_hook = threading.excepthook
+        threading.excepthook = lambda args: None
+        try:
+            tasks[0]()
+        finally:
+            threading.excepthook = original_hook
+        assert values == [Success(1)]
+
+    def test_flat_map_with_raising_function_is_failure(self):
+        result = Future.of(random_int()).map(lambda v: v / 0)
+        assert result.is_failure() and isinstance(result.error(), ZeroDivisionError)
+
+    def test_result_blocks_until_complete(self):
+        value = random_int()
+
+        def delayed_result():
+            time.sleep(0.1)
+            return value
+
+        assert Future.run(delayed_result).result() == Success(value)
+
+    def test_result_of_failed_future(self):
+        result = Future.run(self._fail_future).result()
+        assert result.is_failure() and isinstance(result.error(), RuntimeError)
+
+    def test_result_times_out_with_failure(self):
+        tasks = []
+        result = Future.run(lambda: random_int(), executor=tasks.append).result(0.01)
+        assert result.is_failure() and isinstance(result.error(), TimeoutError)
+
+    def test_wait_all(self):
+        values = [random_int() for _ in range(5)]
+        futures = [Future.run(lambda v=v: v) for v in values]
+        assert Future.wait_all(futures) == [Success(v) for v in values]
+
+    def test_wait_all_times_out_pending_futures(self):
+        tasks = []
+        value = random_int()
+        futures = [Future.of(value), Future.run(lambda: value, executor=tasks.append)]
+        results = Future.wait_all(futures, timeout=0.01)
+        assert results[0] == Success(value)
+        assert results[1].is_failure() and isinstance(results[1].error(), TimeoutError)
+
+    def test_wait_any(self):
+        value = random_int()
+        tasks = []
+        pending = Future.run(lambda: value, executor=tasks.append)
+        assert Future.wait_any([pending, Future.of(value + 1)]) == Success(value + 1)
+
+    def test_wait_any_times_out(self):
+        tasks = []
+        futures = [Future.run(lambda: 1, executor=tasks.append) for _ in range(2)]
+        result = Future.wait_any(futures, timeout=0.01)
+        assert result.is_failure() and isinstance(result.error(), TimeoutError)
+
+    def test_wait_any_requires_futures(self):
+        result = Try.of(lambda: Future.wait_any([]))
+        assert result.is_failure() and isinstance(result.error(), ValueError)
+
+    def test_gather_keeps_input_order(self):
+        values = [random_int() for _ in range(3)]
+        tasks = []
+        futures = [Future.run(lambda v=v: v, executor=tasks.append) for v in values]
+        result = Future.gather(futures).with_dispatch(Dispatch.INLINE)
+        for task in reversed(tasks):
+            assert result.is_done() is False
+            task()
+        assert result.get() == values
+
+    def test_gather_empty_list(self):
+        assert Future.gather([]).get() == []
+
+    def test_gather_fails_on_first_failure(self):
+        tasks = []
+        pending = Future.run(lambda: random_int(), executor=tasks.append)
+        failed = Future.run(self._fail_future, executor=lambda task: task())
+        result = Future.gather([pending, failed])
+        assert result.is_failure() and isinstance(result.error(), RuntimeError)
+        tasks[0]()
+        assert result.is_failure()
+
+    def test_gather_many_futures(self):
+        values = list(range(10000))
+        assert Future.gather([Future.of(v) for v in values]).get() == values
+
+    def test_await_future(self):
+        value = random_int()
+
+        async def main():
+            return await Future.run(lambda: value)
+
+        assert asyncio.run(main()) == value
+
+    def test_await_failed_future_raises(self):
+        async def main():
+            return await Future.run(self._fail_future)
+
+        result = Try.of(lambda: asyncio.run(main()))
+        assert result.is_failure() and isinstance(result.error(), RuntimeError)
+
+    def test_to_asyncio_on_given_loop(self):
+        value = random_int()
+        loop = asyncio.new_event_loop()
+        try:
+            aio_future = Future.of(value).to_asyncio(loop)
+            assert loop.run_until_complete(aio_future) == value
+        finally:
+            loop.close()
+
+    def test_from_asyncio_coroutine(self):
+        value = random_int()
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            return value
+
+        async def main():
+            return await Future.from_asyncio(compute()).map(lambda v: v + 1)
+
+        assert asyncio.run(main()) == value + 1
+
+    def test_from_asyncio_future(self):
+        value = random_int()
+
+        async def main():
+            aio_future = asyncio.get_running_loop().create_future()
+            result = Future.from_asyncio(aio_future)
+            aio_future.set_result(value)
+            await asyncio.sleep(0.01)
+            return result
+
+        assert asyncio.run(main()).get() == value
+
+    def test_from_asyncio_cancelled_future(self):
+        async def main():
+            aio_future = asyncio.get_running_loop().create_future()
+            result = Future.from_asyncio(aio_future)
+            aio_future.cancel()
+            await asyncio.sleep(0.01)
+            return result
+
+        result = asyncio.run(main())
+        assert result.is_failure() and isinstance(result.error(), CancelledError)
+
+    def test_from_asyncio_requires_awaitable(self):
+        result = Try.of(lambda: Future.from_asyncio(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_run_on_loop_executor(self):
+        value = random_int()
+
+        async def main():
+            executor = loop_executor(asyncio.get_running_loop())
+            return await Future.run(lambda: value, executor=executor)
+
+        assert asyncio.run(main()) == value
+
+    def test_run_in_process(self):
+        value = random_int()
+        assert Future.run_in_process(pow, value, 2).result() == Success(value**2)
+
+    def test_run_in_process_failure(self):
+        result = Future.run_in_process(int, "abc").result()
+        assert result.is_failure() and isinstance(result.error(), ValueError)
+
+    def test_run_in_process_unpicklable_callable(self):
+        result = Future.run_in_process(lambda: random_int()).result()
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_run_in_process_requires_callable(self):
+        result = Try.of(lambda: Future.run_in_process(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_map_in_process(self):
+        values = [random_int() for _ in range(10)]
+        result = Future.map_in_process(pow, [(v, 2) for v in values], chunksize=3)
+        assert result.result() == Success([v**2 for v in values])
+
+    def test_map_in_process_unpicklable_callable(self):
+        result = Future.map_in_process(lambda v: v, [1, 2, 3]).result()
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_set_process_pool_size(self):
+        Future.set_process_pool_size(1)
+        try:
+            assert Future.process_pool()._max_workers == 1
+            assert Future.run_in_process(abs, -1).result() == Success(1)
+        finally:
+            Future.set_process_pool_size(None)
+
+    def test_process_pool_does_not_fork(self):
+        method = Future.process_pool()._mp_context.get_start_method()
+        assert method in ("forkserver", "spawn")
+
+    def test_set_process_pool_size_requires_positive_int(self):
+        result = Try.of(lambda: Future.set_process_pool_size(0))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_cancel_pending_future(self):
+        tasks = []
+        calls = []
+        result = Future.run(lambda: calls.append(1), executor=tasks.append)
+        assert result.cancel() is True
+        tasks[0]()
+        assert result.is_cancelled() and isinstance(result.error(), CancelledError)
+        assert calls == []
+
+    def test_cancel_completed_future(self):
+        result = Future.of(random_int())
+        assert result.cancel() is False
+        assert result.is_success() and not result.is_cancelled()
+
+    def test_cancel_skips_continuations(self):
+        tasks = []
+        calls = []
+        result = Future.run(lambda: random_int(), executor=tasks.append)
+        mapped = result.with_dispatch(Dispatch.INLINE).map(calls.append)
+        result.cancel()
+        assert mapped.is_cancelled() and calls == []
+
+    def test_cancel_derived_future_skips_its_continuation(self):
+        tasks = []
+        calls = []
+        result = Future.run(lambda: random_int(), executor=tasks.append)
+        mapped = result.with_dispatch(Dispatch.INLINE).map(calls.append)
+        mapped.cancel()
+        tasks[0]()
+        assert result.is_success() and mapped.is_cancelled() and calls == []
+
+    def test_late_completion_is_ignored(self):
+        tasks = []
+        result = Future.run(lambda: random_int(), executor=tasks.append)
+        result.cancel()
+        result._callback(Success(random_int()))
+        assert result.is_cancelled()
+
+    def test_token_cancels_derived_futures(self):
+        token = CancellationToken()
+        tasks = []
+        result = Future.run(lambda: 1, executor=tasks.append, token=token)
+        inner = Future.run(lambda: 2, executor=tasks.append, token=token)
+        combined = result.flat_map(lambda v1: inner.map(lambda v2: v1 + v2))
+        gathered = Future.gather([result, inner])
+        token.cancel()
+        for task in tasks:
+            task()
+        assert token.is_cancelled()
+        assert result.is_cancelled() and inner.is_cancelled()
+        assert combined.is_cancelled() and gathered.is_cancelled()
+
+    def test_token_cancelled_before_run(self):
+        token = CancellationToken()
+        token.cancel()
+        tasks = []
+        result = Future.run(lambda: random_int(), executor=tasks.append, token=token)
+        tasks[0]()
+        assert result.is_cancelled()
+
+    def test_token_does_not_cancel_completed_futures(self):
+        token = CancellationToken()
+        result = Future.run(lambda: 5, executor=lambda task: task(), token=token)
+        token.cancel()
+        assert result.get() == 5
+
+    def test_token_raise_if_cancelled(self):
+        token = CancellationToken()
+        token.raise_if_cancelled()
+        token.cancel()
+        result = Try.of(token.raise_if_cancelled)
+        assert result.is_failure() and isinstance(result.error(), CancelledError)
+
+    def test_cooperative_cancellation_in_run(self):
+        started = threading.Event()
+        steps = []
+
+        def work():
+            started.set()
+            while True:
+                Future.raise_if_cancelled()
+                steps.append(1)
+                time.sleep(0.01)
+
+        result = Future.run(work, executor=thread_per_task)
+        started.wait()
+        result.cancel()
+        time.sleep(0.05)
+        count = len(steps)
+        time.sleep(0.05)
+        assert result.is_cancelled() and len(steps) == count
+
+    def test_run_requires_token(self):
+        result = Try.of(lambda: Future.run(lambda: 1, token=random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_cancelling_asyncio_future_cancels_future(self):
+        tasks = []
+        result = Future.run(lambda: random_int(), executor=tasks.append)
+
+        async def main():
+            aio_future = result.to_asyncio()
+            aio_future.cancel()
+            await asyncio.sleep(0)
+
+        asyncio.run(main())
+        assert result.is_cancelled()
+
+    def test_race_completes_with_first_result(self):
+        tasks = []
+        first = Future.run(lambda: 1, executor=tasks.append)
+        second = Future.run(lambda: 2, executor=tasks.append)
+        result = Future.race([first, second])
+        tasks[1]()
+        assert result.get() == 2
+        assert first.is_cancelled()
+
+    def test_race_completes_with_first_failure(self):
+        tasks = []
+        pending = Future.run(lambda: random_int(), executor=tasks.append)
+        failed = Future.run(self._fail_future, executor=tasks.append)
+        result = Future.race([pending, failed])
+        tasks[1]()
+        assert result.is_failure() and isinstance(result.error(), RuntimeError)
+
+    def test_race_with_completed_future(self):
+        value = random_int()
+        tasks = []
+        pending = Future.run(lambda: random_int(), executor=tasks.append)
+        assert Future.race([Future.of(value), pending]).get() == value
+        assert pending.is_cancelled()
+
+    def test_race_without_cancelling_losers_unsubscribes(self):
+        tasks = []
+        first = Future.run(lambda: 1, executor=tasks.append)
+        second = Future.run(lambda: 2, executor=tasks.append)
+        result = Future.race([first, second], cancel_losers=False)
+        tasks[0]()
+        assert result.get() == 1
+        assert not second.subscribers and not second.is_done()
+        tasks[1]()
+        assert second.get() == 2 and result.get() == 1
+
+    def test_cancelling_race_cancels_inputs(self):
+        tasks = []
+        futures = [Future.run(lambda: 1, executor=tasks.append) for _ in range(2)]
+        Future.race(futures).cancel()
+        assert all(future.is_cancelled() for future in futures)
+
+    def test_first_success_skips_failures(self):
+        value = random_int()
+        tasks = []
+        failed = Future.run(self._fail_future, executor=tasks.append)
+        succeeded = Future.run(lambda: value, executor=tasks.append)
+        result = Future.first_success([failed, succeeded])
+        tasks[0]()
+        assert result.is_done() is False
+        tasks[1]()
+        assert result.get() == value
+
+    def test_first_success_fails_when_all_fail(self):
+        futures = [Future.run(self._fail_future) for _ in range(3)]
+        result = Future.first_success(futures).result()
+        assert result.is_failure() and isinstance(result.error(), RuntimeError)
+
+    def test_race_requires_futures(self):
+        assert Try.of(lambda: Future.race([])).is_failure()
+        assert Try.of(lambda: Future.first_success([])).is_failure()
+
+    def test_traverse_with_limit_bounds_in_flight(self):
+        tasks = []
+        values = list(range(10))
+        result = Future.traverse_with_limit(
+            values, lambda v: Future.run(lambda: v * 2, executor=tasks.append), 3
+        )
+        started = 0
+        while started < len(tasks):
+            assert len(tasks) - started <= 3
+            tasks[started]()
+            started += 1
+        assert started == len(values)
+        assert result.get() == [v * 2 for v in values]
+
+    def test_traverse_with_limit_pulls_lazily(self):
+        pulled = []
+
+        def elements():
+            for v in range(100):
+                pulled.append(v)
+                yield v
+
+        tasks = []
+        Future.traverse_with_limit(
+            elements(), lambda v: Future.run(lambda: v, executor=tasks.append), 2
+        )
+        assert pulled == [0, 1]
+        tasks[0]()
+        assert pulled == [0, 1, 2]
+
+    def test_traverse_with_limit_unordered(self):
+        tasks = []
+        result = Future.traverse_with_limit(
+            [1, 2, 3],
+            lambda v: Future.run(lambda: v, executor=tasks.append),
+            3,
+            ordered=False,
+        )
+        for task in reversed(tasks):
+            task()
+        assert result.get() == [3, 2, 1]
+
+    def test_traverse_with_limit_fail_fast_stops_pulling(self):
+        pulled = []
+
+        def elements():
+            for v in range(10):
+                pulled.append(v)
+                yield v
+
+        tasks = []
+
+        def work(v):
+            if v == 0:
+                return Future.run(self._fail_future, executor=tasks.append)
+            return Future.run(lambda: v, executor=tasks.append)
+
+        result = Future.traverse_with_limit(elements(), work, 2)
+        tasks[0]()
+        assert result.is_failure() and isinstance(result.error(), RuntimeError)
+        assert pulled == [0, 1]
+        assert len(tasks) == 2
+
+    def test_traverse_with_limit_fail_fast_cancels_in_flight(self):
+        tasks = []
+        futures = []
+
+        def work(v):
+            future = Future.run(
+                self._fail_future if v == 0 else lambda: v, executor=tasks.append
+            )
+            futures.append(future)
+            return future
+
+        result = Future.traverse_with_limit(range(3), work, 3)
+        tasks[0]()
+        assert result.is_failure()
+        assert futures[1].is_cancelled() and futures[2].is_cancelled()
+
+    def test_traverse_with_limit_unordered_fail_fast_cancels_in_flight(self):
+        from pyeffects.Promise import Promise
+
+        promises = [Promise() for _ in range(3)]  # type: list
+
+        result = Future.traverse_with_limit(
+            range(3), lambda v: promises[v].future, 3, ordered=False
+        )
+        promises[0].failure(RuntimeError("Failed"))
+        assert result.is_failure()
+        assert promises[1].future.is_cancelled()
+        assert promises[2].future.is_cancelled()
+
+    def test_traverse_with_limit_without_fail_fast(self):
+        result = Future.traverse_with_limit(
+            ["1", "a", "3"], lambda v: Future.run(lambda: int(v)), 2, fail_fast=False
+        ).result()
+        values = result.get()
+        assert values[0] == Success(1) and values[2] == Success(3)
+        assert values[1].is_failure() and isinstance(values[1].error(), ValueError)
+
+    def test_traverse_with_limit_iterator_raises(self):
+        def elements():
+            yield 1
+            raise ValueError("broken")
+
+        result = Future.traverse_with_limit(elements(), Future.of, 2)
+        assert result.is_failure() and isinstance(result.error(), ValueError)
+
+    def test_traverse_with_limit_func_raises(self):
+        def work(v):
+            raise ValueError("bad element")
+
+        result = Future.traverse_with_limit([1, 2], work, 1).result(1)
+        assert result.is_failure() and isinstance(result.error(), ValueError)
+
+    def test_traverse_with_limit_requires_positive_limit(self):
+        result = Try.of(lambda: Future.traverse_with_limit([1], Future.of, 0))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_traverse_with_limit_cancelled_by_token(self):
+        token = CancellationToken()
+        pulled = []
+
+        def elements():
+            for v in range(10):
+                pulled.append(v)
+                yield v
+
+        tasks = []
+        result = Future.traverse_with_limit(
+            elements(),
+            lambda v: Future.run(lambda: v, executor=tasks.append),
+            2,
+            token=token,
+        )
+        token.cancel()
+        for task in tasks:
+            task()
+        assert result.is_cancelled() and pulled == [0, 1]
+
+    def test_success_with_cancelled_error_value_is_not_cancelled(self):
+        assert Future.of(CancelledError()).is_cancelled() is False
+
+    def test_wait_any_unsubscribes_from_pending_futures(self):
+        tasks = []
+        pending = Future.run(lambda: 1, executor=tasks.append)
+        Future.wait_any([pending, Future.of(2)])
+        Future.wait_any([pending], timeout=0.01)
+        assert not pending.subscribers
+
+    def test_race_with_completed_future_does_not_subscribe_to_losers(self):
+        tasks = []
+        pending = Future.run(lambda: random_int(), executor=tasks.append)
+        result = Future.race([Future.of(1), pending], cancel_losers=False)
+        assert result.get() == 1 and not pending.subscribers
+
+    def test_concurrent_subscribers_are_each_notified_once(self):
+        tasks = []
+        result = Future.run(lambda: 1, executor=tasks.append, dispatch=Dispatch.INLINE)
+        calls = []
+        barrier = threading.Barrier(9)
+
+        def subscribe():
+            barrier.wait()
+            for _ in range(200):
+                result.on_complete(calls.append)
+
+        threads = [threading.Thread(target=subscribe) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        tasks[0]()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1600 and not result.subscribers
+
+    def test_tail_rec_m_with_completed_steps(self):
+        result = Future.tail_rec_m(
+            0, lambda n: Future.of(Left(n + 1) if n < 100000 else Right(n))
+        )
+        assert result.get() == 100000
+
+    def test_tail_rec_m_with_pending_steps(self):
+        def step(n):
+            return Future.run(lambda: Left(n + 1) if n < 20 else Right(n))
+
+        assert Future.tail_rec_m(0, step).result(1) == Success(20)
+
+    def test_tail_rec_m_fails_with_step(self):
+        def step(n):
+            if n < 10:
+                return Future.of(Left(n + 1))
+            raise RuntimeError("Failed")
+
+        result = Future.tail_rec_m(0, step)
+        assert result.is_failure() and isinstance(result.error(), RuntimeError)
+
+    def test_deep_recursive_flat_map_does_not_overflow(self):
+        def loop(n):
+            if n == 0:
+                return Future.of("done")
+            return Future.of(n - 1).flat_map(loop)
+
+        assert loop(10000).get() == "done"
+
+    def test_long_inline_map_chain_completes_synchronously(self):
+        tasks = []
+        result = Future.run(lambda: 0, executor=tasks.append, dispatch=Dispatch.INLINE)
+        for _ in range(10000):
+            result = result.map(lambda v: v + 1)
+        tasks[0]()
+        assert result.get() == 10000
+
+    def test_inline_chain_completes_when_subscriber_raises(self):
+        from pyeffects.Promise import Promise
+
+        promise = Promise(Dispatch.INLINE)  # type: Promise[int]
+        result = promise.future
+        for _ in range(200):
+            result = result.map(lambda v: v + 1)
+
+        def subscriber(value):
+            promise.success(0)
+            raise RuntimeError("Failed")
+
+        raised = Try.of(lambda: Future.of(random_int()).on_complete(subscriber))
+        Future.of(random_int()).on_complete(lambda v: None)
+        assert raised.is_failure() and result.value == Success(200)
+
+    def test_retry_returns_first_success(self):
+        value = random_int()
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("Failed")
+            return value
+
+        result = Future.retry(flaky, RetryPolicy(3, 0.001))
+        assert result.result(1) == Success(value) and len(calls) == 3
+
+    def test_retry_returns_last_failure(self):
+        calls = []
+
+        def failing():
+            calls.append(1)
+            raise RuntimeError("Failed %d" % len(calls))
+
+        result = Future.retry(failing, RetryPolicy(3, 0.001)).result(1)
+        assert result.is_failure() and str(result.error()) == "Failed 3"
+
+    def test_retry_only_retries_listed_errors(self):
+        calls = []
+
+        def failing():
+            calls.append(1)
+            raise ValueError("Failed")
+
+        policy = RetryPolicy(3, 0.001, retry_on=[RuntimeError])
+        assert Future.retry(failing, policy).result(1).is_failure()
+        assert len(calls) == 1
+
+    def test_retry_waits_on_timer_not_on_workers(self):
+        tasks = []
+        calls = []
+
+        def failing():
+            calls.append(1)
+            raise RuntimeError("Failed")
+
+        policy = RetryPolicy(2, 0.05, jitter=Jitter.NONE)
+        result = Future.retry(failing, policy, executor=tasks.append)
+        tasks.pop()()
+        assert tasks == [] and not result.is_done()
+        time.sleep(0.2)
+        tasks.pop()()
+        assert result.is_failure() and len(calls) == 2
+
+    def test_many_retries_share_one_timer_thread(self):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            before = threading.active_count()
+            counts = {}
+
+            def flaky(i):
+                counts[i] = counts.get(i, 0) + 1
+                if counts[i] < 2:
+                    raise RuntimeError("Failed")
+                return i
+
+            policy = RetryPolicy(2, 0.05)
+            futures = [
+                Future.retry(lambda i=i: flaky(i), policy, executor=pool)
+                for i in range(1000)
+            ]
+            assert Future.gather(futures).result(5) == Success(list(range(1000)))
+            assert threading.active_count() <= before + 5
+
+    def test_retry_stops_when_cancelled(self):
+        token = CancellationToken()
+        calls = []
+
+        def failing():
+            calls.append(1)
+            raise RuntimeError("Failed")
+
+        policy = RetryPolicy(5, 0.05, jitter=Jitter.NONE)
+        result = Future.retry(failing, policy, token=token)
+        time.sleep(0.02)
+        token.cancel()
+        time.sleep(0.3)
+        assert result.is_cancelled() and len(calls) == 1
+
+    def test_retry_requires_callable_and_policy(self):
+        result = Try.of(lambda: Future.retry(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+        result = Try.of(lambda: Future.retry(lambda: 5, random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_delay_completes_after_seconds(self):
+        value = random_int()
+        start = time.monotonic()
+        result = Future.delay(0.05, value)
+        assert not result.is_done()
+        assert result.result(1) == Success(value)
+        assert time.monotonic() - start >= 0.05
+
+    def test_cancelled_delay_removes_timer(self):
+        before = Timer.default().pending()
+        result = Future.delay(10, random_int())
+        assert Timer.default().pending() == before + 1
+        result.cancel()
+        assert Timer.default().pending() == before and result.is_cancelled()
+
+    def test_schedule_runs_func_at_time(self):
+        value = random_int()
+        tasks = []
+        result = Future.schedule(time.time() + 0.05, lambda: value, tasks.append)
+        assert tasks == []
+        time.sleep(0.1)
+        tasks.pop()()
+        assert result.get() == value
+
+    def test_schedule_in_the_past_runs_straight_away(self):
+        value = random_int()
+        assert Future.schedule(time.time() - 1, lambda: value).result(1).get() == value
+
+    def test_cancelled_schedule_does_not_run(self):
+        calls = []
+        token = CancellationToken()
+        result = Future.schedule(
+            time.time() + 0.02, lambda: calls.append(1), token=token
+        )
+        token.cancel()
+        time.sleep(0.05)
+        assert result.is_cancelled() and calls == []
+
+    def test_within_passes_through_result(self):
+        value = random_int()
+        assert Future.delay(0.01, value).within(1).result(1) == Success(value)
+
+    def test_within_times_out(self):
+        source = Future.delay(1, random_int())
+        result = source.within(0.02).result(1)
+        assert result.is_failure() and isinstance(result.error(), TimeoutError)
+        assert not source.is_done()
+        source.cancel()
+
+    def test_within_can_cancel_source(self):
+        source = Future.delay(1, random_int())
+        assert source.within(0.02, cancel=True).result(1).is_failure()
+        assert source.is_cancelled()
+
+    def test_many_pending_delays_use_one_thread(self):
+        before = threading.active_count()
+        futures = [Future.delay(0.05, i) for i in range(10000)]
+        assert threading.active_count() <= before + 1
+        assert Future.gather(futures).result(5) == Success(list(range(10000)))
+
+    def test_schedule_requires_callable(self):
+        result = Try.of(lambda: Future.schedule(time.time(), random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_concurrent_subscribe_and_complete_notify_every_subscriber_once(self):
+        for _ in range(20):
+            future = Future(None, Dispatch.INLINE)
+            calls = []
+            barrier = threading.Barrier(9)
+
+            def subscribe():
+                barrier.wait()
+                for _ in range(100):
+                    future.on_complete(calls.append)
+
+            def complete(value):
+                barrier.wait()
+                future._try_complete(Success(value))
+
+            threads = [threading.Thread(target=subscribe) for _ in range(4)]
+            threads += [threading.Thread(target=complete, args=[i]) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            barrier.wait()
+            for thread in threads:
+                thread.join()
+            assert len(calls) == 400 and all(value is future.value for value in calls)
+
+    def test_concurrent_cancel_and_complete_agree_on_one_result(self):
+        for _ in range(200):
+            future = Future(None, Dispatch.INLINE)
+            wins = []
+            barrier = threading.Barrier(2)
+
+            def race(attempt):
+                barrier.wait()
+                if attempt():
+                    wins.append(1)
+
+            threads = [
+                threading.Thread(target=race, args=[future.cancel]),
+                threading.Thread(
+                    target=race, args=[lambda: future._try_complete(Success(1))]
+                ),
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert len(wins) == 1 and future.is_done()
@@ -0,0 +1,110 @@
+from concurrent.futures import CancelledError, InvalidStateError, ThreadPoolExecutor
+from pyeffects.Future import Future
+from pyeffects.FutureScope import *
+from pyeffects.Try import Try
+from .random_int_generator import random_int
+import threading
+import time
+
+
+class TestFutureScope:
+    def test_scope_aggregates_values_in_start_order(self):
+        value = random_int()
+        with FutureScope() as scope:
+            scope.run(lambda: (time.sleep(0.02), value)[1])
+            scope.run(lambda: value + 1)
+        assert scope.result == Success([value, value + 1])
+
+    def test_empty_scope_succeeds(self):
+        with FutureScope() as scope:
+            pass
+        assert scope.result == Success([])
+
+    def test_exit_waits_for_every_function(self):
+        finished = []
+        with FutureScope() as scope:
+            for i in range(5):
+                scope.run(lambda i=i: (time.sleep(0.01), finished.append(i)))
+        assert sorted(finished) == list(range(5))
+
+    def test_failure_cancels_siblings(self):
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            started = []
+            with FutureScope() as scope:
+                scope.run(self._fail, pool)
+                sibling = scope.run(lambda: started.append(1), pool)
+        assert sibling.is_cancelled() and started == []
+        assert isinstance(scope.result.error(), RuntimeError)
+
+    def test_failure_without_cancel_on_failure_lets_siblings_finish(self):
+        value = random_int()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with FutureScope(cancel_on_failure=False) as scope:
+                scope.run(self._fail, pool)
+                sibling = scope.run(lambda: value, pool)
+        assert sibling.get() == value
+        assert isinstance(scope.result.error(), RuntimeError)
+
+    def test_running_children_can_stop_cooperatively(self):
+        steps = []
+
+        def work():
+            for step in range(100):
+                Future.raise_if_cancelled()
+                steps.append(step)
+                time.sleep(0.01)
+
+        with FutureScope() as scope:
+            scope.run(work)
+            time.sleep(0.02)
+            scope.run(self._fail)
+        assert len(steps) < 100 and isinstance(scope.result.error(), RuntimeError)
+
+    def test_exception_in_block_cancels_children(self):
+        tasks = []
+        result = Try.of(lambda: self._raise_in_scope(tasks))
+        assert isinstance(result.error(), ValueError)
+        scope, child = result.error().args
+        for task in tasks:
+            task()
+        assert child.is_cancelled() and isinstance(scope.result.error(), ValueError)
+
+    @staticmethod
+    def _raise_in_scope(tasks):
+        with FutureScope(timeout=0.05) as scope:
+            child = scope.run(lambda: 5, tasks.append)
+            raise ValueError(scope, child)
+
+    def test_wait_false_cancels_pending_children(self):
+        release = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with FutureScope(wait=False) as scope:
+                scope.run(release.wait, pool)
+                queued = scope.run(lambda: 5, pool)
+                release.set()
+        assert queued.is_cancelled()
+        assert isinstance(scope.result.error(), CancelledError)
+
+    def test_timeout_cancels_children_still_running(self):
+        tasks = []
+        with FutureScope(timeout=0.02) as scope:
+            child = scope.run(lambda: 5, tasks.append)
+        assert child.is_cancelled() and isinstance(scope.result.error(), CancelledError)
+
+    def test_run_after_exit_raises(self):
+        with FutureScope() as scope:
+            pass
+        result = Try.of(lambda: scope.run(lambda: 5))
+        assert result.is_failure() and isinstance(result.error(), InvalidStateError)
+
+    def test_run_requires_callable(self):
+        with FutureScope() as scope:
+            result = Try.of(lambda: scope.run(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_scope_repr(self):
+        assert str(FutureScope()).startswith("FutureScope")
+
+    @staticmethod
+    def _fail():
+        raise RuntimeError("Failed")
@@ -0,0 +1,110 @@
+from pyeffects.Future import Dispatch, Future
+from pyeffects.Metrics import *
+from pyeffects.Try import Success, Try
+from .random_int_generator import random_int
+import pyeffects.Metrics
+import time
+
+
+class RecordingSink(MetricsSink):
+    def __init__(self):
+        self.events = []
+
+    def count(self, name, value=1):
+        self.events.append((name, value))
+
+    def observe(self, name, value):
+        self.events.append((name, value))
+
+
+class TestMetrics:
+    @staticmethod
+    def _with_sink(sink, func):
+        set_sink(sink)
+        try:
+            return func()
+        finally:
+            set_sink(None)
+
+    def test_histogram_buckets_and_percentiles(self):
+        histogram = Histogram([1, 10, 100])
+        for value in [0.5, 2, 3, 50, 500]:
+            histogram.observe(value)
+        assert histogram.buckets == [1, 2, 1, 1]
+        assert histogram.count == 5 and histogram.total == 555.5
+        assert histogram.min == 0.5 and histogram.max == 500
+        assert histogram.percentile(0.5) == 10 and histogram.percentile(1) == 500
+
+    def test_empty_histogram_has_no_percentile(self):
+        assert Histogram([1]).percentile(0.5) is None
+
+    def test_in_memory_sink_counts_and_observes(self):
+        sink = InMemorySink()
+        sink.count("a")
+        sink.count("a", 2)
+        sink.count("a", -1)
+        sink.observe("b", 0.5)
+        assert sink.counter("a") == 2 and sink.histogram("b").count == 1
+        assert sink.histogram("c").count == 0
+        sink.reset()
+        assert sink.counter("a") == 0
+
+    def test_run_reports_queue_and_run_time(self):
+        sink = InMemorySink()
+        tasks = []
+
+        def run():
+            result = Future.run(lambda: time.sleep(0.02), executor=tasks.append)
+            assert sink.counter(PENDING) == 1
+            time.sleep(0.02)
+            tasks.pop()()
+            return result
+
+        self._with_sink(sink, run).result(1)
+        assert sink.counter(PENDING) == 0 and sink.counter(RUNNING) == 0
+        assert sink.histogram(QUEUE_TIME).min >= 0.02
+        assert sink.histogram(RUN_TIME).min >= 0.02
+
+    def test_running_counts_busy_workers(self):
+        sink = InMemorySink()
+        seen = []
+
+        def work():
+            seen.append(sink.counter(RUNNING))
+
+        self._with_sink(sink, lambda: Future.run(work).result(1))
+        assert seen == [1]
+
+    def test_completion_reports_subscribers_and_notify_time(self):
+        sink = InMemorySink()
+        tasks = []
+
+        def run():
+            result = Future.run(
+                lambda: 5, executor=tasks.append, dispatch=Dispatch.THREAD
+            )
+            mapped = [result.map(lambda v, i=i: v + i) for i in range(3)]
+            tasks.pop()()
+            return Future.gather(mapped)
+
+        assert self._with_sink(sink, run).result(1) == Success([5, 6, 7])
+        assert sink.histogram(SUBSCRIBERS).max == 3
+        assert sink.histogram(NOTIFY_TIME).count == 3
+
+    def test_futures_report_to_the_sink_they_were_created_with(self):
+        sink = RecordingSink()
+        result = self._with_sink(
+            sink, lambda: Future.run(lambda: 5, executor=lambda task: None)
+        )
+        result.cancel()
+        assert (PENDING, 1) in sink.events and (PENDING, -1) in sink.events
+
+    def test_disabled_metrics_report_nothing(self):
+        sink = RecordingSink()
+        set_sink(None)
+        Future.run(lambda: random_int()).result(1)
+        assert sink.events == [] and pyeffects.Metrics.sink() is None
+
+    def test_set_sink_requires_metrics_sink(self):
+        result = Try.of(lambda: set_sink(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
@@ -1,3 +1,4 @@
+from pyeffects.Either import Either, Left, Right
 from pyeffects.Option import *
 from pyeffects.Try import *
 from .random_int_generator import random_int
@@ -61,3 +62,49 @@ class TestMonad:
     def test_monad_or_else_requires_other_monad(self):
         result = Try.of(lambda: Some(random_int()).or_else(random_int()))
         assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_tail_rec_m_runs_in_constant_stack(self):
+        result = Option.tail_rec_m(
+            0, lambda n: Some(Left(n + 1) if n < 100000 else Right(n))
+        )
+        assert result == Some(100000)
+
+    def test_tail_rec_m_stops_on_empty(self):
+        result = Option.tail_rec_m(0, lambda n: Some(Left(n + 1)) if n < 10 else empty)
+        assert result is empty
+
+    def test_tail_rec_m_either_stops_on_left(self):
+        value = random_int()
+        result = Either.tail_rec_m(
+            0, lambda n: Right(Left(n + 1)) if n < 10 else Left(value)
+        )
+        assert result == Left(value)
+
+    def test_tail_rec_m_try_stops_on_failure(self):
+        def step(n):
+            if n < 10:
+                return Success(Left(n + 1))
+            return Failure(RuntimeError("Failed"))
+
+        result = Try.tail_rec_m(0, step)
+        assert result.is_failure() and isinstance(result.error(), RuntimeError)
+
+    def test_tail_rec_m_requires_callable(self):
+        result = Try.of(lambda: Option.tail_rec_m(0, random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_trusted_mode_skips_callable_checks(self):
+        from pyeffects.Monad import is_trusted, set_trusted
+
+        not_callable = random_int()
+        set_trusted(True)
+        try:
+            assert is_trusted()
+            assert empty.map(not_callable) is empty
+            result = Try.of(lambda: Some(random_int()).map(not_callable))
+        finally:
+            set_trusted(False)
+        assert not is_trusted()
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+        result = Try.of(lambda: empty.map(not_callable))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
@@ -59,3 +59,41 @@ class TestOption:
 
     def test_option_type_inequality(self):
         assert Some(random_int()) != Empty()
+
+    def test_option_instances_have_no_dict(self):
+        assert not hasattr(Some(random_int()), "__dict__")
+        assert not hasattr(empty, "__dict__")
+
+    def test_empty_is_a_singleton(self):
+        import copy
+        import pickle
+
+        assert Empty() is empty
+        assert pickle.loads(pickle.dumps(empty)) is empty
+        assert copy.deepcopy(empty) is empty
+
+    def test_some_pickles(self):
+        import pickle
+
+        value = random_int()
+        assert pickle.loads(pickle.dumps(Some(value))) == Some(value)
+
+    def test_option_map_of_none_is_empty(self):
+        assert Some(random_int()).map(lambda v: None) is empty
+
+    def test_empty_map_returns_empty(self):
+        assert empty.map(lambda v: v + 1) is empty
+
+    def test_option_map_requires_callable(self):
+        result = Try.of(lambda: Some(random_int()).map(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_option_filter(self):
+        value = random_int()
+        assert Some(value).filter(lambda v: v == value) == Some(value)
+        assert Some(value).filter(lambda v: v != value) is empty
+        assert empty.filter(lambda v: True) is empty
+
+    def test_option_filter_requires_callable(self):
+        result = Try.of(lambda: Some(random_int()).filter(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
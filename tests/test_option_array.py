@@ -0,0 +1,66 @@
+from pyeffects.Option import Some, empty
+from pyeffects.Try import Try
+from .random_int_generator import random_int
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from pyeffects.OptionArray import OptionArray  # noqa: E402
+
+
+class TestOptionArray:
+    def test_option_array_round_trips_options(self):
+        options = [Some(random_int()), empty, Some(random_int()), empty]
+        array = OptionArray.from_options(options)
+        assert array.to_options() == options
+        assert len(array) == 4 and array.count() == 2
+
+    def test_option_array_from_values_treats_none_as_empty(self):
+        value = random_int()
+        array = OptionArray.from_values([value, None])
+        assert array[0] == Some(value) and array[1] is empty
+        assert array.is_defined().tolist() == [True, False]
+        assert array.is_empty().tolist() == [False, True]
+
+    def test_option_array_map_matches_option_map(self):
+        options = [Some(random_int()), empty, Some(random_int())]
+        mapped = OptionArray.from_options(options).map(lambda v: v * 2 + 1)
+        assert mapped.to_options() == [o.map(lambda v: v * 2 + 1) for o in options]
+
+    def test_option_array_map_empties_masked_results(self):
+        array = OptionArray.from_values([numpy.e, -1.0, None]).map(numpy.ma.log)
+        assert array.to_options() == [Some(1.0), empty, empty]
+
+    def test_option_array_filter_matches_option_filter(self):
+        values = [random_int() for _ in range(10)] + [None]
+        options = [Some(v) if v is not None else empty for v in values]
+        filtered = OptionArray.from_values(values).filter(lambda v: v % 2 == 0)
+        assert filtered.to_options() == [
+            o.filter(lambda v: v % 2 == 0) for o in options
+        ]
+
+    def test_option_array_flat_map_keeps_values_defined_in_both(self):
+        array = OptionArray.from_values([4, None, 9, 2])
+        result = array.flat_map(lambda v: OptionArray(v * 10, v > 3))
+        assert result.to_options() == [Some(40), empty, Some(90), empty]
+
+    def test_option_array_get_or_else_fills_empty_values(self):
+        value = random_int()
+        filled = OptionArray.from_values([1, None, 3]).get_or_else(value)
+        assert filled.tolist() == [1, value, 3]
+
+    def test_option_array_operations_do_not_change_the_source(self):
+        array = OptionArray.from_values([1, 2, 3])
+        array.filter(lambda v: v > 1).map(lambda v: v * 0)
+        assert array.to_options() == [Some(1), Some(2), Some(3)]
+
+    def test_option_array_requires_callables(self):
+        array = OptionArray.from_values([1, 2])
+        for method in (array.map, array.filter, array.flat_map):
+            result = Try.of(lambda: method(random_int()))
+            assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_option_array_flat_map_requires_option_array(self):
+        array = OptionArray.from_values([1, 2])
+        result = Try.of(lambda: array.flat_map(lambda v: v))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
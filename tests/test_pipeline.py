@@ -0,0 +1,89 @@
+from pyeffects.Either import Left, Right
+from pyeffects.Option import Some, empty
+from pyeffects.Pipeline import Pipeline
+from pyeffects.Try import Failure, Success, Try
+from .random_int_generator import random_int
+
+
+class TestPipeline:
+    def test_option_pipeline_matches_chained_calls(self):
+        pipeline = (
+            Pipeline.of_option()
+            .map(lambda v: v + 1)
+            .filter(lambda v: v % 2 == 0)
+            .flat_map(lambda v: Some(v * v) if v > 2 else empty)
+        )
+        for value in range(-3, 10):
+            expected = (
+                Some(value)
+                .map(lambda v: v + 1)
+                .filter(lambda v: v % 2 == 0)
+                .flat_map(lambda v: Some(v * v) if v > 2 else empty)
+            )
+            assert pipeline(value) == expected
+
+    def test_option_pipeline_treats_none_as_empty(self):
+        pipeline = Pipeline.of_option().map(lambda v: None)
+        assert pipeline(None) is empty and pipeline(random_int()) is empty
+
+    def test_either_pipeline_stops_at_first_left(self):
+        calls = []
+        pipeline = (
+            Pipeline.of_either()
+            .flat_map(lambda v: Left("negative") if v < 0 else Right(v))
+            .filter(lambda v: v > 0, "zero")
+            .map(lambda v: calls.append(v) or v * 2)
+        )
+        value = random_int()
+        assert pipeline(value) == Right(value * 2)
+        assert pipeline(-value) == Left("negative")
+        assert pipeline(0) == Left("zero")
+        assert calls == [value]
+
+    def test_try_pipeline_captures_exceptions(self):
+        error = RuntimeError("failed")
+
+        def fail(v):
+            raise error
+
+        value = random_int()
+        assert Pipeline.of_try().map(lambda v: v * 2)(value) == Success(value * 2)
+        assert Pipeline.of_try().map(fail)(value).error() is error
+        result = Pipeline.of_try().filter(lambda v: v < 0)(value)
+        assert result.is_failure() and isinstance(result.error(), ValueError)
+        result = Pipeline.of_try().flat_map(lambda v: Failure(error))(value)
+        assert result.error() is error
+
+    def test_try_pipeline_matches_chained_calls(self):
+        steps = [lambda v: v + 1, lambda v: dict, lambda v: len(v)]
+        pipeline = Pipeline.of_try()
+        for step in steps:
+            pipeline = pipeline.map(step)
+        value = random_int()
+        expected = Success(value)  # type: Try
+        for step in steps:
+            expected = expected.map(step)
+        assert pipeline(value) == expected == Success(0)
+        assert Pipeline.of_try().map(lambda v: dict)(value) == Success({})
+
+    def test_pipeline_steps_return_new_pipelines(self):
+        base = Pipeline.of_option().map(lambda v: v + 1)
+        doubled = base.map(lambda v: v * 2)
+        value = random_int()
+        assert base(value) == Some(value + 1)
+        assert doubled(value) == Some((value + 1) * 2)
+        assert str(doubled) == "Pipeline(Option, map, map)"
+
+    def test_pipeline_apply_all(self):
+        pipeline = Pipeline.of_either().map(lambda v: v * 2)
+        assert pipeline.apply_all([1, 2, 3]) == [Right(2), Right(4), Right(6)]
+
+    def test_pipeline_compile_is_cached(self):
+        pipeline = Pipeline.of_try().map(lambda v: v)
+        assert pipeline.compile() is pipeline.compile()
+
+    def test_pipeline_requires_callable_steps(self):
+        result = Try.of(lambda: Pipeline.of_option().map(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+        result = Try.of(lambda: Pipeline.of_option().filter(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
@@ -0,0 +1,73 @@
+from concurrent.futures import CancelledError, InvalidStateError
+from pyeffects.Future import CancellationToken, Dispatch
+from pyeffects.Promise import *
+from pyeffects.Try import Try
+from .random_int_generator import random_int
+import threading
+
+
+class TestPromise:
+    def test_promise_future_is_pending(self):
+        promise = Promise()
+        assert not promise.is_completed() and not promise.future.is_done()
+
+    def test_promise_success(self):
+        value = random_int()
+        promise = Promise()
+        promise.success(value)
+        assert promise.is_completed() and promise.future.get() == value
+
+    def test_promise_failure(self):
+        promise = Promise()
+        promise.failure(RuntimeError("Failed"))
+        assert promise.future.is_failure()
+        assert isinstance(promise.future.error(), RuntimeError)
+
+    def test_promise_complete(self):
+        value = random_int()
+        promise = Promise()
+        promise.complete(Success(value))
+        assert promise.future.result() == Success(value)
+
+    def test_promise_second_completion_raises(self):
+        value = random_int()
+        promise = Promise()
+        promise.success(value)
+        result = Try.of(lambda: promise.success(value + 1))
+        assert result.is_failure() and isinstance(result.error(), InvalidStateError)
+        assert promise.future.get() == value
+
+    def test_promise_try_complete(self):
+        value = random_int()
+        promise = Promise()
+        assert promise.try_complete(Success(value)) is True
+        assert promise.try_complete(Success(value + 1)) is False
+        assert promise.future.get() == value
+
+    def test_promise_try_complete_requires_try(self):
+        result = Try.of(lambda: Promise().try_complete(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_promise_notifies_subscribers(self):
+        value = random_int()
+        promise = Promise(Dispatch.INLINE)
+        mapped = promise.future.map(lambda v: v + 1)
+        promise.success(value)
+        assert mapped.get() == value + 1
+
+    def test_promise_completed_from_another_thread(self):
+        value = random_int()
+        promise = Promise()
+        threading.Thread(target=promise.success, args=[value]).start()
+        assert promise.future.result(1) == Success(value)
+
+    def test_promise_cancelled_by_token(self):
+        token = CancellationToken()
+        promise = Promise(token=token)
+        token.cancel()
+        assert promise.future.is_cancelled()
+        assert promise.try_complete(Success(random_int())) is False
+        assert isinstance(promise.future.error(), CancelledError)
+
+    def test_promise_repr(self):
+        assert str(Promise()).startswith("Promise")
@@ -0,0 +1,45 @@
+from pyeffects.Retry import *
+from pyeffects.Try import Try
+
+
+class TestRetry:
+    def test_next_delay_grows_exponentially(self):
+        policy = RetryPolicy(5, 0.5, 3.0, 2.0, Jitter.NONE)
+        assert [policy.next_delay(n) for n in range(1, 5)] == [0.5, 1.0, 2.0, 3.0]
+
+    def test_full_jitter_stays_below_backoff(self):
+        policy = RetryPolicy(5, 0.5, 10.0, 2.0, Jitter.FULL)
+        for attempt in range(1, 5):
+            delays = [policy.next_delay(attempt) for _ in range(100)]
+            assert all(0 <= d <= 0.5 * 2 ** (attempt - 1) for d in delays)
+
+    def test_decorrelated_jitter_depends_on_previous_delay(self):
+        policy = RetryPolicy(5, 0.5, 4.0, 2.0, Jitter.DECORRELATED)
+        delays = [policy.next_delay(2, 1.0) for _ in range(100)]
+        assert all(0.5 <= d <= 3.0 for d in delays)
+        assert all(d <= 4.0 for d in [policy.next_delay(2, 10.0) for _ in range(100)])
+
+    def test_should_retry_filters_exception_types(self):
+        policy = RetryPolicy(3, retry_on=[RuntimeError])
+        assert policy.should_retry(RuntimeError("Failed"), 1)
+        assert not policy.should_retry(ValueError("Failed"), 1)
+
+    def test_should_retry_stops_after_max_attempts(self):
+        policy = RetryPolicy(3)
+        assert policy.should_retry(RuntimeError("Failed"), 2)
+        assert not policy.should_retry(RuntimeError("Failed"), 3)
+
+    def test_policy_validates_arguments(self):
+        for kwargs in (
+            {"max_attempts": 0},
+            {"base_delay": -1},
+            {"base_delay": 2, "max_delay": 1},
+            {"multiplier": 0.5},
+            {"jitter": "full"},
+            {"retry_on": RuntimeError},
+        ):
+            result = Try.of(lambda: RetryPolicy(**kwargs))
+            assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_policy_repr(self):
+        assert str(RetryPolicy()).startswith("RetryPolicy")
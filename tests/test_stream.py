@@ -0,0 +1,192 @@
+from pyeffects.Future import Future
+from pyeffects.Stream import *
+from pyeffects.Try import Try
+from .random_int_generator import random_int
+import threading
+import time
+
+
+class ManualSubscriber(Subscriber):
+    def __init__(self):
+        self.values = []
+        self.error = None
+        self.completed = False
+
+    def on_subscribe(self, subscription):
+        self.subscription = subscription
+
+    def on_next(self, value):
+        self.values.append(value)
+
+    def on_error(self, err):
+        self.error = err
+
+    def on_complete(self):
+        self.completed = True
+
+
+class TestStream:
+    def test_of_to_list(self):
+        value = random_int()
+        assert Stream.of(value, value + 1).to_list().get() == [value, value + 1]
+
+    def test_empty_and_failed(self):
+        assert Stream.empty().to_list().get() == []
+        result = Stream.failed(RuntimeError("Failed")).to_list()
+        assert result.is_failure() and isinstance(result.error(), RuntimeError)
+
+    def test_stream_is_cold(self):
+        calls = []
+        stream = Stream.of(1, 2).map(lambda v: calls.append(v) or v)
+        assert calls == []
+        stream.to_list()
+        stream.to_list()
+        assert calls == [1, 2, 1, 2]
+
+    def test_map_and_filter(self):
+        result = Stream.from_iterable(range(10)).map(lambda v: v * v)
+        result = result.filter(lambda v: v % 2 == 0)
+        assert result.to_list().get() == [0, 4, 16, 36, 64]
+
+    def test_map_error_fails_stream(self):
+        def fail(v):
+            if v == 2:
+                raise RuntimeError("Failed")
+            return v
+
+        results = []
+        Stream.of(1, 2, 3).map(fail).subscribe(results.append)
+        assert results[0] == Success(1) and len(results) == 2
+        assert isinstance(results[1].error(), RuntimeError)
+
+    def test_flat_map_concatenates_in_order(self):
+        stream = Stream.of(1, 2, 3).flat_map(lambda v: Stream.of(v, v * 10))
+        assert stream.to_list().get() == [1, 10, 2, 20, 3, 30]
+
+    def test_flat_map_requires_stream(self):
+        result = Stream.of(1).flat_map(lambda v: v).to_list()
+        assert isinstance(result.error(), TypeError)
+
+    def test_flat_map_over_futures(self):
+        stream = Stream.of(1, 2).flat_map(
+            lambda v: Stream.from_futures([Future.run(lambda: v * 2)])
+        )
+        assert stream.to_list().result(1) == Success([2, 4])
+
+    def test_buffer(self):
+        stream = Stream.from_iterable(range(7)).buffer(3)
+        assert stream.to_list().get() == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_buffer_requests_whole_buffers(self):
+        pulled = []
+        source = Stream.from_iterable(range(100)).map(lambda v: pulled.append(v) or v)
+        subscriber = ManualSubscriber()
+        source.buffer(4).subscribe(subscriber)
+        subscriber.subscription.request(2)
+        assert subscriber.values == [[0, 1, 2, 3], [4, 5, 6, 7]] and len(pulled) == 8
+
+    def test_window_groups_by_time(self):
+        def slow():
+            for i in range(6):
+                yield i
+                time.sleep(0.03 if i == 2 else 0)
+
+        windows = Stream.from_iterable(slow()).window(0.01).to_list().result(1).get()
+        assert [v for w in windows for v in w] == list(range(6))
+        assert windows[0] == [0, 1, 2] and len(windows) >= 2
+
+    def test_window_splits_elements_arriving_apart(self):
+        futures = [Future.delay(0.0, 1), Future.delay(0.1, 2)]
+        windows = Stream.from_futures(futures).window(0.02).to_list().result(1).get()
+        assert windows == [[1], [2]]
+
+    def test_merge_interleaves_all_sources(self):
+        stream = Stream.of(1, 2, 3).merge(Stream.of(4, 5), Stream.empty())
+        assert sorted(stream.to_list().get()) == [1, 2, 3, 4, 5]
+
+    def test_merge_fails_with_first_failure(self):
+        stream = Stream.of(1).merge(Stream.failed(RuntimeError("Failed")))
+        assert isinstance(stream.to_list().error(), RuntimeError)
+
+    def test_merge_bounds_prefetch(self):
+        pulled = []
+        source = Stream.from_iterable(range(1000)).map(lambda v: pulled.append(v) or v)
+        subscriber = ManualSubscriber()
+        source.merge(Stream.empty()).subscribe(subscriber)
+        subscriber.subscription.request(1)
+        assert subscriber.values == [0] and len(pulled) <= MERGE_PREFETCH + 1
+
+    def test_from_futures_in_completion_order(self):
+        slow = Future.delay(0.05, "slow")
+        fast = Future.delay(0.01, "fast")
+        stream = Stream.from_futures([slow, fast])
+        assert stream.to_list().result(1) == Success(["fast", "slow"])
+
+    def test_from_futures_fails_with_failed_future(self):
+        failed = Future.run(lambda: 1 / 0)
+        result = Stream.from_futures([Future.of(1), failed]).to_list().result(1)
+        assert isinstance(result.error(), ZeroDivisionError)
+
+    def test_backpressure_only_pulls_requested_elements(self):
+        pulled = []
+
+        def source():
+            for i in range(1000):
+                pulled.append(i)
+                yield i
+
+        subscriber = ManualSubscriber()
+        Stream.from_iterable(source()).filter(lambda v: v % 2).subscribe(subscriber)
+        subscriber.subscription.request(3)
+        assert subscriber.values == [1, 3, 5] and len(pulled) == 6
+        assert not subscriber.completed
+
+    def test_cancel_stops_stream(self):
+        subscriber = ManualSubscriber()
+        Stream.from_iterable(range(10)).subscribe(subscriber)
+        subscriber.subscription.request(2)
+        subscriber.subscription.cancel()
+        subscriber.subscription.request(2)
+        assert subscriber.values == [0, 1] and not subscriber.completed
+
+    def test_requesting_one_at_a_time_does_not_grow_the_stack(self):
+        class OneByOne(ManualSubscriber):
+            def on_subscribe(self, subscription):
+                self.subscription = subscription
+                subscription.request(1)
+
+            def on_next(self, value):
+                self.values.append(value)
+                self.subscription.request(1)
+
+        subscriber = OneByOne()
+        Stream.from_iterable(range(100000)).map(lambda v: v).subscribe(subscriber)
+        assert len(subscriber.values) == 100000 and subscriber.completed
+
+    def test_subscribe_with_batch_size(self):
+        results = []
+        done = []
+        Stream.of(1, 2, 3).subscribe(results.append, lambda: done.append(1), 2)
+        assert results == [Success(1), Success(2), Success(3)] and done == [1]
+
+    def test_emits_from_many_threads_are_serialized(self):
+        futures = [Future.run(lambda i=i: i) for i in range(200)]
+        assert sorted(Stream.from_futures(futures).to_list().result(1).get()) == list(
+            range(200)
+        )
+
+    def test_operators_validate_arguments(self):
+        for make in (
+            lambda: Stream.of(1).map(random_int()),
+            lambda: Stream.of(1).filter(random_int()),
+            lambda: Stream.of(1).flat_map(random_int()),
+            lambda: Stream.of(1).buffer(0),
+            lambda: Stream.of(1).window(0),
+            lambda: Stream.of(1).merge(random_int()),
+            lambda: Stream.of(1).subscribe(random_int()),
+        ):
+            result = Try.of(make)
+            assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_stream_repr(self):
+        assert str(Stream.of(1)).startswith("Stream")
@@ -0,0 +1,84 @@
+from pyeffects.Timer import *
+from pyeffects.Try import Try
+import threading
+import time
+
+
+class TestTimer:
+    def test_schedule_runs_task_after_delay(self):
+        done = threading.Event()
+        start = time.monotonic()
+        Timer().schedule(0.05, done.set)
+        assert done.wait(1) and time.monotonic() - start >= 0.05
+
+    def test_tasks_run_in_deadline_order(self):
+        timer = Timer()
+        order = []
+        done = threading.Event()
+        timer.schedule(0.06, lambda: (order.append(3), done.set()))
+        timer.schedule(0.02, lambda: order.append(1))
+        timer.schedule(0.04, lambda: order.append(2))
+        assert done.wait(1) and order == [1, 2, 3]
+
+    def test_cancelled_task_does_not_run(self):
+        timer = Timer()
+        ran = []
+        done = threading.Event()
+        handle = timer.schedule(0.02, lambda: ran.append(1))
+        timer.schedule(0.04, done.set)
+        handle.cancel()
+        assert done.wait(1) and ran == [] and handle.is_cancelled()
+
+    def test_failing_task_does_not_stop_timer(self):
+        timer = Timer()
+        done = threading.Event()
+        timer.schedule(0.01, lambda: 1 / 0)
+        timer.schedule(0.02, done.set)
+        assert done.wait(1)
+
+    def test_one_thread_for_many_timers(self):
+        timer = Timer()
+        before = threading.active_count()
+        done = threading.Event()
+        for i in range(1000):
+            timer.schedule(0.01, done.set)
+        assert done.wait(1) and threading.active_count() <= before + 1
+
+    def test_default_timer_is_shared(self):
+        assert Timer.default() is Timer.default()
+
+    def test_schedule_requires_callable(self):
+        result = Try.of(lambda: Timer().schedule(0.01, 5))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_cancel_removes_task_from_wheel(self):
+        timer = Timer()
+        handles = [timer.schedule(10, lambda: None) for _ in range(100)]
+        assert timer.pending() == 100
+        for handle in handles:
+            handle.cancel()
+        assert timer.pending() == 0
+
+    def test_task_beyond_one_rotation_waits_for_its_round(self):
+        timer = Timer(resolution=0.005, wheel_size=4)
+        done = threading.Event()
+        start = time.monotonic()
+        timer.schedule(0.1, done.set)
+        assert done.wait(1) and time.monotonic() - start >= 0.1
+
+    def test_timer_resumes_after_idle(self):
+        timer = Timer()
+        first = threading.Event()
+        timer.schedule(0.01, first.set)
+        assert first.wait(1)
+        time.sleep(0.05)
+        second = threading.Event()
+        start = time.monotonic()
+        timer.schedule(0.02, second.set)
+        assert second.wait(1) and time.monotonic() - start >= 0.02
+
+    def test_timer_validates_arguments(self):
+        result = Try.of(lambda: Timer(resolution=0))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+        result = Try.of(lambda: Timer(wheel_size=0))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
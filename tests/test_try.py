@@ -1,3 +1,4 @@
+from pyeffects.Retry import RetryPolicy
 from pyeffects.Try import *
 from pyeffects.Monad import identity
 from .random_int_generator import random_int
@@ -121,3 +122,69 @@ class TestOption:
     def test_try_type_inequality(self):
         value = random_int()
         assert Success(value) != Failure(value)
+
+    def test_retry_returns_first_success(self):
+        value = random_int()
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("Failed")
+            return value
+
+        assert Try.retry(flaky, RetryPolicy(3, 0.001)) == Success(value)
+        assert len(calls) == 3
+
+    def test_retry_returns_last_failure(self):
+        calls = []
+
+        def failing():
+            calls.append(1)
+            raise RuntimeError("Failed %d" % len(calls))
+
+        result = Try.retry(failing, RetryPolicy(3, 0.001))
+        assert result.is_failure() and str(result.error()) == "Failed 3"
+
+    def test_retry_only_retries_listed_errors(self):
+        calls = []
+
+        def failing():
+            calls.append(1)
+            raise ValueError("Failed")
+
+        result = Try.retry(failing, RetryPolicy(3, 0.001, retry_on=[RuntimeError]))
+        assert result.is_failure() and len(calls) == 1
+
+    def test_retry_requires_callable_and_policy(self):
+        result = Try.of(lambda: Try.retry(random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+        result = Try.of(lambda: Try.retry(lambda: 5, random_int()))
+        assert result.is_failure() and isinstance(result.error(), TypeError)
+
+    def test_try_instances_have_no_dict(self):
+        assert not hasattr(Success(random_int()), "__dict__")
+        assert not hasattr(Failure(RuntimeError()), "__dict__")
+
+    def test_try_of_none_is_interned(self):
+        assert Try.of(lambda: None) is success_none and success_none == Success(None)
+
+    def test_try_map(self):
+        value = random_int()
+        error = RuntimeError()
+        assert Success(value).map(lambda v: v + 1) == Success(value + 1)
+        assert Failure(error).map(lambda v: v + 1) == Failure(error)
+
+    def test_try_filter(self):
+        value = random_int()
+        assert Success(value).filter(lambda v: v == value) == Success(value)
+        result = Success(value).filter(lambda v: v != value)
+        assert result.is_failure() and isinstance(result.error(), ValueError)
+
+    def test_try_filter_captures_predicate_errors(self):
+        error = RuntimeError()
+
+        def predicate(v):
+            raise error
+
+        assert Success(random_int()).filter(predicate).error() is error